@@ -12,19 +12,23 @@ Requirements:
     - 6.5: 構造化ロギングフォーマットを使用
 """
 
+import functools
 import logging
 import os
 import sys
 import traceback
 import uuid
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 
+import orjson
 import structlog
-from flask import Flask, jsonify, request, Response
+from flask import Flask, g, jsonify, request, Response
+from flask.json.provider import DefaultJSONProvider, JSONProvider
 
 from .config import Config
-from .models import CallLog
+from .models import CallLog, uuid7
 from .ncco_builder import NCCOBuilder
 from .recording_manager import RecordingManager
 from .storage import SQLiteStorage, Storage
@@ -81,11 +85,14 @@ def configure_structlog(log_level: str = "INFO") -> None:
         - 6.5: 構造化ロギングフォーマットを使用
     """
     # 標準ライブラリの logging を設定
+    level = getattr(logging, log_level.upper(), logging.INFO)
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper(), logging.INFO),
+        level=level,
     )
+    # basicConfig はルートロガーにハンドラが設定済みだと何もしないため、レベルは明示的に設定する
+    logging.getLogger().setLevel(level)
     
     # structlog のプロセッサチェーンを設定
     structlog.configure(
@@ -127,13 +134,49 @@ def get_logger(name: str = __name__) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
 
-def validate_json_request(data: Any, required_fields: Optional[list] = None) -> Tuple[bool, Optional[str]]:
+class OrjsonProvider(JSONProvider):
+    """
+    orjson を使用する Flask の JSON プロバイダー
+    
+    jsonify のレスポンス本文を str を経由せずに bytes のまま生成し、
+    request.get_json のデコードも orjson で行います。
+    datetime など orjson が標準と異なる形式で出力する型は、
+    Flask 標準のプロバイダーと同じ変換を使用します。
+    """
+    
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self._encode(obj).decode("utf-8")
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._encode(obj), mimetype="application/json")
+    
+    def _encode(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=self._OPTIONS)
+
+
+# validate_json_request が返す固定の結果
+_VALID_RESULT: Tuple[bool, Optional[str]] = (True, None)
+_EMPTY_BODY_RESULT: Tuple[bool, Optional[str]] = (False, "Invalid JSON: request body is empty or malformed")
+_NOT_OBJECT_RESULT: Tuple[bool, Optional[str]] = (False, "Invalid JSON: request body must be a JSON object")
+
+
+def validate_json_request(
+    data: Any,
+    required_fields: Optional[Iterable[str]] = None
+) -> Tuple[bool, Optional[str]]:
     """
     JSON リクエストを検証
     
     Args:
         data: 検証するデータ
-        required_fields: 必須フィールドのリスト（オプション）
+        required_fields: 必須フィールド（リストや frozenset、オプション）。
+            値が None のフィールドも欠落として扱う
     
     Returns:
         (検証結果, エラーメッセージ) のタプル
@@ -141,18 +184,23 @@ def validate_json_request(data: Any, required_fields: Optional[list] = None) ->
     Requirements:
         - 1.4: 不正な Webhook リクエストに対して適切な HTTP エラーステータスコードを返す
     """
+    # Webhook から必須フィールドなしで呼ばれる通常ケースを先に判定する
+    if type(data) is dict and not required_fields:
+        return _VALID_RESULT
+    
     if data is None:
-        return False, "Invalid JSON: request body is empty or malformed"
+        return _EMPTY_BODY_RESULT
     
     if not isinstance(data, dict):
-        return False, "Invalid JSON: request body must be a JSON object"
+        return _NOT_OBJECT_RESULT
     
     if required_fields:
-        missing_fields = [field for field in required_fields if field not in data or data[field] is None]
+        # キーの有無と None 値を dict.get の1回の参照で判定する
+        missing_fields = [field for field in required_fields if data.get(field) is None]
         if missing_fields:
             return False, f"Missing required fields: {', '.join(missing_fields)}"
     
-    return True, None
+    return _VALID_RESULT
 
 
 def create_error_response(
@@ -176,15 +224,67 @@ def create_error_response(
     Requirements:
         - 1.4: 不正な Webhook リクエストに対して適切な HTTP エラーステータスコードを返す
     """
-    response_body = {
+    if details:
+        body = orjson.dumps({
+            "error": error_type,
+            "message": message,
+            "status_code": status_code,
+            "details": details
+        })
+    else:
+        body = _error_body(error_type, message, status_code)
+    
+    return Response(body, status=status_code, mimetype="application/json"), status_code
+
+
+@functools.lru_cache(maxsize=128)
+def _error_body(error_type: str, message: str, status_code: int) -> bytes:
+    """
+    詳細情報なしのエラーレスポンス本文をシリアライズ
+    
+    エラーハンドラーが返す本文は種類・メッセージ・ステータスの組が限られるため、
+    組ごとにシリアライズ結果を再利用します。
+    
+    Args:
+        error_type: エラーの種類
+        message: エラーメッセージ
+        status_code: HTTP ステータスコード
+    
+    Returns:
+        JSON にシリアライズした本文
+    """
+    return orjson.dumps({
         "error": error_type,
         "message": message,
         "status_code": status_code
-    }
-    if details:
-        response_body["details"] = details
+    })
+
+
+def _load_json_body() -> Any:
+    """
+    リクエストボディを orjson で直接デコード
     
-    return jsonify(response_body), status_code
+    Returns:
+        デコードされた JSON データ
+    
+    Raises:
+        orjson.JSONDecodeError: ボディが空または不正な JSON の場合
+    """
+    return orjson.loads(request.get_data(cache=False))
+
+
+_OK_RESPONSE_BODY = orjson.dumps({"status": "ok"})
+
+# 通話の終了を表すイベントステータス
+_TERMINAL_CALL_STATUSES = frozenset({
+    "completed", "failed", "rejected", "busy", "cancelled", "timeout", "unanswered"
+})
+
+# 受け付けるリクエストボディの最大サイズ（Webhook の JSON はこれより十分小さい）
+MAX_CONTENT_LENGTH = 64 * 1024
+
+# リクエストボディを before_request で一度だけデコードするエンドポイント
+_JSON_BODY_ENDPOINTS = frozenset({"recording_webhook", "event_webhook", "udio_webhook"})
 
 
 class WebhookHandler:
@@ -254,6 +354,62 @@ class WebhookHandler:
             - 1.5: 通話詳細をログ出力
             - 2.1: 着信時に音声アナウンスを再生
         """
+        call_uuid = self._save_incoming_call(params)
+        
+        # NCCO を生成 (Requirements 1.1, 2.1)
+        ncco = self.ncco_builder.build_voicemail_ncco(call_uuid)
+        
+        self.logger.info(
+            "ncco_generated",
+            call_uuid=call_uuid,
+            ncco_actions=len(ncco)
+        )
+        
+        return ncco
+    
+    def handle_answer_json(self, params: Dict[str, Any]) -> bytes:
+        """
+        着信電話の Answer Webhook を処理し、NCCO を JSON バイト列で返却
+        
+        handle_answer と同じく通話ログを保存しますが、NCCO は
+        NCCOBuilder がキャッシュしたエンコード済みのバイト列を返します。
+        
+        Args:
+            params: Vonage から送信されるパラメータ
+        
+        Returns:
+            JSON エンコード済みの NCCO
+        
+        Requirements:
+            - 1.1: 着信電話を受け付け、有効な NCCO で応答
+            - 1.5: 通話詳細をログ出力
+        """
+        call_uuid = self._save_incoming_call(params)
+        
+        ncco_json = self.ncco_builder.build_voicemail_ncco_json(call_uuid)
+        
+        self.logger.info(
+            "ncco_generated",
+            call_uuid=call_uuid,
+            ncco_bytes=len(ncco_json)
+        )
+        
+        return ncco_json
+    
+    def _save_incoming_call(self, params: Dict[str, Any]) -> str:
+        """
+        着信電話の通話詳細をログ出力し、通話ログを保存
+        
+        Args:
+            params: Vonage から送信されるパラメータ
+        
+        Returns:
+            通話 UUID
+        
+        Requirements:
+            - 1.2: 発信者番号と通話 UUID を抽出
+            - 1.5: 通話詳細をログ出力
+        """
         # 通話パラメータを抽出 (Requirements 1.2)
         call_uuid = params.get("uuid", "")
         caller_number = params.get("from", "")
@@ -274,7 +430,7 @@ class WebhookHandler:
         # 通話ログを保存 (Requirements 1.5)
         # conversation_uuidをcall_uuidとして保存（Recording Webhookで検索するため）
         call_log = CallLog(
-            id=str(uuid.uuid4()),
+            id=str(uuid7()),
             call_uuid=conversation_uuid,  # conversation_uuidを使用
             caller_number=caller_number,
             called_number=called_number,
@@ -295,16 +451,7 @@ class WebhookHandler:
             called_number=called_number
         )
         
-        # NCCO を生成 (Requirements 1.1, 2.1)
-        ncco = self.ncco_builder.build_voicemail_ncco(call_uuid)
-        
-        self.logger.info(
-            "ncco_generated",
-            call_uuid=call_uuid,
-            ncco_actions=len(ncco)
-        )
-        
-        return ncco
+        return call_uuid
     
     def handle_recording(self, data: Dict[str, Any]) -> None:
         """
@@ -364,8 +511,15 @@ class WebhookHandler:
             timestamp = datetime.utcnow()
         
         # RecordingMetadata を作成
+        # Webhook が再送されても同じ録音IDになるよう、Vonage の録音UUIDから導出する
+        # （保存済みの録音ファイルを再ダウンロードせずに済む）
+        recording_id = (
+            str(uuid.uuid5(uuid.NAMESPACE_URL, recording_uuid_value))
+            if recording_uuid_value
+            else str(uuid7())
+        )
         metadata = RecordingMetadata(
-            id=str(uuid.uuid4()),
+            id=recording_id,
             call_uuid=call_uuid,
             caller_number="",  # Webhook には発信者番号が含まれない場合がある
             recording_url=recording_url,
@@ -375,30 +529,24 @@ class WebhookHandler:
         )
         
         # 録音メタデータを保存 (Requirements 3.4, 4.1)
-        self.recording_manager.save_recording(
+        # 音声ファイルのダウンロードはバックグラウンドで行われる
+        download = self.recording_manager.save_recording(
             metadata=metadata,
             conversation_uuid=conversation_uuid,
             recording_uuid=recording_uuid_value,
             file_size=int(file_size) if file_size else 0
         )
         
-        # ローカルファイルパスを取得
-        local_file_path = os.path.join(
-            self.recording_manager.recordings_dir,
-            f"{metadata.id}.mp3"
-        )
-        
         self.logger.info(
             "recording_metadata_saved",
             recording_id=metadata.id,
             call_uuid=call_uuid,
             recording_url=recording_url,
             duration=duration,
-            local_file_path=local_file_path,
-            file_exists=os.path.exists(local_file_path)
+            download_scheduled=download is not None
         )
         
-        # 音楽生成が有効な場合、バックグラウンドで処理を開始
+        # 音楽生成が有効な場合、ダウンロード完了後にバックグラウンドで処理を開始
         if self.music_generator:
             # 通話ログから発信者番号を取得
             call_log = self.storage.get_call_log(call_uuid)
@@ -408,34 +556,22 @@ class WebhookHandler:
                 "music_generation_check",
                 recording_id=metadata.id,
                 caller_number=caller_number,
-                local_file_path=local_file_path,
-                file_exists=os.path.exists(local_file_path),
+                download_scheduled=download is not None,
                 has_caller_number=bool(caller_number)
             )
             
-            # ファイルが存在し、発信者番号がある場合のみ処理
-            if os.path.exists(local_file_path) and caller_number:
-                self.logger.info(
-                    "starting_music_generation",
-                    recording_id=metadata.id,
-                    caller_number=caller_number,
-                    local_file_path=local_file_path
-                )
-                
-                # 別スレッドで音楽生成を実行（Webhookレスポンスをブロックしないため）
-                import threading
-                thread = threading.Thread(
-                    target=self._process_music_generation,
-                    args=(local_file_path, caller_number, metadata.id)
+            # ダウンロード対象があり、発信者番号がある場合のみ処理
+            if download is not None and caller_number:
+                download.add_done_callback(
+                    lambda future: self._start_music_generation(
+                        future, caller_number, metadata.id
+                    )
                 )
-                thread.daemon = True
-                thread.start()
             else:
-                if not os.path.exists(local_file_path):
+                if download is None:
                     self.logger.warning(
                         "music_generation_skipped_no_file",
-                        recording_id=metadata.id,
-                        local_file_path=local_file_path
+                        recording_id=metadata.id
                     )
                 if not caller_number:
                     self.logger.warning(
@@ -449,6 +585,54 @@ class WebhookHandler:
                 recording_id=metadata.id
             )
     
+    def _start_music_generation(
+        self,
+        download: "Future[Optional[str]]",
+        caller_number: str,
+        recording_id: str
+    ) -> None:
+        """
+        録音ファイルのダウンロード完了時に音楽生成スレッドを開始
+        
+        Args:
+            download: 録音ファイルのダウンロードのFuture
+            caller_number: 発信者の電話番号
+            recording_id: 録音ID
+        """
+        try:
+            local_file_path = download.result()
+        except Exception as e:
+            self.logger.error(
+                "recording_download_failed",
+                recording_id=recording_id,
+                error=str(e)
+            )
+            return
+        
+        if local_file_path is None or not os.path.exists(local_file_path):
+            self.logger.warning(
+                "music_generation_skipped_no_file",
+                recording_id=recording_id,
+                local_file_path=local_file_path
+            )
+            return
+        
+        self.logger.info(
+            "starting_music_generation",
+            recording_id=recording_id,
+            caller_number=caller_number,
+            local_file_path=local_file_path
+        )
+        
+        # 別スレッドで音楽生成を実行（ダウンロード用スレッドを長時間占有しないため）
+        import threading
+        thread = threading.Thread(
+            target=self._process_music_generation,
+            args=(local_file_path, caller_number, recording_id)
+        )
+        thread.daemon = True
+        thread.start()
+    
     def _process_music_generation(
         self,
         audio_file_path: str,
@@ -526,18 +710,16 @@ class WebhookHandler:
             timestamp=timestamp_str
         )
         
-        # タイムスタンプを解析
-        try:
-            if timestamp_str:
-                event_timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            else:
-                event_timestamp = datetime.utcnow()
-        except (ValueError, AttributeError):
-            event_timestamp = datetime.utcnow()
-        
-        # 通話終了ステータスの場合、ended_at を設定
-        terminal_statuses = ["completed", "failed", "rejected", "busy", "cancelled", "timeout", "unanswered"]
-        ended_at = event_timestamp if status in terminal_statuses else None
+        # 通話終了ステータスの場合のみタイムスタンプを解析し、ended_at を設定
+        ended_at = None
+        if status in _TERMINAL_CALL_STATUSES:
+            try:
+                if timestamp_str:
+                    ended_at = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+                else:
+                    ended_at = datetime.utcnow()
+            except (ValueError, AttributeError):
+                ended_at = datetime.utcnow()
         
         # 通話ログのステータスを更新
         if call_uuid:
@@ -574,7 +756,7 @@ class WebhookHandler:
             )
 
 
-def create_app(config: Optional[Config] = None) -> Flask:
+def create_app(config: Optional[Config] = None, storage: Optional[Storage] = None) -> Flask:
     """
     Flask アプリケーションを作成
     
@@ -583,6 +765,7 @@ def create_app(config: Optional[Config] = None) -> Flask:
     
     Args:
         config: アプリケーション設定（None の場合は環境変数から読み込み）
+        storage: 使用するストレージ（None の場合は既定の SQLiteStorage を作成）
     
     Returns:
         設定済みの Flask アプリケーション
@@ -596,6 +779,9 @@ def create_app(config: Optional[Config] = None) -> Flask:
     """
     # Flask アプリケーションインスタンスを作成
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    # 過大なボディは読み込む前に 413 で拒否する
+    app.config["MAX_CONTENT_LENGTH"] = MAX_CONTENT_LENGTH
     
     # 設定を読み込み（テスト時は外部から注入可能）
     if config is None:
@@ -615,8 +801,9 @@ def create_app(config: Optional[Config] = None) -> Flask:
         webhook_base_url=config.webhook_base_url
     )
     
-    # ストレージレイヤーを初期化
-    storage = SQLiteStorage()
+    # ストレージレイヤーを初期化（テスト時は外部から注入可能）
+    if storage is None:
+        storage = SQLiteStorage()
     app.config["STORAGE"] = storage
     
     # NCCO Builder を初期化
@@ -641,7 +828,8 @@ def create_app(config: Optional[Config] = None) -> Flask:
                 udio_api_key=config.udio_api_key,
                 vonage_api_key=config.vonage_api_key,
                 vonage_api_secret=config.vonage_api_secret,
-                vonage_from_number=config.vonage_sms_from
+                vonage_from_number=config.vonage_sms_from,
+                callback_url=f"{config.webhook_base_url.rstrip('/')}/webhooks/udio"
             )
             logger.info(
                 "music_generator_initialized",
@@ -663,6 +851,23 @@ def create_app(config: Optional[Config] = None) -> Flask:
     )
     app.config["WEBHOOK_HANDLER"] = webhook_handler
     
+    @app.before_request
+    def parse_json_body():
+        """
+        JSON を受け取る Webhook のボディを一度だけデコードし g に保持
+        
+        デコード結果は g.json、失敗時の例外は g.json_error に格納します。
+        """
+        if request.method != "POST" or request.endpoint not in _JSON_BODY_ENDPOINTS:
+            return None
+        g.json = None
+        g.json_error = None
+        try:
+            g.json = _load_json_body()
+        except orjson.JSONDecodeError as exc:
+            g.json_error = exc
+        return None
+    
     # ==========================================================================
     # エラーハンドラー (Error Handlers)
     # Requirements: 1.4, 6.2, 6.4
@@ -742,6 +947,29 @@ def create_app(config: Optional[Config] = None) -> Flask:
             status_code=405
         )
     
+    @app.errorhandler(413)
+    def handle_request_entity_too_large(error):
+        """
+        413 Request Entity Too Large エラーハンドラー
+        
+        MAX_CONTENT_LENGTH を超えるリクエストボディを処理します。
+        
+        Requirements:
+            - 1.4: 不正な Webhook リクエストに対して適切な HTTP エラーステータスコードを返す
+        """
+        logger.warning(
+            "request_entity_too_large_error",
+            error_type="request_entity_too_large",
+            path=request.path,
+            method=request.method,
+            content_length=request.content_length
+        )
+        return create_error_response(
+            error_type="request_entity_too_large",
+            message=str(error.description) if hasattr(error, 'description') else "Request Entity Too Large",
+            status_code=413
+        )
+    
     @app.errorhandler(500)
     def handle_internal_error(error):
         """
@@ -907,16 +1135,16 @@ def create_app(config: Optional[Config] = None) -> Flask:
                 "conversation_uuid": request.args.get("conversation_uuid", "")
             }
             
-            # WebhookHandler で処理
-            ncco = webhook_handler.handle_answer(params)
+            # WebhookHandler で処理（エンコード済みの NCCO を取得）
+            ncco_json = webhook_handler.handle_answer_json(params)
             
             logger.info(
                 "answer_webhook_response",
                 call_uuid=params["uuid"],
-                ncco_actions=len(ncco)
+                ncco_bytes=len(ncco_json)
             )
             
-            return jsonify(ncco), 200
+            return Response(ncco_json, status=200, mimetype="application/json")
             
         except WebhookValidationError:
             # WebhookValidationError は専用ハンドラーで処理
@@ -970,16 +1198,15 @@ def create_app(config: Optional[Config] = None) -> Flask:
             )
             
             # JSON データを取得し検証 (Requirements 1.4)
-            try:
-                data = request.get_json(force=True, silent=False)
-            except Exception as json_error:
+            data = g.json
+            if g.json_error is not None:
                 logger.error(
                     "invalid_json_error",
                     error_type="invalid_json",
-                    error_message=str(json_error),
+                    error_message=str(g.json_error),
                     path=request.path,
                     content_type=request.content_type,
-                    exc_info=True
+                    exc_info=g.json_error
                 )
                 raise WebhookValidationError(
                     message="Invalid JSON: request body is malformed",
@@ -1012,7 +1239,7 @@ def create_app(config: Optional[Config] = None) -> Flask:
                 conversation_uuid=data.get("conversation_uuid", "")
             )
             
-            return jsonify({"status": "ok"}), 200
+            return Response(_OK_RESPONSE_BODY, status=200, mimetype="application/json")
             
         except WebhookValidationError:
             # WebhookValidationError は専用ハンドラーで処理
@@ -1065,16 +1292,15 @@ def create_app(config: Optional[Config] = None) -> Flask:
                 data = dict(request.args)
             else:
                 # JSON データを取得し検証 (Requirements 1.4)
-                try:
-                    data = request.get_json(force=True, silent=False)
-                except Exception as json_error:
+                data = g.json
+                if g.json_error is not None:
                     logger.error(
                         "invalid_json_error",
                         error_type="invalid_json",
-                        error_message=str(json_error),
+                        error_message=str(g.json_error),
                         path=request.path,
                         content_type=request.content_type,
-                        exc_info=True
+                        exc_info=g.json_error
                     )
                     raise WebhookValidationError(
                         message="Invalid JSON: request body is malformed",
@@ -1107,7 +1333,7 @@ def create_app(config: Optional[Config] = None) -> Flask:
                 status=data.get("status", "")
             )
             
-            return jsonify({"status": "ok"}), 200
+            return Response(_OK_RESPONSE_BODY, status=200, mimetype="application/json")
             
         except WebhookValidationError:
             # WebhookValidationError は専用ハンドラーで処理
@@ -1126,6 +1352,48 @@ def create_app(config: Optional[Config] = None) -> Flask:
             )
             raise
     
-    logger.info("application_ready", endpoints=["/health", "/webhooks/answer", "/webhooks/recording", "/webhooks/event"])
+    # Udio 完了通知 Webhook エンドポイント
+    @app.route("/webhooks/udio", methods=["POST"])
+    def udio_webhook():
+        """
+        Udio 完了通知 Webhook エンドポイント
+        
+        Udio から音楽生成完了の通知を受け取り、待機中の処理を起こします。
+        通知内容は信用せず、待機側でステータス API を確認します。
+        
+        Request Body (JSON):
+            - workId / work_id: 音楽生成タスク ID
+        
+        Returns:
+            JSON レスポンス: {"status": "ok"}
+        """
+        data = g.json
+        if not isinstance(data, dict):
+            raise WebhookValidationError(
+                message="Invalid JSON: request body must be a JSON object",
+                error_type="invalid_json"
+            )
+        
+        nested = data.get("data")
+        work_id = (
+            data.get("workId")
+            or data.get("work_id")
+            or (nested.get("task_id") if isinstance(nested, dict) else None)
+        )
+        
+        if not work_id:
+            raise WebhookValidationError(
+                message="Missing required fields: workId",
+                error_type="missing_fields"
+            )
+        
+        if music_generator is not None:
+            music_generator.notify_music_complete(work_id)
+        else:
+            logger.warning("udio_webhook_ignored", work_id=work_id, reason="music generation disabled")
+        
+        return Response(_OK_RESPONSE_BODY, status=200, mimetype="application/json")
+    
+    logger.info("application_ready", endpoints=["/health", "/webhooks/answer", "/webhooks/recording", "/webhooks/event", "/webhooks/udio"])
     
     return app
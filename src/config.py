@@ -4,22 +4,66 @@
 環境変数からアプリケーション設定を読み込み、検証を行います。
 """
 
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass
+from typing import ClassVar, Dict, Optional, Tuple
+import functools
 import os
 
+from .models import DATACLASS_SLOTS
+
+
+# from_env が参照する環境変数（この値の組をキーに読み込み結果をキャッシュする）
+_ENV_KEYS: Tuple[str, ...] = (
+    "VONAGE_API_KEY",
+    "VONAGE_API_SECRET",
+    "VONAGE_APPLICATION_ID",
+    "VONAGE_PRIVATE_KEY_PATH",
+    "WEBHOOK_BASE_URL",
+    "GREETING_MESSAGE",
+    "GREETING_LANGUAGE",
+    "GREETING_STYLE",
+    "MAX_RECORDING_DURATION",
+    "RECORDING_FORMAT",
+    "END_ON_SILENCE",
+    "LOG_LEVEL",
+    "ANSWER_URL",
+    "EVENT_URL",
+    "RECORDING_URL",
+    "OPENAI_API_KEY",
+    "UDIO_API_KEY",
+    "VONAGE_SMS_FROM",
+    "MUSIC_STYLE",
+    "ENABLE_MUSIC_GENERATION",
+)
+
+# 必須設定（環境変数名, 属性名）
+_REQUIRED_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("VONAGE_API_KEY", "vonage_api_key"),
+    ("VONAGE_API_SECRET", "vonage_api_secret"),
+    ("VONAGE_APPLICATION_ID", "vonage_application_id"),
+    ("VONAGE_PRIVATE_KEY_PATH", "vonage_private_key_path"),
+    ("WEBHOOK_BASE_URL", "webhook_base_url"),
+)
+
+# 有効な録音フォーマットとログレベル（判定は集合、エラーメッセージは定義順で表示）
+_VALID_RECORDING_FORMATS = ("mp3", "wav", "ogg")
+_VALID_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_RECORDING_FORMAT_SET = frozenset(_VALID_RECORDING_FORMATS)
+_LOG_LEVEL_SET = frozenset(_VALID_LOG_LEVELS)
+
 
 class ConfigurationError(Exception):
     """設定エラー例外クラス"""
     pass
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Config:
     """
     アプリケーション設定
     
     環境変数から設定を読み込み、必須設定のバリデーションを行います。
+    読み込んだ設定は共有されるため、イミュータブルです。
     """
     # Vonage API認証情報 (必須)
     vonage_api_key: str
@@ -54,17 +98,15 @@ class Config:
     enable_music_generation: bool
     
     # デフォルト値の定数
-    DEFAULT_GREETING_MESSAGE: str = field(
-        default="お電話ありがとうございます。ただいま電話に出ることができません。発信音の後にメッセージをお残しください。",
-        init=False,
-        repr=False
+    DEFAULT_GREETING_MESSAGE: ClassVar[str] = (
+        "お電話ありがとうございます。ただいま電話に出ることができません。発信音の後にメッセージをお残しください。"
     )
-    DEFAULT_GREETING_LANGUAGE: str = field(default="ja-JP", init=False, repr=False)
-    DEFAULT_GREETING_STYLE: int = field(default=0, init=False, repr=False)
-    DEFAULT_MAX_RECORDING_DURATION: int = field(default=60, init=False, repr=False)
-    DEFAULT_RECORDING_FORMAT: str = field(default="mp3", init=False, repr=False)
-    DEFAULT_END_ON_SILENCE: int = field(default=3, init=False, repr=False)
-    DEFAULT_LOG_LEVEL: str = field(default="INFO", init=False, repr=False)
+    DEFAULT_GREETING_LANGUAGE: ClassVar[str] = "ja-JP"
+    DEFAULT_GREETING_STYLE: ClassVar[int] = 0
+    DEFAULT_MAX_RECORDING_DURATION: ClassVar[int] = 60
+    DEFAULT_RECORDING_FORMAT: ClassVar[str] = "mp3"
+    DEFAULT_END_ON_SILENCE: ClassVar[int] = 3
+    DEFAULT_LOG_LEVEL: ClassVar[str] = "INFO"
     
     @classmethod
     def from_env(cls) -> 'Config':
@@ -93,31 +135,51 @@ class Config:
         Raises:
             ConfigurationError: 必須設定が欠落している場合
         """
+        # 参照する環境変数を1回の map でまとめて取得する（未設定は None）
+        return cls._from_env_values(tuple(map(os.environ.get, _ENV_KEYS)))
+    
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _from_env_values(cls, values: Tuple[Optional[str], ...]) -> 'Config':
+        """
+        環境変数の値の組から設定を作成（同じ値の組では作成済みの設定を再利用）
+        
+        Args:
+            values: _ENV_KEYS の順に並べた環境変数の値（未設定は None）
+        
+        Returns:
+            Config: 設定オブジェクト
+        
+        Raises:
+            ConfigurationError: 必須設定が欠落している場合
+        """
+        env: Dict[str, str] = {key: value for key, value in zip(_ENV_KEYS, values) if value is not None}
+        
         # デフォルト値
         default_greeting = "お電話ありがとうございます。ただいま電話に出ることができません。発信音の後にメッセージをお残しください。"
         
         # 必須設定の読み込み
-        vonage_api_key = os.environ.get("VONAGE_API_KEY", "")
-        vonage_api_secret = os.environ.get("VONAGE_API_SECRET", "")
-        vonage_application_id = os.environ.get("VONAGE_APPLICATION_ID", "")
-        vonage_private_key_path = os.environ.get("VONAGE_PRIVATE_KEY_PATH", "")
-        webhook_base_url = os.environ.get("WEBHOOK_BASE_URL", "")
+        vonage_api_key = env.get("VONAGE_API_KEY", "")
+        vonage_api_secret = env.get("VONAGE_API_SECRET", "")
+        vonage_application_id = env.get("VONAGE_APPLICATION_ID", "")
+        vonage_private_key_path = env.get("VONAGE_PRIVATE_KEY_PATH", "")
+        webhook_base_url = env.get("WEBHOOK_BASE_URL", "")
         
         # オプション設定の読み込み（デフォルト値付き）
-        greeting_message = os.environ.get("GREETING_MESSAGE", default_greeting)
-        greeting_language = os.environ.get("GREETING_LANGUAGE", "ja-JP")
-        greeting_style = int(os.environ.get("GREETING_STYLE", "0"))
+        greeting_message = env.get("GREETING_MESSAGE", default_greeting)
+        greeting_language = env.get("GREETING_LANGUAGE", "ja-JP")
+        greeting_style = int(env.get("GREETING_STYLE", "0"))
         
-        max_recording_duration = int(os.environ.get("MAX_RECORDING_DURATION", "60"))
-        recording_format = os.environ.get("RECORDING_FORMAT", "mp3")
-        end_on_silence = int(os.environ.get("END_ON_SILENCE", "3"))
+        max_recording_duration = int(env.get("MAX_RECORDING_DURATION", "60"))
+        recording_format = env.get("RECORDING_FORMAT", "mp3")
+        end_on_silence = int(env.get("END_ON_SILENCE", "3"))
         
-        log_level = os.environ.get("LOG_LEVEL", "INFO")
+        log_level = env.get("LOG_LEVEL", "INFO")
         
         # Webhook URLの構築
-        answer_url = os.environ.get("ANSWER_URL", "")
-        event_url = os.environ.get("EVENT_URL", "")
-        recording_url = os.environ.get("RECORDING_URL", "")
+        answer_url = env.get("ANSWER_URL", "")
+        event_url = env.get("EVENT_URL", "")
+        recording_url = env.get("RECORDING_URL", "")
         
         # ベースURLからWebhook URLを自動生成（個別指定がない場合）
         if webhook_base_url:
@@ -130,11 +192,11 @@ class Config:
                 recording_url = f"{base}/webhooks/recording"
         
         # 音楽生成設定の読み込み
-        openai_api_key = os.environ.get("OPENAI_API_KEY") or None
-        udio_api_key = os.environ.get("UDIO_API_KEY") or None
-        vonage_sms_from = os.environ.get("VONAGE_SMS_FROM") or None
-        music_style = os.environ.get("MUSIC_STYLE", "j-pop, emotional, heartfelt, japanese")
-        enable_music_generation = os.environ.get("ENABLE_MUSIC_GENERATION", "false").lower() == "true"
+        openai_api_key = env.get("OPENAI_API_KEY") or None
+        udio_api_key = env.get("UDIO_API_KEY") or None
+        vonage_sms_from = env.get("VONAGE_SMS_FROM") or None
+        music_style = env.get("MUSIC_STYLE", "j-pop, emotional, heartfelt, japanese")
+        enable_music_generation = env.get("ENABLE_MUSIC_GENERATION", "false").lower() == "true"
         
         config = cls(
             vonage_api_key=vonage_api_key,
@@ -174,21 +236,8 @@ class Config:
         Raises:
             ConfigurationError: 必須設定が欠落または無効な場合
         """
-        missing_fields = []
-        
-        # Vonage API認証情報の検証 (Requirements 5.2)
-        if not self.vonage_api_key:
-            missing_fields.append("VONAGE_API_KEY")
-        if not self.vonage_api_secret:
-            missing_fields.append("VONAGE_API_SECRET")
-        if not self.vonage_application_id:
-            missing_fields.append("VONAGE_APPLICATION_ID")
-        if not self.vonage_private_key_path:
-            missing_fields.append("VONAGE_PRIVATE_KEY_PATH")
-        
-        # Webhook URL の検証 (Requirements 5.5)
-        if not self.webhook_base_url:
-            missing_fields.append("WEBHOOK_BASE_URL")
+        # Vonage API認証情報 (Requirements 5.2) と Webhook URL (Requirements 5.5) の検証
+        missing_fields = [env_name for env_name, attr in _REQUIRED_FIELDS if not getattr(self, attr)]
         
         # 必須設定が欠落している場合はエラー (Requirements 5.6)
         if missing_fields:
@@ -215,15 +264,13 @@ class Config:
             )
         
         # 録音フォーマットの検証
-        valid_formats = ["mp3", "wav", "ogg"]
-        if self.recording_format.lower() not in valid_formats:
+        if self.recording_format.lower() not in _RECORDING_FORMAT_SET:
             raise ConfigurationError(
-                f"RECORDING_FORMAT は {valid_formats} のいずれかである必要があります: {self.recording_format}"
+                f"RECORDING_FORMAT は {list(_VALID_RECORDING_FORMATS)} のいずれかである必要があります: {self.recording_format}"
             )
         
         # ログレベルの検証
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.log_level.upper() not in valid_log_levels:
+        if self.log_level.upper() not in _LOG_LEVEL_SET:
             raise ConfigurationError(
-                f"LOG_LEVEL は {valid_log_levels} のいずれかである必要があります: {self.log_level}"
+                f"LOG_LEVEL は {list(_VALID_LOG_LEVELS)} のいずれかである必要があります: {self.log_level}"
             )
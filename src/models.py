@@ -4,12 +4,40 @@
 録音データと通話ログのデータモデルを定義します。
 """
 
+import os
+import sys
+import time
+import uuid
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 
-@dataclass
+# dataclass の slots オプションは Python 3.10 以降でのみ利用可能
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _uuid7() -> uuid.UUID:
+    """
+    時刻順に並ぶUUID (RFC 9562 のバージョン7) を生成
+    
+    先頭48ビットにミリ秒単位のUNIX時刻、残りに乱数を格納します。
+    
+    Returns:
+        UUIDバージョン7
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # バージョン
+    value = value & ~(0x3 << 62) | 0x2 << 62  # バリアント
+    return uuid.UUID(int=value)
+
+
+# 主キーなどに使う時刻順のUUID（新規行がインデックスの末尾に追加され、挿入の局所性が高まる）
+# Python 3.14 以降は標準ライブラリの実装を使用する
+uuid7 = getattr(uuid, "uuid7", _uuid7)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Recording:
     """
     録音データモデル
@@ -48,12 +76,13 @@ class Recording:
     updated_at: datetime
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class CallLog:
     """
     通話ログデータモデル
     
     着信電話の通話情報を格納します。
+    ストレージのキャッシュから同じインスタンスが返されるため、イミュータブルです。
     
     Attributes:
         id: 主キー (UUID)
@@ -5,13 +5,22 @@
 完成したらVonage SMS APIでURLを送信します。
 """
 
+import asyncio
+import functools
+import itertools
 import os
 import time
 import logging
+import threading
+import wave
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, AsyncIterator, Iterator, List, Sequence, Tuple
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import urlparse
 
 import structlog
 
@@ -41,6 +50,55 @@ def setup_logger(name: str = __name__) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
 
+def _truncate(text: str, limit: int) -> str:
+    """ログ出力用に文字列を先頭limit文字までに切り詰める"""
+    return text[:limit]
+
+
+def _is_supported_audio_header(header: bytes) -> bool:
+    """ファイル先頭のバイト列がWhisperの対応する音声コンテナか判定"""
+    return (
+        # MP3（ID3タグ付き / フレーム同期）
+        header.startswith(b"ID3")
+        or (len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0)
+        # WAV
+        or (header.startswith(b"RIFF") and header[8:12] == b"WAVE")
+        # MP4 / M4A
+        or header[4:8] == b"ftyp"
+        # OGG / FLAC / WebM
+        or header.startswith((b"OggS", b"fLaC", b"\x1a\x45\xdf\xa3"))
+    )
+
+
+def _poll_intervals(
+    poll_interval: float,
+    poll_schedule: Optional[Sequence[float]]
+) -> Iterator[float]:
+    """ポーリング間隔を順に返す（スケジュール指定時は最後の値をその後も繰り返す）"""
+    if not poll_schedule:
+        return itertools.repeat(poll_interval)
+    return itertools.chain(poll_schedule, itertools.repeat(poll_schedule[-1]))
+
+
+def _write_buffers(f, buffers: List[bytes]) -> None:
+    """
+    複数のバッファをまとめてファイルに書き込む
+    
+    os.writev が使える環境では1回のシステムコールで書き込み、
+    部分書き込みになった場合は残りを書き込みます。
+    """
+    if not hasattr(os, "writev"):
+        f.write(b"".join(buffers))
+        return
+    
+    total = sum(map(len, buffers))
+    written = os.writev(f.fileno(), buffers)
+    if written < total:
+        remaining = memoryview(b"".join(buffers))[written:]
+        while remaining:
+            remaining = remaining[f.write(remaining):]
+
+
 class MusicGeneratorError(Exception):
     """音楽生成エラー"""
     pass
@@ -58,13 +116,36 @@ class MusicGenerator:
     
     UDIO_API_BASE = "https://udioapi.pro/api"
     
+    # 生成した音楽ファイルの保存ディレクトリ
+    DEFAULT_MUSIC_DIR = "music"
+    
+    # 音楽ファイルダウンロード時のチャンクサイズ
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    
+    # ダウンロードしたチャンクをまとめて書き込む単位（バイト）
+    DOWNLOAD_WRITE_BATCH_SIZE = 512 * 1024
+    
+    # 完了通知Webhookを使う場合のフォールバックポーリング間隔（秒）
+    CALLBACK_FALLBACK_POLL_INTERVAL = 20
+    
+    # 短い生成は早く検知し、長い生成ではリクエスト数を抑えるポーリング間隔（秒）
+    ADAPTIVE_POLL_SCHEDULE = (2, 3, 5, 8, 13, 15)
+    
+    # OpenAI Whisper APIのアップロード上限サイズ（バイト）
+    WHISPER_MAX_FILE_SIZE = 25 * 1024 * 1024
+    
+    # 音声認識に回す最短の録音時間（秒）
+    MIN_AUDIO_DURATION = 0.5
+    
     def __init__(
         self,
         openai_api_key: str,
         udio_api_key: str,
         vonage_api_key: str,
         vonage_api_secret: str,
-        vonage_from_number: str
+        vonage_from_number: str,
+        music_dir: Optional[str] = None,
+        callback_url: Optional[str] = None
     ):
         """
         MusicGeneratorを初期化
@@ -75,16 +156,38 @@ class MusicGenerator:
             vonage_api_key: Vonage APIキー
             vonage_api_secret: Vonage APIシークレット
             vonage_from_number: SMS送信元電話番号
+            music_dir: 音楽ファイル保存ディレクトリ（オプション）
+            callback_url: Udioの完了通知を受け取るWebhook URL（オプション）
         """
         self.openai_api_key = openai_api_key
         self.udio_api_key = udio_api_key
         self.vonage_api_key = vonage_api_key
         self.vonage_api_secret = vonage_api_secret
         self.vonage_from_number = vonage_from_number
+        self.music_dir = music_dir or self.DEFAULT_MUSIC_DIR
+        
+        self.callback_url = callback_url
+        
+        # ETag をキーにしたダウンロード済み音楽ファイルのキャッシュ
+        self.audio_cache: Dict[str, str] = {}
+        
+        # workId ごとの完了通知イベント（完了Webhook受信時にセットされる）
+        self._completion_events: Dict[str, threading.Event] = {}
+        self._completion_lock = threading.Lock()
+        
+        # 生成中の (歌詞, スタイル) ごとの結果Future（同じ依頼の重複送信を防ぐ）
+        self._inflight_music: Dict[Tuple[str, str], asyncio.Future] = {}
         
         # OpenAIクライアントを初期化
         openai.api_key = openai_api_key
         
+        # Whisper API用クライアント（初回使用時に作成し、接続を再利用する）
+        self._openai_client: Optional[openai.OpenAI] = None
+        self._openai_client_lock = threading.Lock()
+        
+        # Udio / Vonage / 音楽ファイル取得で共有するHTTPセッション（接続を再利用する）
+        self._session = self._create_session()
+        
         # ロガーを初期化
         self.logger = setup_logger(__name__)
         
@@ -94,6 +197,37 @@ class MusicGenerator:
             vonage_from_number=vonage_from_number
         )
     
+    def __enter__(self) -> "MusicGenerator":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """HTTPセッションを閉じてプールされた接続を解放"""
+        self._session.close()
+    
+    def _create_session(self) -> requests.Session:
+        """
+        外部API呼び出し用のHTTPセッションを作成
+        
+        ホストごとにKeep-Alive接続をプールし、TLSハンドシェイクを
+        プロセス内で使い回します。接続エラーはバックオフ付きで再試行します。
+        
+        Returns:
+            設定済みのrequests.Session
+        """
+        session = requests.Session()
+        
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        session.mount("https://", adapter)
+        
+        return session
+    
     def transcribe_audio(self, audio_file_path: str) -> str:
         """
         音声ファイルをテキストに変換（OpenAI Whisper）
@@ -110,15 +244,18 @@ class MusicGenerator:
             )
             raise MusicGeneratorError(f"音声ファイルが見つかりません: {audio_file_path}")
         
-        file_size = os.path.getsize(audio_file_path)
-        self.logger.debug(
-            "transcribe_audio_file_info",
-            audio_file_path=audio_file_path,
-            file_size_bytes=file_size
-        )
+        # アップロード前にローカルで検証し、失敗が確定しているリクエストを送らない
+        file_size = self._validate_audio(audio_file_path)
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "transcribe_audio_file_info",
+                audio_file_path=audio_file_path,
+                file_size_bytes=file_size
+            )
         
         try:
-            client = openai.OpenAI(api_key=self.openai_api_key)
+            client = self._get_openai_client()
             
             self.logger.info(
                 "openai_whisper_request",
@@ -126,6 +263,8 @@ class MusicGenerator:
                 language="ja"
             )
             
+            # ファイルオブジェクトをそのまま渡すと、HTTPクライアントがチャンク単位で
+            # 読みながら送信する（パスやbytesを渡すと全体がメモリに読み込まれる）
             with open(audio_file_path, "rb") as audio_file:
                 transcript = client.audio.transcriptions.create(
                     model="whisper-1",
@@ -136,7 +275,7 @@ class MusicGenerator:
             self.logger.info(
                 "openai_whisper_response",
                 text_length=len(transcript.text),
-                text_preview=transcript.text[:100] if len(transcript.text) > 100 else transcript.text
+                text_preview=_truncate(transcript.text, 100)
             )
             
             return transcript.text
@@ -150,6 +289,106 @@ class MusicGenerator:
             )
             raise MusicGeneratorError(f"音声認識に失敗しました: {e}")
     
+    def transcribe_audio_batch(
+        self,
+        audio_file_paths: List[str],
+        max_workers: int = 4
+    ) -> List[Optional[str]]:
+        """
+        複数の音声ファイルを並行してテキストに変換（OpenAI Whisper）
+        
+        Whisper APIは1リクエスト1ファイルのため、アップロードをスレッドプールで
+        重ねて実行し、OpenAIクライアント（HTTP接続）を共有します。
+        
+        Args:
+            audio_file_paths: 音声ファイルのパスのリスト
+            max_workers: 同時に送信するリクエスト数の上限
+        
+        Returns:
+            各ファイルの認識結果（入力と同じ順序）。失敗したファイルはNone
+        """
+        if not audio_file_paths:
+            return []
+        
+        self.logger.info(
+            "transcribe_audio_batch_start",
+            file_count=len(audio_file_paths),
+            max_workers=max_workers
+        )
+        
+        def transcribe(path: str) -> Optional[str]:
+            try:
+                return self.transcribe_audio(path)
+            except MusicGeneratorError:
+                # 失敗の詳細は transcribe_audio がログ出力済み
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(audio_file_paths))) as executor:
+            results = list(executor.map(transcribe, audio_file_paths))
+        
+        self.logger.info(
+            "transcribe_audio_batch_complete",
+            file_count=len(audio_file_paths),
+            success_count=sum(r is not None for r in results)
+        )
+        
+        return results
+    
+    def _get_openai_client(self) -> openai.OpenAI:
+        """Whisper API用のOpenAIクライアントを取得（なければ作成）"""
+        with self._openai_client_lock:
+            if self._openai_client is None:
+                self._openai_client = openai.OpenAI(api_key=self.openai_api_key)
+            return self._openai_client
+    
+    def _validate_audio(self, audio_file_path: str) -> int:
+        """
+        Whisperに送信する前に音声ファイルを検証
+        
+        ファイルサイズ、コンテナ形式（先頭バイト）、WAVの場合は録音時間を確認し、
+        APIに拒否されることが分かっているファイルのアップロードを避けます。
+        
+        Args:
+            audio_file_path: 音声ファイルのパス
+        
+        Returns:
+            ファイルサイズ（バイト）
+        
+        Raises:
+            MusicGeneratorError: 音声ファイルが無効な場合
+        """
+        file_size = os.path.getsize(audio_file_path)
+        
+        if file_size == 0:
+            reason = "empty_file"
+        elif file_size > self.WHISPER_MAX_FILE_SIZE:
+            reason = "file_too_large"
+        else:
+            with open(audio_file_path, "rb") as f:
+                header = f.read(12)
+            reason = None if _is_supported_audio_header(header) else "unsupported_format"
+        
+        if reason is None and header.startswith(b"RIFF"):
+            try:
+                with wave.open(audio_file_path, "rb") as wav:
+                    duration = wav.getnframes() / float(wav.getframerate())
+                if duration < self.MIN_AUDIO_DURATION:
+                    reason = "audio_too_short"
+            except (wave.Error, EOFError, ZeroDivisionError):
+                # PCM以外のWAVはwaveモジュールで読めないため、判定はAPIに任せる
+                pass
+        
+        if reason is not None:
+            self.logger.error(
+                "transcribe_audio_invalid_file",
+                audio_file_path=audio_file_path,
+                file_size_bytes=file_size,
+                reason=reason
+            )
+            raise MusicGeneratorError(f"音声ファイルが無効です ({reason}): {audio_file_path}")
+        
+        return file_size
+    
     def generate_music(
         self,
         lyrics: str,
@@ -177,10 +416,11 @@ class MusicGenerator:
         # 歌詞をフォーマット
         formatted_lyrics = self._format_lyrics(lyrics)
         
-        self.logger.debug(
-            "generate_music_formatted_lyrics",
-            formatted_lyrics=formatted_lyrics
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "generate_music_formatted_lyrics",
+                formatted_lyrics=formatted_lyrics
+            )
         
         request_body = {
             "prompt": formatted_lyrics,
@@ -190,6 +430,9 @@ class MusicGenerator:
             "make_instrumental": False
         }
         
+        if self.callback_url:
+            request_body["callback_url"] = self.callback_url
+        
         for attempt in range(max_retries):
             try:
                 url = f"{self.UDIO_API_BASE}/v2/generate"
@@ -203,7 +446,7 @@ class MusicGenerator:
                     request_body=request_body
                 )
                 
-                response = requests.post(
+                response = self._session.post(
                     url,
                     headers={
                         "Authorization": f"Bearer {self.udio_api_key}",
@@ -213,12 +456,14 @@ class MusicGenerator:
                     timeout=60
                 )
                 
-                self.logger.info(
-                    "udio_api_response",
-                    status_code=response.status_code,
-                    response_headers=dict(response.headers),
-                    response_body=response.text[:1000] if len(response.text) > 1000 else response.text
-                )
+                # ヘッダーのコピーと本文の切り詰めはログが出力される場合のみ行う
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(
+                        "udio_api_response",
+                        status_code=response.status_code,
+                        response_headers=dict(response.headers),
+                        response_body=_truncate(response.text, 1000)
+                    )
                 
                 # エラーレスポンスの詳細を出力
                 if response.status_code >= 400:
@@ -284,6 +529,65 @@ class MusicGenerator:
         
         raise MusicGeneratorError("最大リトライ回数に達しました")
     
+    async def generate_music_async(
+        self,
+        lyrics: str,
+        style: str = "rap, hip-hop, japanese, emotional, rhythmic",
+        timeout: int = 300,
+        poll_schedule: Optional[Sequence[float]] = None
+    ) -> Tuple[str, Optional[str]]:
+        """
+        音楽を生成して完了まで待機（asyncio版）
+        
+        同じ歌詞とスタイルの生成が進行中の場合は新たにAPIへ送信せず、
+        先行する生成の結果を待って共有します。
+        
+        Args:
+            lyrics: 歌詞テキスト
+            style: 音楽スタイル
+            timeout: 完了待ちのタイムアウト（秒）
+            poll_schedule: 順に使用するポーリング間隔（秒）
+        
+        Returns:
+            workIdと音楽ファイルのURL（失敗またはタイムアウトの場合はNone）の組
+        
+        Raises:
+            MusicGeneratorError: 生成タスクの作成に失敗した場合
+        """
+        key = (lyrics, style)
+        inflight = self._inflight_music.get(key)
+        if inflight is not None:
+            self.logger.info(
+                "generate_music_inflight_hit",
+                style=style,
+                lyrics_length=len(lyrics)
+            )
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        # 待機者がいない場合でも例外が未取得として警告されないようにする
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight_music[key] = future
+        
+        try:
+            work_id = await asyncio.to_thread(self.generate_music, lyrics, style=style)
+            audio_url = await self.wait_for_music_async(
+                work_id,
+                timeout=timeout,
+                poll_schedule=poll_schedule
+            )
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result((work_id, audio_url))
+            return work_id, audio_url
+        finally:
+            del self._inflight_music[key]
+    
     def check_music_status(self, work_id: str) -> Dict[str, Any]:
         """
         音楽生成タスクのステータスを確認
@@ -291,15 +595,16 @@ class MusicGenerator:
         url = f"{self.UDIO_API_BASE}/v2/feed"
         params = {"workId": work_id}
         
-        self.logger.debug(
-            "udio_api_status_request",
-            url=url,
-            method="GET",
-            params=params
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "udio_api_status_request",
+                url=url,
+                method="GET",
+                params=params
+            )
         
         try:
-            response = requests.get(
+            response = self._session.get(
                 url,
                 params=params,
                 headers={
@@ -308,11 +613,12 @@ class MusicGenerator:
                 timeout=30
             )
             
-            self.logger.debug(
-                "udio_api_status_response",
-                status_code=response.status_code,
-                response_body=response.text[:500] if len(response.text) > 500 else response.text
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "udio_api_status_response",
+                    status_code=response.status_code,
+                    response_body=_truncate(response.text, 500)
+                )
             
             response.raise_for_status()
             
@@ -349,18 +655,52 @@ class MusicGenerator:
         self,
         work_id: str,
         timeout: int = 300,
-        poll_interval: int = 10
+        poll_interval: int = 10,
+        poll_schedule: Optional[Sequence[float]] = None
     ) -> Optional[str]:
         """
         音楽生成完了を待機してURLを取得
+        
+        完了通知Webhook（callback_url）が設定されている場合は、
+        通知を受けた時点で即座にステータスを確認します。
+        通知の取りこぼしに備え、一定間隔のポーリングも併用します。
+        
+        poll_schedule を指定すると、ポーリング間隔をその順に変化させ、
+        最後の値以降はその値を繰り返します（完了通知Webhook使用時は無視）。
         """
+        if self.callback_url:
+            poll_interval = max(poll_interval, self.CALLBACK_FALLBACK_POLL_INTERVAL)
+            poll_schedule = None
+        
         self.logger.info(
             "wait_for_music_start",
             work_id=work_id,
             timeout=timeout,
-            poll_interval=poll_interval
+            poll_interval=poll_interval,
+            poll_schedule=poll_schedule,
+            callback_enabled=bool(self.callback_url)
         )
         
+        intervals = _poll_intervals(poll_interval, poll_schedule)
+        # 完了通知イベントは待機中だけ登録する（待機開始前に届いた通知は
+        # 最初のステータス確認で拾えるため、事前登録は不要）
+        completion_event = self._get_completion_event(work_id)
+        try:
+            return self._poll_music_status(work_id, timeout, intervals, completion_event)
+        finally:
+            with self._completion_lock:
+                self._completion_events.pop(work_id, None)
+    
+    def _poll_music_status(
+        self,
+        work_id: str,
+        timeout: int,
+        intervals: Iterator[float],
+        completion_event: threading.Event
+    ) -> Optional[str]:
+        """
+        完了通知またはポーリング間隔ごとにステータスを確認し、音楽URLを取得
+        """
         start_time = time.time()
         poll_count = 0
         
@@ -370,51 +710,82 @@ class MusicGenerator:
             
             try:
                 result = self.check_music_status(work_id)
-                status_type = result.get("type", "")
-                
-                self.logger.info(
-                    "wait_for_music_poll",
+                finished, audio_url = self._handle_music_status(
+                    work_id, result, poll_count, elapsed
+                )
+                if finished:
+                    return audio_url
+            except MusicGeneratorError as e:
+                self.logger.warning(
+                    "wait_for_music_poll_error",
                     work_id=work_id,
-                    poll_count=poll_count,
-                    elapsed_seconds=elapsed,
-                    status_type=status_type
+                    error=str(e),
+                    poll_count=poll_count
                 )
-                
-                if status_type == "SUCCESS":
-                    response_data = result.get("response_data", [])
-                    if response_data and len(response_data) > 0:
-                        audio_url = response_data[0].get("audio_url")
-                        if audio_url:
-                            self.logger.info(
-                                "wait_for_music_success",
-                                work_id=work_id,
-                                audio_url=audio_url,
-                                total_time_seconds=elapsed
-                            )
-                            return audio_url
-                    
-                    self.logger.error(
-                        "wait_for_music_no_url",
-                        work_id=work_id,
-                        response_data=response_data
-                    )
-                    return None
-                
-                elif status_type == "FAILED":
-                    error_msg = ""
-                    if result.get("response_data"):
-                        error_msg = result["response_data"][0].get("error_message", "Unknown error")
-                    
-                    self.logger.error(
-                        "wait_for_music_failed",
-                        work_id=work_id,
-                        error_message=error_msg,
-                        result=result
-                    )
-                    return None
-                
-                time.sleep(poll_interval)
-                
+            
+            # 完了通知を受けるかポーリング間隔が経過するまで待機
+            if completion_event.wait(next(intervals)):
+                completion_event.clear()
+        
+        self.logger.error(
+            "wait_for_music_timeout",
+            work_id=work_id,
+            timeout=timeout,
+            poll_count=poll_count
+        )
+        return None
+    
+    async def wait_for_music_async(
+        self,
+        work_id: str,
+        timeout: int = 300,
+        poll_interval: int = 10,
+        poll_schedule: Optional[Sequence[float]] = None
+    ) -> Optional[str]:
+        """
+        音楽生成完了を待機してURLを取得（asyncio版）
+        
+        ステータス確認のHTTPリクエストはスレッドで実行し、ポーリング間の待機は
+        asyncio.sleep で行うため、待機中はイベントループが他の処理を進められます。
+        複数の生成タスクを同時に待つ場合に使用します。
+        完了通知Webhookによる即時確認は wait_for_music のみが対応します。
+        
+        Args:
+            work_id: Udio APIのworkId
+            timeout: タイムアウト（秒）
+            poll_interval: ポーリング間隔（秒）
+            poll_schedule: 順に使用するポーリング間隔（秒）。最後の値以降は
+                その値を繰り返す（指定時は poll_interval より優先）
+        
+        Returns:
+            音楽ファイルのURL、失敗またはタイムアウトの場合はNone
+        """
+        self.logger.info(
+            "wait_for_music_start",
+            work_id=work_id,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            poll_schedule=poll_schedule,
+            callback_enabled=False
+        )
+        
+        intervals = _poll_intervals(poll_interval, poll_schedule)
+        
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        poll_count = 0
+        
+        while loop.time() - start_time < timeout:
+            poll_count += 1
+            elapsed = int(loop.time() - start_time)
+            
+            try:
+                result = await asyncio.to_thread(self.check_music_status, work_id)
+                finished, audio_url = self._handle_music_status(
+                    work_id, result, poll_count, elapsed
+                )
+                if finished:
+                    return audio_url
             except MusicGeneratorError as e:
                 self.logger.warning(
                     "wait_for_music_poll_error",
@@ -422,7 +793,8 @@ class MusicGenerator:
                     error=str(e),
                     poll_count=poll_count
                 )
-                time.sleep(poll_interval)
+            
+            await asyncio.sleep(next(intervals))
         
         self.logger.error(
             "wait_for_music_timeout",
@@ -432,6 +804,254 @@ class MusicGenerator:
         )
         return None
     
+    def _handle_music_status(
+        self,
+        work_id: str,
+        result: Dict[str, Any],
+        poll_count: int,
+        elapsed: int
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        ステータス確認の結果を解釈
+        
+        Args:
+            work_id: Udio APIのworkId
+            result: check_music_status の戻り値
+            poll_count: これまでのポーリング回数
+            elapsed: 待機開始からの経過秒数
+        
+        Returns:
+            (生成が終了したか, 音楽ファイルのURL) のタプル。
+            失敗した場合や成功してもURLがない場合、URLはNone
+        """
+        status_type = result.get("type", "")
+        
+        self.logger.info(
+            "wait_for_music_poll",
+            work_id=work_id,
+            poll_count=poll_count,
+            elapsed_seconds=elapsed,
+            status_type=status_type
+        )
+        
+        if status_type == "SUCCESS":
+            response_data = result.get("response_data", [])
+            if response_data and len(response_data) > 0:
+                audio_url = response_data[0].get("audio_url")
+                if audio_url:
+                    self.logger.info(
+                        "wait_for_music_success",
+                        work_id=work_id,
+                        audio_url=audio_url,
+                        total_time_seconds=elapsed
+                    )
+                    return True, audio_url
+            
+            self.logger.error(
+                "wait_for_music_no_url",
+                work_id=work_id,
+                response_data=response_data
+            )
+            return True, None
+        
+        if status_type == "FAILED":
+            error_msg = ""
+            if result.get("response_data"):
+                error_msg = result["response_data"][0].get("error_message", "Unknown error")
+            
+            self.logger.error(
+                "wait_for_music_failed",
+                work_id=work_id,
+                error_message=error_msg,
+                result=result
+            )
+            return True, None
+        
+        return False, None
+    
+    def notify_music_complete(self, work_id: str) -> bool:
+        """
+        Udioからの完了通知を受け取り、待機中の wait_for_music を起こす
+        
+        通知内容は信用せず、起こされた側でステータスAPIを確認します。
+        
+        Args:
+            work_id: 完了した音楽生成タスクのworkId
+        
+        Returns:
+            wait_for_music で待機中のタスクだった場合はTrue
+        """
+        with self._completion_lock:
+            event = self._completion_events.get(work_id)
+        
+        self.logger.info(
+            "music_completion_notified",
+            work_id=work_id,
+            known_work_id=event is not None
+        )
+        
+        if event is None:
+            return False
+        
+        event.set()
+        return True
+    
+    def _get_completion_event(self, work_id: str) -> threading.Event:
+        """workIdに対応する完了通知イベントを取得（なければ作成）"""
+        with self._completion_lock:
+            return self._completion_events.setdefault(work_id, threading.Event())
+    
+    def download_music(self, audio_url: str) -> str:
+        """
+        生成された音楽ファイルをダウンロード
+        
+        まず HEAD リクエストで ETag を確認し、同じ ETag のファイルを
+        既にダウンロード済みであれば本文を取得せずにそのパスを返します。
+        未取得の場合はチャンク単位でストリーミングしてファイルに保存します。
+        
+        Args:
+            audio_url: 音楽ファイルのURL
+        
+        Returns:
+            保存されたファイルのパス
+        
+        Raises:
+            MusicGeneratorError: ダウンロードに失敗した場合
+        """
+        try:
+            head = self._session.head(audio_url, timeout=10, allow_redirects=True)
+            head.raise_for_status()
+            
+            etag = head.headers.get("ETag")
+            cacheable = "no-store" not in head.headers.get("Cache-Control", "")
+            
+            cached_path = self.audio_cache.get(etag) if etag else None
+            if cached_path and os.path.exists(cached_path):
+                self.logger.info(
+                    "download_music_cache_hit",
+                    audio_url=audio_url,
+                    etag=etag,
+                    file_path=cached_path
+                )
+                return cached_path
+            
+            filename = os.path.basename(urlparse(audio_url).path) or f"{datetime.now():%Y%m%d_%H%M%S}.mp3"
+            Path(self.music_dir).mkdir(parents=True, exist_ok=True)
+            file_path = os.path.join(self.music_dir, filename)
+            
+            with self._session.get(audio_url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                # チャンクごとに書き込まず、まとめてからベクタ書き込みする
+                # （バッファなしで開き、writevとファイルオブジェクトの書き込みを混在させない）
+                with open(file_path, "wb", buffering=0) as f:
+                    pending: List[bytes] = []
+                    pending_size = 0
+                    for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                        pending.append(chunk)
+                        pending_size += len(chunk)
+                        if pending_size >= self.DOWNLOAD_WRITE_BATCH_SIZE:
+                            _write_buffers(f, pending)
+                            pending = []
+                            pending_size = 0
+                    if pending:
+                        _write_buffers(f, pending)
+            
+            if etag and cacheable:
+                self.audio_cache[etag] = file_path
+            
+            self.logger.info(
+                "download_music_complete",
+                audio_url=audio_url,
+                etag=etag,
+                file_path=file_path,
+                content_length=head.headers.get("Content-Length")
+            )
+            
+            return file_path
+            
+        except (requests.RequestException, IOError) as e:
+            self.logger.error(
+                "download_music_error",
+                error=str(e),
+                error_type=type(e).__name__,
+                audio_url=audio_url
+            )
+            raise MusicGeneratorError(f"音楽ファイルのダウンロードに失敗しました: {e}")
+    
+    async def stream_music(
+        self,
+        audio_url: str,
+        chunk_size: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        生成された音楽ファイルをチャンク単位で非同期に取得
+        
+        Udio APIは生成途中の音声を返さないため、完成したURLの本文を
+        チャンクごとに受け取りながら順次返します。呼び出し側は最初の
+        チャンクから保存や検証を始められ、ダウンロード全体の完了を待つ
+        必要がありません。HTTPの読み込みはスレッドで実行します。
+        
+        Args:
+            audio_url: 音楽ファイルのURL
+            chunk_size: 1チャンクのバイト数（省略時は DOWNLOAD_CHUNK_SIZE）
+        
+        Yields:
+            音楽ファイルのバイト列（チャンク）
+        
+        Raises:
+            MusicGeneratorError: ダウンロードに失敗した場合
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        total_bytes = 0
+        
+        try:
+            response = await asyncio.to_thread(
+                self._session.get, audio_url, timeout=60, stream=True
+            )
+        except requests.RequestException as e:
+            self.logger.error(
+                "stream_music_error",
+                error=str(e),
+                error_type=type(e).__name__,
+                audio_url=audio_url
+            )
+            raise MusicGeneratorError(f"音楽ファイルの取得に失敗しました: {e}")
+        
+        try:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=chunk_size or self.DOWNLOAD_CHUNK_SIZE)
+            
+            while True:
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                if not total_bytes:
+                    self.logger.info(
+                        "stream_music_first_chunk",
+                        audio_url=audio_url,
+                        latency=round(loop.time() - start_time, 3)
+                    )
+                total_bytes += len(chunk)
+                yield chunk
+        except requests.RequestException as e:
+            self.logger.error(
+                "stream_music_error",
+                error=str(e),
+                error_type=type(e).__name__,
+                audio_url=audio_url
+            )
+            raise MusicGeneratorError(f"音楽ファイルの取得に失敗しました: {e}")
+        finally:
+            response.close()
+        
+        self.logger.info(
+            "stream_music_complete",
+            audio_url=audio_url,
+            total_bytes=total_bytes,
+            elapsed=round(loop.time() - start_time, 3)
+        )
+    
     def send_sms(self, to_number: str, message: str) -> bool:
         """
         Vonage SMS APIでメッセージを送信
@@ -456,7 +1076,7 @@ class MusicGenerator:
         )
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
                 data={
                     "api_key": self.vonage_api_key,
@@ -503,6 +1123,44 @@ class MusicGenerator:
             )
             return False
     
+    def send_sms_bulk(
+        self,
+        messages: List[Tuple[str, str]],
+        max_workers: int = 8
+    ) -> List[bool]:
+        """
+        複数のSMSを並行して送信
+        
+        送信ごとのHTTP往復を直列に待たず、スレッドプールで重ねて実行します。
+        各送信の成否判定は send_sms と同じです。
+        
+        Args:
+            messages: (送信先電話番号, メッセージ) のリスト
+            max_workers: 同時送信数の上限
+        
+        Returns:
+            各メッセージの送信結果（入力と同じ順序）
+        """
+        if not messages:
+            return []
+        
+        self.logger.info(
+            "vonage_sms_bulk_start",
+            message_count=len(messages),
+            max_workers=max_workers
+        )
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(messages))) as executor:
+            results = list(executor.map(lambda m: self.send_sms(*m), messages))
+        
+        self.logger.info(
+            "vonage_sms_bulk_complete",
+            message_count=len(messages),
+            success_count=sum(results)
+        )
+        
+        return results
+    
     def process_voicemail(
         self,
         audio_file_path: str,
@@ -576,21 +1234,23 @@ class MusicGenerator:
         
         return music_url
     
-    def _format_lyrics(self, text: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _format_lyrics(text: str) -> str:
         """
         テキストを歌詞形式にフォーマット
+        
+        結果はテキストのみに依存するため、同じテキストの整形結果をキャッシュします。
         """
-        lines = text.strip().split("。")
-        lines = [line.strip() for line in lines if line.strip()]
+        # 各行のstrip()は1回だけ行う
+        lines = [line for line in (part.strip() for part in text.split("。")) if line]
         
         if len(lines) <= 2:
             return f"[Verse]\n{text}"
         
         mid = len(lines) // 2
-        verse_lines = lines[:mid]
-        chorus_lines = lines[mid:]
         
-        verse = "\n".join(verse_lines)
-        chorus = "\n".join(chorus_lines)
+        verse = "\n".join(lines[:mid])
+        chorus = "\n".join(lines[mid:])
         
         return f"[Verse]\n{verse}\n\n[Chorus]\n{chorus}"
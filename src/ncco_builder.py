@@ -5,13 +5,17 @@ Vonage Voice APIの通話フローを制御するNCCO (Nexmo Call Control Object
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+
+import orjson
+
+from .models import DATACLASS_SLOTS
 
 if TYPE_CHECKING:
     from src.config import Config
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TalkAction:
     """
     Talk NCCOアクション
@@ -51,7 +55,7 @@ class TalkAction:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RecordAction:
     """
     Record NCCOアクション
@@ -126,6 +130,8 @@ class NCCOBuilder:
             config: アプリケーション設定オブジェクト
         """
         self.config = config
+        # 設定から決まるNCCOのJSONエンコード結果（初回構築時にキャッシュ）
+        self._voicemail_ncco_json: Optional[bytes] = None
     
     def build_voicemail_ncco(self, call_uuid: str) -> List[Dict[str, Any]]:
         """
@@ -159,6 +165,25 @@ class NCCOBuilder:
         
         return ncco
     
+    def build_voicemail_ncco_json(self, call_uuid: str) -> bytes:
+        """
+        ボイスメール用NCCOをJSONエンコード済みのバイト列で取得
+        
+        NCCOの内容は設定のみから決まるため、初回呼び出し時に
+        エンコードした結果をキャッシュし、以降は辞書の構築と
+        JSONシリアライズを行わずに同じバイト列を返します。
+        
+        Args:
+            call_uuid: 通話UUID（ログ記録やトラッキング用）
+        
+        Returns:
+            NCCOアクションのリストをUTF-8でJSONエンコードしたバイト列
+        """
+        if self._voicemail_ncco_json is None:
+            ncco = self.build_voicemail_ncco(call_uuid)
+            self._voicemail_ncco_json = orjson.dumps(ncco)
+        return self._voicemail_ncco_json
+    
     def _build_talk_action(self) -> Dict[str, Any]:
         """
         Talk アクションを構築
@@ -5,19 +5,34 @@
 音声ファイルのダウンロードと保存機能も提供します。
 """
 
+import mmap
 import os
+import shutil
+import threading
+import uuid
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import partial
+from itertools import starmap
 from pathlib import Path
-from typing import List, Optional
-import uuid
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 
-from .models import Recording
+from .models import DATACLASS_SLOTS, Recording, uuid7
 from .storage import Storage
 
 
-@dataclass
+# save_recording で毎回参照する関数をモジュールレベルで束縛しておく
+# （ストレージはタイムゾーン情報のない日時をUTCとして扱うため、UTCの現在時刻を使う）
+_now = partial(datetime.now, timezone.utc)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RecordingMetadata:
     """
     録音メタデータ
@@ -64,6 +79,15 @@ class RecordingManager:
     # 録音ファイル保存ディレクトリ
     DEFAULT_RECORDINGS_DIR = "recordings"
     
+    # 録音ファイルダウンロード時のバッファサイズ
+    DOWNLOAD_CHUNK_SIZE = 128 * 1024
+    
+    # バックグラウンドで同時に実行するダウンロードの最大数
+    DOWNLOAD_MAX_WORKERS = 8
+    
+    # 経路（バックグラウンド・一括保存・直接呼び出し）を問わず同時に行うダウンロードの上限
+    MAX_CONCURRENT_DOWNLOADS = 16
+    
     def __init__(
         self,
         storage: Storage,
@@ -85,26 +109,78 @@ class RecordingManager:
         self.vonage_api_key = vonage_api_key
         self.vonage_api_secret = vonage_api_secret
         
-        # 録音ディレクトリを作成
-        self._ensure_recordings_dir()
+        # ダウンロード用のHTTPセッション（接続と認証情報を再利用する）
+        self._session = self._create_session()
+        
+        # 同時ダウンロード数を制限するセマフォ
+        self._download_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_DOWNLOADS)
+        
+        # 録音ファイルをバックグラウンドでダウンロードするスレッドプール
+        self._download_executor = ThreadPoolExecutor(
+            max_workers=self.DOWNLOAD_MAX_WORKERS,
+            thread_name_prefix="recording-download"
+        )
+        
+        # 録音ディレクトリを作成（ダウンロードごとには確認しない）
+        self._recordings_path = Path(self.recordings_dir)
+        self._recordings_path.mkdir(parents=True, exist_ok=True)
+    
+    def __enter__(self) -> "RecordingManager":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
-    def _ensure_recordings_dir(self) -> None:
-        """録音ディレクトリが存在することを確認し、なければ作成"""
-        Path(self.recordings_dir).mkdir(parents=True, exist_ok=True)
+    def close(self) -> None:
+        """実行中のダウンロードの完了を待ち、HTTPセッションを閉じてプールされた接続を解放"""
+        self._download_executor.shutdown(wait=True)
+        self._session.close()
+    
+    def _create_session(self) -> requests.Session:
+        """
+        録音ダウンロード用のHTTPセッションを作成
+        
+        Keep-Aliveで接続を再利用し、一時的なサーバーエラーは
+        バックオフ付きで再試行します。
+        
+        Returns:
+            設定済みのrequests.Session
+        """
+        session = requests.Session()
+        
+        if self.vonage_api_key and self.vonage_api_secret:
+            # Basic認証を使用
+            session.auth = (self.vonage_api_key, self.vonage_api_secret)
+        
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        session.mount("https://", adapter)
+        
+        return session
     
     def download_recording(
         self,
         recording_url: str,
         recording_id: str,
-        format: str = "mp3"
+        format: str = "mp3",
+        expected_size: Optional[int] = None
     ) -> Optional[str]:
         """
         Vonageから録音ファイルをダウンロードしてローカルに保存
         
+        ファイルは一時ファイルへ書き込み、受信完了後に保存先へ置き換えます。
+        そのためWebhookの再送などで同じ録音が既に保存済みの場合
+        （ファイルサイズが expected_size と一致する場合）はダウンロードを省略します。
+        失敗したダウンロードは保存先にファイルを残さないため、次回は再取得されます。
+        
         Args:
             recording_url: Vonageの録音ファイルURL
             recording_id: 録音ID（ファイル名に使用）
             format: 録音フォーマット
+            expected_size: 録音ファイルのサイズ（バイト）（オプション）
         
         Returns:
             保存されたファイルのパス、失敗した場合はNone
@@ -115,34 +191,21 @@ class RecordingManager:
         try:
             # ファイル名を生成
             filename = f"{recording_id}.{format}"
-            file_path = os.path.join(self.recordings_dir, filename)
-            
-            # Vonage APIで認証してダウンロード
-            # Vonageの録音URLはJWT認証が必要
-            headers = {}
-            auth = None
+            file_path = os.fspath(self._recordings_path / filename)
             
-            if self.vonage_api_key and self.vonage_api_secret:
-                # Basic認証を使用
-                auth = (self.vonage_api_key, self.vonage_api_secret)
+            if expected_size and self._is_downloaded(file_path, expected_size):
+                return file_path
             
-            response = requests.get(
-                recording_url,
-                auth=auth,
-                headers=headers,
-                timeout=60,
-                stream=True
-            )
-            response.raise_for_status()
-            
-            # ファイルに保存
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # 同時ダウンロード数を制限し、Webhookが集中しても接続数とディスクI/Oを抑える
+            with self._download_slots:
+                # Vonage APIで認証してダウンロード（認証情報はセッションに設定済み）
+                with self._session.get(recording_url, timeout=60, stream=True) as response:
+                    response.raise_for_status()
+                    self._write_atomically(response, file_path)
             
             return file_path
             
-        except requests.RequestException as e:
+        except (requests.RequestException, Urllib3HTTPError) as e:
             # ダウンロード失敗時はログを出力してNoneを返す
             print(f"録音ファイルのダウンロードに失敗しました: {e}")
             return None
@@ -150,6 +213,116 @@ class RecordingManager:
             print(f"録音ファイルの保存に失敗しました: {e}")
             return None
     
+    def _write_atomically(self, response: requests.Response, file_path: str) -> None:
+        """
+        レスポンス本文を同じディレクトリの一時ファイルへ書き込み、完了後に置き換える
+        
+        すべてのデータを受信してから os.replace で保存先へ移動するため、
+        保存先のパスには完全なファイルしか現れません。
+        失敗した場合は一時ファイルを削除して例外を再送出します。
+        
+        Args:
+            response: ストリーミング中のレスポンス
+            file_path: 保存先のファイルパス
+        
+        Raises:
+            requests.RequestException, urllib3.exceptions.HTTPError: 受信に失敗した場合
+            IOError: 書き込みに失敗した場合、または受信データが不足した場合
+        """
+        # 同じ録音の同時ダウンロードで衝突しないよう一時ファイル名は一意にする
+        tmp_path = f"{file_path}.{uuid.uuid4().hex}.part"
+        try:
+            content_length = self._get_content_length(response)
+            if content_length:
+                # サイズが分かる場合はメモリマップしたファイルへ直接読み込む
+                with open(tmp_path, 'w+b') as f:
+                    self._copy_to_mmap(response.raw, f, content_length)
+            else:
+                # ファイルに保存（Pythonのチャンクループを介さずに直接コピー）
+                response.raw.decode_content = True
+                with open(tmp_path, 'wb') as f:
+                    shutil.copyfileobj(
+                        response.raw, f, length=self.DOWNLOAD_CHUNK_SIZE
+                    )
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _is_downloaded(self, file_path: str, expected_size: int) -> bool:
+        """
+        録音ファイルが既に完全に保存されているか確認
+        
+        保存先のパスには _write_atomically で受信を完了したファイルしか
+        置かれないため、存在とサイズの一致で完了済みと判断できます。
+        
+        Args:
+            file_path: 保存先のファイルパス
+            expected_size: 録音ファイルのサイズ（バイト）
+        
+        Returns:
+            ファイルが存在しサイズが一致する場合はTrue
+        """
+        try:
+            return os.stat(file_path).st_size == expected_size
+        except OSError:
+            return False
+    
+    def _get_content_length(self, response: requests.Response) -> Optional[int]:
+        """
+        レスポンスの本文サイズを取得
+        
+        圧縮されたレスポンスは展開後のサイズが分からないため対象外とします。
+        
+        Args:
+            response: ストリーミング中のレスポンス
+        
+        Returns:
+            本文のバイト数、不明な場合はNone
+        """
+        if response.headers.get("Content-Encoding", "identity") != "identity":
+            return None
+        
+        try:
+            return int(response.headers["Content-Length"])
+        except (KeyError, ValueError):
+            return None
+    
+    def _copy_to_mmap(self, raw, f, size: int) -> None:
+        """
+        ストリームの内容をメモリマップしたファイルに読み込む
+        
+        ファイルを事前に指定サイズへ拡張し、マップした領域へ
+        readinto で直接書き込むため中間バッファを生成しません。
+        
+        Args:
+            raw: 読み込み元のストリーム（urllib3のレスポンス）
+            f: 書き込み先のファイル（読み書きモードで開いたもの）
+            size: 書き込むバイト数
+        
+        Raises:
+            IOError: 受信したデータがsizeに満たない場合
+        """
+        f.truncate(size)
+        
+        with mmap.mmap(f.fileno(), size) as mm, memoryview(mm) as view:
+            offset = 0
+            while offset < size:
+                end = min(offset + self.DOWNLOAD_CHUNK_SIZE, size)
+                # 読み込み中に例外が発生してもスライスを確実に解放する
+                # （解放されないとmmapを閉じる際に BufferError が元の例外を置き換える）
+                with view[offset:end] as chunk:
+                    read = raw.readinto(chunk)
+                if not read:
+                    break
+                offset += read
+        
+        if offset < size:
+            raise IOError(f"Incomplete download: {offset} of {size} bytes")
+    
     def save_recording(
         self,
         metadata: RecordingMetadata,
@@ -159,13 +332,17 @@ class RecordingManager:
         file_size: Optional[int] = None,
         format: str = "mp3",
         download_file: bool = True
-    ) -> None:
+    ) -> Optional["Future[Optional[str]]"]:
         """
         録音メタデータを保存
         
         RecordingMetadataを受け取り、完全なRecordingモデルに変換して
         ストレージに永続化します。オプションで音声ファイルもダウンロードします。
         
+        メタデータは local_file_path なしで即座に保存し、音声ファイルの
+        ダウンロードはバックグラウンドで行います。ダウンロード完了後に
+        ストレージの local_file_path を更新します。
+        
         Args:
             metadata: 録音メタデータ
             conversation_uuid: Vonage会話UUID（オプション）
@@ -175,40 +352,155 @@ class RecordingManager:
             format: 録音フォーマット（デフォルト: mp3）
             download_file: 音声ファイルをダウンロードするか（デフォルト: True）
         
+        Returns:
+            ダウンロードのFuture（結果は保存されたファイルのパス、失敗時はNone）。
+            ダウンロードしない場合はNone
+        
         Raises:
             StorageError: 保存に失敗した場合
         
         Validates: Requirements 3.4, 4.1
         """
-        now = datetime.now()
+        recording = self._build_recording(
+            metadata,
+            conversation_uuid=conversation_uuid,
+            called_number=called_number,
+            recording_uuid=recording_uuid,
+            file_size=file_size,
+            format=format
+        )
         
-        # 音声ファイルをダウンロード
-        local_file_path = None
-        if download_file and metadata.recording_url:
-            local_file_path = self.download_recording(
-                recording_url=metadata.recording_url,
-                recording_id=metadata.id,
-                format=format
-            )
+        self.storage.save_recording(recording)
+        
+        if not (download_file and metadata.recording_url):
+            return None
         
-        recording = Recording(
+        # 音声ファイルのダウンロードはWebhookの応答をブロックしないよう別スレッドで行う
+        return self._download_executor.submit(
+            self._download_and_attach,
+            metadata.recording_url,
+            metadata.id,
+            format,
+            file_size
+        )
+    
+    def _download_and_attach(
+        self,
+        recording_url: str,
+        recording_id: str,
+        format: str,
+        expected_size: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        録音ファイルをダウンロードし、保存先をストレージに記録
+        
+        Args:
+            recording_url: Vonageの録音ファイルURL
+            recording_id: 録音ID
+            format: 録音フォーマット
+            expected_size: 録音ファイルのサイズ（バイト）（オプション）
+        
+        Returns:
+            保存されたファイルのパス、失敗した場合はNone
+        
+        Raises:
+            StorageError: ファイルパスの更新に失敗した場合
+        """
+        local_file_path = self.download_recording(
+            recording_url=recording_url,
+            recording_id=recording_id,
+            format=format,
+            expected_size=expected_size
+        )
+        
+        if local_file_path is not None:
+            self.storage.update_recording_local_file_path(recording_id, local_file_path)
+        
+        return local_file_path
+    
+    def _build_recording(
+        self,
+        metadata: RecordingMetadata,
+        conversation_uuid: Optional[str] = None,
+        called_number: Optional[str] = None,
+        recording_uuid: Optional[str] = None,
+        file_size: Optional[int] = None,
+        format: str = "mp3",
+        local_file_path: Optional[str] = None
+    ) -> Recording:
+        """
+        RecordingMetadataと追加情報からRecordingモデルを構築
+        
+        Args:
+            metadata: 録音メタデータ
+            conversation_uuid: Vonage会話UUID（オプション）
+            called_number: 着信電話番号（オプション）
+            recording_uuid: Vonage録音UUID（オプション）
+            file_size: ファイルサイズ（バイト）（オプション）
+            format: 録音フォーマット
+            local_file_path: ローカルに保存されたファイルパス（オプション）
+        
+        Returns:
+            Recording データモデル
+        """
+        return Recording(
             id=metadata.id,
             call_uuid=metadata.call_uuid,
-            conversation_uuid=conversation_uuid or str(uuid.uuid4()),
+            conversation_uuid=conversation_uuid or str(uuid7()),
             caller_number=metadata.caller_number,
             called_number=called_number or "",
             recording_url=metadata.recording_url,
-            recording_uuid=recording_uuid or str(uuid.uuid4()),
+            recording_uuid=recording_uuid or str(uuid7()),
             duration=metadata.duration,
             file_size=file_size or 0,
             format=format,
             status=metadata.status,
             created_at=metadata.timestamp,
-            updated_at=now,
+            updated_at=_now(),
             local_file_path=local_file_path
         )
+    
+    def save_recordings_bulk(
+        self,
+        metadatas: Iterable[RecordingMetadata],
+        format: str = "mp3",
+        max_workers: int = 8
+    ) -> None:
+        """
+        複数の録音メタデータを並行して保存
         
-        self.storage.save_recording(recording)
+        録音ファイルのダウンロードはネットワーク待ちが支配的なため、
+        スレッドプールで複数件を同時に処理します。
+        メタデータはダウンロード完了後に1回の一括書き込みで保存します。
+        
+        Args:
+            metadatas: 録音メタデータのリスト
+            format: 録音フォーマット（デフォルト: mp3）
+            max_workers: 同時に処理する最大件数
+        
+        Raises:
+            StorageError: 保存に失敗した場合
+        
+        Validates: Requirements 3.4, 4.1
+        """
+        metadatas = list(metadatas)
+        
+        def download(metadata: RecordingMetadata) -> Optional[str]:
+            if not metadata.recording_url:
+                return None
+            return self.download_recording(
+                recording_url=metadata.recording_url,
+                recording_id=metadata.id,
+                format=format
+            )
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            local_file_paths = list(executor.map(download, metadatas))
+        
+        self.storage.save_recordings([
+            self._build_recording(metadata, format=format, local_file_path=local_file_path)
+            for metadata, local_file_path in zip(metadatas, local_file_paths)
+        ])
     
     def get_recording(self, call_uuid: str) -> Optional[RecordingMetadata]:
         """
@@ -237,17 +529,25 @@ class RecordingManager:
     def list_recordings(
         self,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        before: Optional[Tuple[datetime, str]] = None
     ) -> List[RecordingMetadata]:
         """
         録音一覧を取得
         
         オプションの日付範囲フィルタを使用して録音の一覧を取得します。
         フィルタが指定されない場合は全ての録音を返します。
+        ページ単位で取得する場合は limit と before（または offset）を指定します。
         
         Args:
             start_date: 開始日時（この日時以降の録音を取得）
             end_date: 終了日時（この日時以前の録音を取得）
+            limit: 取得する最大件数（Noneの場合は無制限）
+            offset: 読み飛ばす件数
+            before: 前ページ最後の録音の (created_at, id)。指定するとそれより
+                古い録音のみを返す（キーセットページネーション）
         
         Returns:
             録音メタデータのリスト
@@ -257,12 +557,74 @@ class RecordingManager:
         
         Validates: Requirements 4.5
         """
-        recordings = self.storage.list_recordings(
+        return list(self.iter_recordings(
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            limit=limit,
+            offset=offset,
+            before=before
+        ))
+    
+    def iter_recordings(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        before: Optional[Tuple[datetime, str]] = None
+    ) -> Iterator[RecordingMetadata]:
+        """
+        録音メタデータを1件ずつ取得するイテレータを返す
+        
+        ストレージから一覧表示に必要な列だけを読み出し、その場で
+        RecordingMetadataを生成します。中間のリストやRecordingオブジェクトは作りません。
+        
+        Args:
+            start_date: 開始日時（この日時以降の録音を取得）
+            end_date: 終了日時（この日時以前の録音を取得）
+            limit: 取得する最大件数（Noneの場合は無制限）
+            offset: 読み飛ばす件数
+            before: 前ページ最後の録音の (created_at, id)。指定するとそれより
+                古い録音のみを返す（キーセットページネーション）
+        
+        Yields:
+            録音メタデータ
+        
+        Raises:
+            StorageError: 取得に失敗した場合
+        
+        Validates: Requirements 4.5
+        """
+        summaries = self.storage.iter_recording_summaries(
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            offset=offset,
+            before=before
         )
         
-        return [self._recording_to_metadata(r) for r in recordings]
+        # タプルの並びはRecordingMetadataのフィールド順と一致する
+        return starmap(RecordingMetadata, summaries)
+    
+    def count_recordings(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        """
+        録音件数を取得
+        
+        Args:
+            start_date: 開始日時（この日時以降の録音を対象）
+            end_date: 終了日時（この日時以前の録音を対象）
+        
+        Returns:
+            条件に一致する録音の件数
+        
+        Raises:
+            StorageError: 取得に失敗した場合
+        """
+        return self.storage.count_recordings(start_date=start_date, end_date=end_date)
     
     def _recording_to_metadata(self, recording: Recording) -> RecordingMetadata:
         """
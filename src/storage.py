@@ -5,8 +5,8 @@
 """
 
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional, Tuple
 
 from .models import CallLog, Recording
 
@@ -41,6 +41,47 @@ class Storage(ABC):
         """
         pass
     
+    def save_recordings(self, recordings: List[Recording]) -> None:
+        """
+        複数の録音メタデータをまとめて保存
+        
+        デフォルト実装は save_recording を順に呼び出します。
+        一括書き込みに対応したストレージはオーバーライドしてください。
+        
+        Args:
+            recordings: 保存する録音データモデルのリスト
+        
+        Raises:
+            StorageError: 保存に失敗した場合
+        
+        Validates: Requirements 4.1
+        """
+        for recording in recordings:
+            self.save_recording(recording)
+    
+    @abstractmethod
+    def update_recording_local_file_path(
+        self,
+        recording_id: str,
+        local_file_path: str
+    ) -> bool:
+        """
+        録音のローカルファイルパスを更新
+        
+        録音ファイルのダウンロード完了後に呼び出されます。
+        
+        Args:
+            recording_id: 録音ID
+            local_file_path: ローカルに保存されたファイルパス
+        
+        Returns:
+            更新が成功した場合はTrue、録音が見つからない場合はFalse
+        
+        Raises:
+            StorageError: 更新に失敗した場合
+        """
+        pass
+    
     @abstractmethod
     def get_recording(self, call_uuid: str) -> Optional[Recording]:
         """
@@ -65,17 +106,25 @@ class Storage(ABC):
     def list_recordings(
         self,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        before: Optional[Tuple[datetime, str]] = None
     ) -> List[Recording]:
         """
         録音一覧を取得
         
         オプションの日付範囲フィルタを使用して録音の一覧を取得します。
         フィルタが指定されない場合は全ての録音を返します。
+        ページ単位で取得する場合は limit と before（または offset）を指定します。
         
         Args:
             start_date: 開始日時（この日時以降の録音を取得）
             end_date: 終了日時（この日時以前の録音を取得）
+            limit: 取得する最大件数（Noneの場合は無制限）
+            offset: 読み飛ばす件数
+            before: 前ページ最後の録音の (created_at, id)。指定するとそれより
+                古い録音のみを返す（キーセットページネーション）
         
         Returns:
             録音データモデルのリスト
@@ -87,6 +136,103 @@ class Storage(ABC):
         """
         pass
     
+    @abstractmethod
+    def iter_recordings(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        before: Optional[Tuple[datetime, str]] = None
+    ) -> Iterator[Recording]:
+        """
+        録音を1件ずつ取得するイテレータを返す
+        
+        list_recordings と同じ条件・順序で録音を返しますが、
+        全件をリストに展開せずに1件ずつ生成します。
+        
+        Args:
+            start_date: 開始日時（この日時以降の録音を取得）
+            end_date: 終了日時（この日時以前の録音を取得）
+            limit: 取得する最大件数（Noneの場合は無制限）
+            offset: 読み飛ばす件数
+            before: 前ページ最後の録音の (created_at, id)。指定するとそれより
+                古い録音のみを返す（キーセットページネーション）
+        
+        Yields:
+            録音データモデル
+        
+        Raises:
+            StorageError: 取得に失敗した場合
+        
+        Validates: Requirements 4.5
+        """
+        pass
+    
+    def iter_recording_summaries(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        before: Optional[Tuple[datetime, str]] = None
+    ) -> Iterator[Tuple]:
+        """
+        録音の概要を1件ずつ取得するイテレータを返す
+        
+        一覧表示に必要な列だけをタプルで返します。デフォルト実装は
+        iter_recordings から組み立てます。必要な列だけを読み出せる
+        ストレージはオーバーライドしてください。
+        
+        Args:
+            start_date: 開始日時（この日時以降の録音を取得）
+            end_date: 終了日時（この日時以前の録音を取得）
+            limit: 取得する最大件数（Noneの場合は無制限）
+            offset: 読み飛ばす件数
+            before: 前ページ最後の録音の (created_at, id)。指定するとそれより
+                古い録音のみを返す（キーセットページネーション）
+        
+        Yields:
+            (id, call_uuid, caller_number, recording_url, duration,
+            created_at, status) のタプル
+        
+        Raises:
+            StorageError: 取得に失敗した場合
+        
+        Validates: Requirements 4.5
+        """
+        for recording in self.iter_recordings(start_date, end_date, limit, offset, before):
+            yield (
+                recording.id,
+                recording.call_uuid,
+                recording.caller_number,
+                recording.recording_url,
+                recording.duration,
+                recording.created_at,
+                recording.status
+            )
+    
+    @abstractmethod
+    def count_recordings(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        """
+        録音件数を取得
+        
+        Args:
+            start_date: 開始日時（この日時以降の録音を対象）
+            end_date: 終了日時（この日時以前の録音を対象）
+        
+        Returns:
+            条件に一致する録音の件数
+        
+        Raises:
+            StorageError: 取得に失敗した場合
+        """
+        pass
+    
     @abstractmethod
     def save_call_log(self, call_log: CallLog) -> None:
         """
@@ -149,9 +295,157 @@ class Storage(ABC):
         pass
 
 
+import operator
+import queue
 import sqlite3
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Callable, Generator
+
+
+# 接続ごとに設定するPRAGMA
+# synchronous=NORMAL はWALモードではコミットごとのfsyncを省略しても整合性が保たれる
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# 接続ごとのプリペアドステートメントキャッシュの大きさ
+# 接続はプールで使い回すため、固定SQLの解析は接続ごとに初回のみとなる
+_STATEMENT_CACHE_SIZE = 256
+
+
+# テーブル・インデックス定義（DDLは1つのトランザクションとしてまとめて実行する）
+# カバリングインデックスと重複する旧インデックス idx_recordings_created_at は
+# 書き込みコストになるため削除する
+_SCHEMA_SQL = """
+BEGIN;
+CREATE TABLE IF NOT EXISTS recordings (
+    id VARCHAR(36) PRIMARY KEY,
+    call_uuid VARCHAR(36) NOT NULL,
+    conversation_uuid VARCHAR(36) NOT NULL,
+    caller_number VARCHAR(20) NOT NULL,
+    called_number VARCHAR(20) NOT NULL,
+    recording_url TEXT NOT NULL,
+    recording_uuid VARCHAR(36) NOT NULL,
+    duration INTEGER NOT NULL,
+    file_size INTEGER NOT NULL,
+    format VARCHAR(10) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    local_file_path TEXT,
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS call_logs (
+    id VARCHAR(36) PRIMARY KEY,
+    call_uuid VARCHAR(36) NOT NULL,
+    caller_number VARCHAR(20) NOT NULL,
+    called_number VARCHAR(20) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    direction VARCHAR(10) NOT NULL,
+    started_at INTEGER NOT NULL,
+    ended_at INTEGER,
+    created_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_recordings_call_uuid ON recordings(call_uuid);
+DROP INDEX IF EXISTS idx_recordings_created_at;
+-- 日付範囲の絞り込みと並び替えをインデックスだけで完結させるカバリングインデックス
+CREATE INDEX IF NOT EXISTS idx_rec_created_covering
+ON recordings(created_at DESC, call_uuid, id);
+CREATE INDEX IF NOT EXISTS idx_call_logs_call_uuid ON call_logs(call_uuid);
+COMMIT;
+"""
+
+
+_INSERT_RECORDING_SQL = """
+INSERT OR REPLACE INTO recordings (
+    id, call_uuid, conversation_uuid, caller_number, called_number,
+    recording_url, recording_uuid, duration, file_size, format,
+    status, local_file_path, created_at, updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_CALL_LOG_SQL = """
+INSERT OR REPLACE INTO call_logs (
+    id, call_uuid, caller_number, called_number, status,
+    direction, started_at, ended_at, created_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_RECORDING_LOCAL_FILE_PATH_SQL = """
+UPDATE recordings
+SET local_file_path = ?
+WHERE id = ?
+"""
+
+_UPDATE_CALL_LOG_STATUS_SQL = """
+UPDATE call_logs
+SET status = ?, ended_at = ?
+WHERE call_uuid = ?
+"""
+
+# RETURNING句は SQLite 3.35 以降で利用可能
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# 更新後の行を返し、再読み込みなしでキャッシュを更新する
+_UPDATE_CALL_LOG_STATUS_RETURNING_SQL = _UPDATE_CALL_LOG_STATUS_SQL.rstrip() + """
+RETURNING id, call_uuid, caller_number, called_number, status,
+          direction, started_at, ended_at, created_at
+"""
+
+# INSERT文のパラメータ順に属性を取り出す（日時カラムは別途変換して連結する）
+_recording_fields = operator.attrgetter(
+    "id", "call_uuid", "conversation_uuid", "caller_number", "called_number",
+    "recording_url", "recording_uuid", "duration", "file_size", "format",
+    "status", "local_file_path"
+)
+_call_log_fields = operator.attrgetter(
+    "id", "call_uuid", "caller_number", "called_number", "status", "direction"
+)
+
+
+# 日時カラムを持つテーブルとカラム名（epochミリ秒の整数で保存する）
+_TIMESTAMP_COLUMNS = {
+    "recordings": ("created_at", "updated_at"),
+    "call_logs": ("started_at", "ended_at", "created_at"),
+}
+
+
+def _to_epoch_ms(value: datetime) -> int:
+    """
+    datetimeをepochミリ秒に変換
+    
+    タイムゾーン情報のないdatetimeはUTCとして扱います
+    （アプリケーションは datetime.utcnow() などUTCの日時を保存するため）。
+    
+    Args:
+        value: 変換する日時
+    
+    Returns:
+        UNIXエポックからのミリ秒
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return round(value.timestamp() * 1000)
+
+
+def _from_epoch_ms(value: int) -> datetime:
+    """
+    epochミリ秒をUTCのdatetimeに変換
+    
+    保存時と同じ時点を表すタイムゾーン付きのdatetimeを返すため、
+    夏時間の切り替え前後でも時刻が曖昧になりません。
+    
+    Args:
+        value: UNIXエポックからのミリ秒
+    
+    Returns:
+        タイムゾーン情報 (UTC) 付きのdatetime
+    """
+    return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
 
 
 class StorageError(Exception):
@@ -163,6 +457,78 @@ class StorageError(Exception):
     pass
 
 
+class _LRUCache:
+    """
+    スレッドセーフな簡易LRUキャッシュ
+    
+    読み込み中に無効化が発生した場合に古い値を格納しないよう、
+    無効化のたびに世代番号を進め、読み込み開始時の世代と一致する場合のみ格納します。
+    """
+    
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Tuple[Any, int]:
+        """キャッシュされた値（なければNone）と現在の世代番号を返す"""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value, self._generation
+    
+    def put(self, key: str, value: Any, generation: int) -> None:
+        """get 時点から無効化が発生していなければ値を格納する"""
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+    
+    def replace(self, key: str, value: Any, generation: int) -> None:
+        """
+        書き込み後の値で置き換える
+        
+        get 時点から無効化が発生していた場合は、値を格納せずに破棄する。
+        いずれの場合も世代番号を進め、読み込み中の古い値が格納されないようにする。
+        """
+        with self._lock:
+            matched = generation == self._generation
+            self._generation += 1
+            if matched and self._maxsize > 0:
+                self._data[key] = value
+                self._data.move_to_end(key)
+                if len(self._data) > self._maxsize:
+                    self._data.popitem(last=False)
+            else:
+                self._data.pop(key, None)
+    
+    def invalidate(self, key: str) -> None:
+        """指定したキーの値を破棄する"""
+        with self._lock:
+            self._generation += 1
+            self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """すべての値を破棄する"""
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+    
+    def invalidate_where(self, predicate: Callable[[Any], bool]) -> None:
+        """条件に一致する値を破棄する"""
+        with self._lock:
+            self._generation += 1
+            for key in [k for k, v in self._data.items() if predicate(v)]:
+                del self._data[key]
+
+
 class SQLiteStorage(Storage):
     """
     SQLite実装
@@ -176,101 +542,199 @@ class SQLiteStorage(Storage):
         - Requirements 4.5: 日付フィルタリング付きで全録音を一覧表示する方法を提供
     """
     
-    def __init__(self, db_path: str = "voice_recorder.db"):
+    def __init__(
+        self,
+        db_path: str = "voice_recorder.db",
+        pool_size: int = 8,
+        cache_size: int = 1024,
+        uri: bool = False
+    ):
         """
         SQLiteStorageを初期化
         
+        get_recording / get_call_log の結果は通話UUIDごとにLRUキャッシュし、
+        このインスタンスを通じた保存・更新時に破棄します。
+        データベースへの書き込みがこのインスタンスに限られることを前提とします。
+        
         Args:
             db_path: SQLiteデータベースファイルのパス
+            pool_size: 再利用のために保持する接続の最大数
+            cache_size: キャッシュする録音・通話ログそれぞれの最大件数（0で無効）
+            uri: db_path を SQLite の URI として解釈するか
+                （例: "file:test?mode=memory&cache=shared" で接続間で共有するインメモリDB）
         """
         self.db_path = db_path
+        self.uri = uri
+        # 使い終わった接続を保持し、ページキャッシュを温めたまま再利用する
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=pool_size)
+        # batch() 実行中のスレッドごとの接続
+        self._local = threading.local()
+        # 通話UUIDをキーとした取得結果のキャッシュ
+        self._recording_cache = _LRUCache(cache_size)
+        self._call_log_cache = _LRUCache(cache_size)
         self._create_tables()
     
+    @contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """
+        書き込みをまとめて1つのトランザクションで実行するコンテキストマネージャー
+        
+        ブロック内の保存・更新は同じ接続を使い、コミットはブロックの
+        終了時に1回だけ行います。例外が発生した場合はロールバックします。
+        バッチはスレッドごとに独立しています。
+        
+        Raises:
+            StorageError: コミットに失敗した場合
+        """
+        if self._batch_connection() is not None:
+            # ネストしたバッチは外側のトランザクションに含める
+            yield
+            return
+        
+        with self._get_connection() as conn:
+            self._local.batch_conn = conn
+            try:
+                yield
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                self._local.batch_conn = None
+                # バッチ中の書き込みはコミットまで他の接続から見えないため、
+                # その間にキャッシュされた値を含めて破棄する
+                self._recording_cache.clear()
+                self._call_log_cache.clear()
+    
+    def _batch_connection(self) -> Optional[sqlite3.Connection]:
+        """現在のスレッドで batch() 実行中であればその接続を返す"""
+        return getattr(self._local, "batch_conn", None)
+    
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        """batch() 実行中でなければコミットする"""
+        if self._batch_connection() is None:
+            conn.commit()
+    
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
         """
         データベース接続のコンテキストマネージャー
         
+        batch() 実行中は、そのバッチの接続をそのまま返します。
+        
         Yields:
             SQLite接続オブジェクト
         
         Raises:
             StorageError: 接続に失敗した場合
         """
+        batch_conn = self._batch_connection()
+        if batch_conn is not None:
+            yield batch_conn
+            return
+        
         conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
             yield conn
         except sqlite3.Error as e:
             raise StorageError(f"Database connection error: {e}") from e
         finally:
             if conn:
-                conn.close()
+                self._release_connection(conn)
     
-    def _create_tables(self) -> None:
+    def _connect(self) -> sqlite3.Connection:
         """
-        データベーステーブルを作成
+        新しいSQLite接続を作成
         
-        Recording と CallLog テーブルが存在しない場合に作成します。
+        接続はプールを介して複数のスレッドで使い回されるため、
+        check_same_thread を無効にします（同時に使うのは常に1スレッドのみ）。
         
-        Raises:
-            StorageError: テーブル作成に失敗した場合
+        Returns:
+            SQLite接続オブジェクト
         """
-        create_recording_table = """
-        CREATE TABLE IF NOT EXISTS recordings (
-            id VARCHAR(36) PRIMARY KEY,
-            call_uuid VARCHAR(36) NOT NULL,
-            conversation_uuid VARCHAR(36) NOT NULL,
-            caller_number VARCHAR(20) NOT NULL,
-            called_number VARCHAR(20) NOT NULL,
-            recording_url TEXT NOT NULL,
-            recording_uuid VARCHAR(36) NOT NULL,
-            duration INTEGER NOT NULL,
-            file_size INTEGER NOT NULL,
-            format VARCHAR(10) NOT NULL,
-            status VARCHAR(20) NOT NULL,
-            local_file_path TEXT,
-            created_at TIMESTAMP NOT NULL,
-            updated_at TIMESTAMP NOT NULL
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            uri=self.uri,
+            cached_statements=_STATEMENT_CACHE_SIZE
         )
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def _release_connection(self, conn: sqlite3.Connection) -> None:
         """
+        使用済みの接続をプールに戻す
         
-        create_call_log_table = """
-        CREATE TABLE IF NOT EXISTS call_logs (
-            id VARCHAR(36) PRIMARY KEY,
-            call_uuid VARCHAR(36) NOT NULL,
-            caller_number VARCHAR(20) NOT NULL,
-            called_number VARCHAR(20) NOT NULL,
-            status VARCHAR(20) NOT NULL,
-            direction VARCHAR(10) NOT NULL,
-            started_at TIMESTAMP NOT NULL,
-            ended_at TIMESTAMP,
-            created_at TIMESTAMP NOT NULL
-        )
+        未コミットのトランザクションはロールバックし、
+        プールが満杯の場合や接続が壊れている場合は閉じます。
         """
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._pool.put_nowait(conn)
+        except (sqlite3.Error, queue.Full):
+            conn.close()
+    
+    def reset(self) -> None:
+        """
+        すべての録音と通話ログを削除し、キャッシュを破棄する
+        
+        テーブル定義は残したまま中身だけを空にします。
         
-        # Create indexes for common queries
-        create_recording_call_uuid_index = """
-        CREATE INDEX IF NOT EXISTS idx_recordings_call_uuid ON recordings(call_uuid)
+        Raises:
+            StorageError: 削除に失敗した場合
         """
+        try:
+            with self._get_connection() as conn:
+                conn.execute("DELETE FROM recordings")
+                conn.execute("DELETE FROM call_logs")
+                self._commit(conn)
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to reset storage: {e}") from e
         
-        create_recording_created_at_index = """
-        CREATE INDEX IF NOT EXISTS idx_recordings_created_at ON recordings(created_at)
+        self._recording_cache.clear()
+        self._call_log_cache.clear()
+    
+    def close(self) -> None:
         """
+        プールに保持している接続をすべて閉じる
         
-        create_call_log_call_uuid_index = """
-        CREATE INDEX IF NOT EXISTS idx_call_logs_call_uuid ON call_logs(call_uuid)
+        閉じる前に PRAGMA optimize を実行し、クエリプランナー用の統計情報を更新します。
+        """
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            conn.close()
+    
+    def _create_tables(self) -> None:
         """
+        データベーステーブルを作成
+        
+        Recording と CallLog テーブルが存在しない場合に作成します。
         
+        Raises:
+            StorageError: テーブル作成に失敗した場合
+        """
         try:
             with self._get_connection() as conn:
+                # WALモードはデータベースファイルに保存されるため初期化時に1回だけ設定する
+                # （読み取りが書き込みをブロックしなくなる）
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA_SQL)
+                
                 cursor = conn.cursor()
-                cursor.execute(create_recording_table)
-                cursor.execute(create_call_log_table)
-                cursor.execute(create_recording_call_uuid_index)
-                cursor.execute(create_recording_created_at_index)
-                cursor.execute(create_call_log_call_uuid_index)
                 
                 # 既存テーブルにlocal_file_pathカラムがない場合は追加（マイグレーション）
                 try:
@@ -279,10 +743,37 @@ class SQLiteStorage(Storage):
                     # カラムが既に存在する場合は無視
                     pass
                 
+                self._migrate_timestamps(cursor)
+                
                 conn.commit()
         except sqlite3.Error as e:
             raise StorageError(f"Failed to create tables: {e}") from e
     
+    def _migrate_timestamps(self, cursor: sqlite3.Cursor) -> None:
+        """
+        ISO 8601文字列で保存された日時をepochミリ秒に変換（マイグレーション）
+        
+        旧スキーマのTIMESTAMP型カラムはNUMERIC型アフィニティのため、
+        テーブルを作り直さずに整数値へ置き換えられます。
+        
+        Args:
+            cursor: マイグレーションを実行するカーソル
+        """
+        for table, columns in _TIMESTAMP_COLUMNS.items():
+            for column in columns:
+                rows = cursor.execute(
+                    f"SELECT rowid, {column} FROM {table} WHERE typeof({column}) = 'text'"
+                ).fetchall()
+                if not rows:
+                    continue
+                cursor.executemany(
+                    f"UPDATE {table} SET {column} = ? WHERE rowid = ?",
+                    [
+                        (_to_epoch_ms(datetime.fromisoformat(value)), rowid)
+                        for rowid, value in rows
+                    ]
+                )
+    
     def save_recording(self, recording: Recording) -> None:
         """
         録音メタデータを保存
@@ -298,36 +789,93 @@ class SQLiteStorage(Storage):
         
         Validates: Requirements 4.1
         """
-        sql = """
-        INSERT OR REPLACE INTO recordings (
-            id, call_uuid, conversation_uuid, caller_number, called_number,
-            recording_url, recording_uuid, duration, file_size, format,
-            status, local_file_path, created_at, updated_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        try:
+            with self._get_connection() as conn:
+                conn.execute(_INSERT_RECORDING_SQL, self._recording_to_params(recording))
+                self._commit(conn)
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to save recording: {e}") from e
+        
+        self._recording_cache.invalidate(recording.call_uuid)
+    
+    def save_recordings(self, recordings: List[Recording]) -> None:
+        """
+        複数の録音メタデータをまとめて保存
+        
+        1つの接続で executemany を実行し、コミットは1回だけ行います。
+        
+        Args:
+            recordings: 保存する録音データモデルのリスト
+        
+        Raises:
+            StorageError: 保存に失敗した場合
+        
+        Validates: Requirements 4.1
         """
+        if not recordings:
+            return
         
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(sql, (
-                    recording.id,
-                    recording.call_uuid,
-                    recording.conversation_uuid,
-                    recording.caller_number,
-                    recording.called_number,
-                    recording.recording_url,
-                    recording.recording_uuid,
-                    recording.duration,
-                    recording.file_size,
-                    recording.format,
-                    recording.status,
-                    recording.local_file_path,
-                    recording.created_at.isoformat(),
-                    recording.updated_at.isoformat()
-                ))
-                conn.commit()
+                conn.executemany(
+                    _INSERT_RECORDING_SQL,
+                    [self._recording_to_params(r) for r in recordings]
+                )
+                self._commit(conn)
         except sqlite3.Error as e:
-            raise StorageError(f"Failed to save recording: {e}") from e
+            raise StorageError(f"Failed to save recordings: {e}") from e
+        
+        call_uuids = {r.call_uuid for r in recordings}
+        self._recording_cache.invalidate_where(lambda r: r.call_uuid in call_uuids)
+    
+    def update_recording_local_file_path(
+        self,
+        recording_id: str,
+        local_file_path: str
+    ) -> bool:
+        """
+        録音のローカルファイルパスを更新
+        
+        録音ファイルのダウンロード完了後に呼び出されます。
+        
+        Args:
+            recording_id: 録音ID
+            local_file_path: ローカルに保存されたファイルパス
+        
+        Returns:
+            更新が成功した場合はTrue、録音が見つからない場合はFalse
+        
+        Raises:
+            StorageError: 更新に失敗した場合
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute(
+                    _UPDATE_RECORDING_LOCAL_FILE_PATH_SQL,
+                    (local_file_path, recording_id)
+                )
+                self._commit(conn)
+                updated = cursor.rowcount > 0
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to update recording local file path: {e}") from e
+        
+        self._recording_cache.invalidate_where(lambda r: r.id == recording_id)
+        return updated
+    
+    def _recording_to_params(self, recording: Recording) -> Tuple:
+        """
+        RecordingオブジェクトをINSERT文のパラメータに変換
+        
+        Args:
+            recording: Recording データモデル
+        
+        Returns:
+            INSERT文のパラメータのタプル
+        """
+        return _recording_fields(recording) + (
+            _to_epoch_ms(recording.created_at),
+            _to_epoch_ms(recording.updated_at)
+        )
     
     def get_recording(self, call_uuid: str) -> Optional[Recording]:
         """
@@ -354,6 +902,10 @@ class SQLiteStorage(Storage):
         WHERE call_uuid = ?
         """
         
+        cached, generation = self._recording_cache.get(call_uuid)
+        if cached is not None:
+            return cached
+        
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
@@ -363,24 +915,36 @@ class SQLiteStorage(Storage):
                 if row is None:
                     return None
                 
-                return self._row_to_recording(row)
+                recording = self._row_to_recording(row)
         except sqlite3.Error as e:
             raise StorageError(f"Failed to get recording: {e}") from e
+        
+        if self._batch_connection() is None:
+            self._recording_cache.put(call_uuid, recording, generation)
+        return recording
     
     def list_recordings(
         self,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        before: Optional[Tuple[datetime, str]] = None
     ) -> List[Recording]:
         """
         録音一覧を取得
         
         オプションの日付範囲フィルタを使用して録音の一覧を取得します。
         フィルタが指定されない場合は全ての録音を返します。
+        ページ単位で取得する場合は limit と before（または offset）を指定します。
         
         Args:
             start_date: 開始日時（この日時以降の録音を取得）
             end_date: 終了日時（この日時以前の録音を取得）
+            limit: 取得する最大件数（Noneの場合は無制限）
+            offset: 読み飛ばす件数
+            before: 前ページ最後の録音の (created_at, id)。指定するとそれより
+                古い録音のみを返す（キーセットページネーション）
         
         Returns:
             録音データモデルのリスト
@@ -390,39 +954,217 @@ class SQLiteStorage(Storage):
         
         Validates: Requirements 4.5
         """
-        sql = """
-        SELECT id, call_uuid, conversation_uuid, caller_number, called_number,
-               recording_url, recording_uuid, duration, file_size, format,
-               status, local_file_path, created_at, updated_at
-        FROM recordings
+        return list(self.iter_recordings(
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            offset=offset,
+            before=before
+        ))
+    
+    def iter_recordings(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        before: Optional[Tuple[datetime, str]] = None
+    ) -> Iterator[Recording]:
         """
+        録音を1件ずつ取得するイテレータを返す
         
-        conditions = []
-        params: List[str] = []
+        カーソルから行を順に読み出してRecordingに変換するため、
+        全件をメモリに展開しません。LIMIT/OFFSETはSQL側で適用します。
         
-        if start_date is not None:
-            conditions.append("created_at >= ?")
-            params.append(start_date.isoformat())
+        Args:
+            start_date: 開始日時（この日時以降の録音を取得）
+            end_date: 終了日時（この日時以前の録音を取得）
+            limit: 取得する最大件数（Noneの場合は無制限）
+            offset: 読み飛ばす件数
+            before: 前ページ最後の録音の (created_at, id)。指定するとそれより
+                古い録音のみを返す（キーセットページネーション）
         
-        if end_date is not None:
-            conditions.append("created_at <= ?")
-            params.append(end_date.isoformat())
+        Yields:
+            録音データモデル
         
-        if conditions:
-            sql += " WHERE " + " AND ".join(conditions)
+        Raises:
+            StorageError: 取得に失敗した場合
         
-        sql += " ORDER BY created_at DESC"
+        Validates: Requirements 4.5
+        """
+        sql, params = self._build_recordings_query(
+            """
+            SELECT id, call_uuid, conversation_uuid, caller_number, called_number,
+                   recording_url, recording_uuid, duration, file_size, format,
+                   status, local_file_path, created_at, updated_at
+            FROM recordings
+            """,
+            start_date, end_date, limit, offset, before
+        )
         
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(sql, params)
-                rows = cursor.fetchall()
-                
-                return [self._row_to_recording(row) for row in rows]
+                for row in cursor:
+                    yield self._row_to_recording(row)
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to list recordings: {e}") from e
+    
+    def iter_recording_summaries(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        before: Optional[Tuple[datetime, str]] = None
+    ) -> Iterator[Tuple]:
+        """
+        録音の概要を1件ずつ取得するイテレータを返す
+        
+        一覧表示に必要な列だけをSELECTするため、Recordingオブジェクトを
+        生成せずに読み出す行も小さくなります。
+        
+        Args:
+            start_date: 開始日時（この日時以降の録音を取得）
+            end_date: 終了日時（この日時以前の録音を取得）
+            limit: 取得する最大件数（Noneの場合は無制限）
+            offset: 読み飛ばす件数
+            before: 前ページ最後の録音の (created_at, id)。指定するとそれより
+                古い録音のみを返す（キーセットページネーション）
+        
+        Yields:
+            (id, call_uuid, caller_number, recording_url, duration,
+            created_at, status) のタプル
+        
+        Raises:
+            StorageError: 取得に失敗した場合
+        
+        Validates: Requirements 4.5
+        """
+        sql, params = self._build_recordings_query(
+            """
+            SELECT id, call_uuid, caller_number, recording_url, duration,
+                   created_at, status
+            FROM recordings
+            """,
+            start_date, end_date, limit, offset, before
+        )
+        
+        try:
+            with self._get_connection() as conn:
+                for id_, call_uuid, caller_number, url, duration, created_at, status in (
+                    conn.execute(sql, params)
+                ):
+                    yield (
+                        id_, call_uuid, caller_number, url, duration,
+                        _from_epoch_ms(created_at), status
+                    )
         except sqlite3.Error as e:
             raise StorageError(f"Failed to list recordings: {e}") from e
     
+    def count_recordings(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        """
+        録音件数を取得
+        
+        Args:
+            start_date: 開始日時（この日時以降の録音を対象）
+            end_date: 終了日時（この日時以前の録音を対象）
+        
+        Returns:
+            条件に一致する録音の件数
+        
+        Raises:
+            StorageError: 取得に失敗した場合
+        """
+        where, params = self._build_date_filter(start_date, end_date)
+        sql = "SELECT COUNT(*) FROM recordings" + where
+        
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(sql, params)
+                return cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to count recordings: {e}") from e
+    
+    def _build_recordings_query(
+        self,
+        select: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        limit: Optional[int],
+        offset: int,
+        before: Optional[Tuple[datetime, str]] = None
+    ) -> Tuple[str, List]:
+        """
+        録音一覧取得用のSQLとパラメータを構築
+        
+        日付フィルタ、キーセットページネーションの条件、
+        作成日時の降順ソート（同時刻はIDの降順）、LIMIT/OFFSETを付加します。
+        
+        Args:
+            select: SELECT句とFROM句
+            start_date: 開始日時
+            end_date: 終了日時
+            limit: 取得する最大件数（Noneの場合は無制限）
+            offset: 読み飛ばす件数
+            before: 前ページ最後の録音の (created_at, id)
+        
+        Returns:
+            (SQL文, パラメータのリスト) のタプル
+        """
+        where, params = self._build_date_filter(start_date, end_date)
+        
+        if before is not None:
+            # created_at の範囲条件でインデックスを使ってシークし、同時刻の行はIDで区切る
+            before_ms = _to_epoch_ms(before[0])
+            where += (" AND " if where else " WHERE ") + (
+                "created_at <= ? AND (created_at < ? OR id < ?)"
+            )
+            params.extend([before_ms, before_ms, before[1]])
+        
+        sql = select + where + " ORDER BY created_at DESC, id DESC"
+        
+        if limit is not None or offset:
+            # SQLiteではOFFSETにLIMITが必須のため、無制限は-1で指定する
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit if limit is not None else -1, offset])
+        
+        return sql, params
+    
+    def _build_date_filter(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Tuple[str, List]:
+        """
+        録音の日付範囲フィルタ用WHERE句とパラメータを構築
+        
+        Args:
+            start_date: 開始日時
+            end_date: 終了日時
+        
+        Returns:
+            (WHERE句（条件がない場合は空文字列）, パラメータのリスト) のタプル
+        """
+        if start_date is not None and end_date is not None:
+            return " WHERE created_at BETWEEN ? AND ?", [
+                _to_epoch_ms(start_date), _to_epoch_ms(end_date)
+            ]
+        
+        if start_date is not None:
+            return " WHERE created_at >= ?", [_to_epoch_ms(start_date)]
+        
+        if end_date is not None:
+            return " WHERE created_at <= ?", [_to_epoch_ms(end_date)]
+        
+        return "", []
+    
     def save_call_log(self, call_log: CallLog) -> None:
         """
         通話ログを保存
@@ -437,30 +1179,18 @@ class SQLiteStorage(Storage):
         Raises:
             StorageError: 保存に失敗した場合
         """
-        sql = """
-        INSERT OR REPLACE INTO call_logs (
-            id, call_uuid, caller_number, called_number, status,
-            direction, started_at, ended_at, created_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(sql, (
-                    call_log.id,
-                    call_log.call_uuid,
-                    call_log.caller_number,
-                    call_log.called_number,
-                    call_log.status,
-                    call_log.direction,
-                    call_log.started_at.isoformat(),
-                    call_log.ended_at.isoformat() if call_log.ended_at else None,
-                    call_log.created_at.isoformat()
+                conn.execute(_INSERT_CALL_LOG_SQL, _call_log_fields(call_log) + (
+                    _to_epoch_ms(call_log.started_at),
+                    _to_epoch_ms(call_log.ended_at) if call_log.ended_at else None,
+                    _to_epoch_ms(call_log.created_at)
                 ))
-                conn.commit()
+                self._commit(conn)
         except sqlite3.Error as e:
             raise StorageError(f"Failed to save call log: {e}") from e
+        
+        self._call_log_cache.invalidate(call_log.call_uuid)
     
     def _row_to_recording(self, row: sqlite3.Row) -> Recording:
         """
@@ -472,6 +1202,15 @@ class SQLiteStorage(Storage):
         Returns:
             Recording データモデル
         """
+        # 新規作成された行は作成日時と更新日時が同じため、変換を1回で済ませる
+        # （datetimeは不変なので同じオブジェクトを共有してよい）
+        created_at_ms = row["created_at"]
+        created_at = _from_epoch_ms(created_at_ms)
+        updated_at_ms = row["updated_at"]
+        updated_at = (
+            created_at if updated_at_ms == created_at_ms else _from_epoch_ms(updated_at_ms)
+        )
+        
         return Recording(
             id=row["id"],
             call_uuid=row["call_uuid"],
@@ -485,8 +1224,8 @@ class SQLiteStorage(Storage):
             format=row["format"],
             status=row["status"],
             local_file_path=row["local_file_path"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"])
+            created_at=created_at,
+            updated_at=updated_at
         )
     
     def get_call_log(self, call_uuid: str) -> Optional[CallLog]:
@@ -511,6 +1250,10 @@ class SQLiteStorage(Storage):
         WHERE call_uuid = ?
         """
         
+        cached, generation = self._call_log_cache.get(call_uuid)
+        if cached is not None:
+            return cached
+        
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
@@ -520,9 +1263,13 @@ class SQLiteStorage(Storage):
                 if row is None:
                     return None
                 
-                return self._row_to_call_log(row)
+                call_log = self._row_to_call_log(row)
         except sqlite3.Error as e:
             raise StorageError(f"Failed to get call log: {e}") from e
+        
+        if self._batch_connection() is None:
+            self._call_log_cache.put(call_uuid, call_log, generation)
+        return call_log
     
     def _row_to_call_log(self, row: sqlite3.Row) -> CallLog:
         """
@@ -534,6 +1281,15 @@ class SQLiteStorage(Storage):
         Returns:
             CallLog データモデル
         """
+        # 通話開始時に保存された行は開始日時と作成日時が同じため、変換を1回で済ませる
+        started_at_ms = row["started_at"]
+        started_at = _from_epoch_ms(started_at_ms)
+        created_at_ms = row["created_at"]
+        created_at = (
+            started_at if created_at_ms == started_at_ms else _from_epoch_ms(created_at_ms)
+        )
+        ended_at_ms = row["ended_at"]
+        
         return CallLog(
             id=row["id"],
             call_uuid=row["call_uuid"],
@@ -541,9 +1297,9 @@ class SQLiteStorage(Storage):
             called_number=row["called_number"],
             status=row["status"],
             direction=row["direction"],
-            started_at=datetime.fromisoformat(row["started_at"]),
-            ended_at=datetime.fromisoformat(row["ended_at"]) if row["ended_at"] else None,
-            created_at=datetime.fromisoformat(row["created_at"])
+            started_at=started_at,
+            ended_at=_from_epoch_ms(ended_at_ms) if ended_at_ms is not None else None,
+            created_at=created_at
         )
     
     def update_call_log_status(
@@ -570,26 +1326,30 @@ class SQLiteStorage(Storage):
         
         Validates: Requirements 3.6
         """
-        # まず通話ログが存在するか確認
-        existing_log = self.get_call_log(call_uuid)
-        if existing_log is None:
-            return False
-        
-        sql = """
-        UPDATE call_logs
-        SET status = ?, ended_at = ?
-        WHERE call_uuid = ?
-        """
-        
+        # 事前のSELECTは行わず、更新された行で通話ログの有無を判定する
+        # RETURNING句が使える場合は更新後の行でキャッシュを置き換え、直後の取得を省く
+        params = (
+            status,
+            _to_epoch_ms(ended_at) if ended_at else None,
+            call_uuid
+        )
+        _, generation = self._call_log_cache.get(call_uuid)
+        rows: List[sqlite3.Row] = []
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(sql, (
-                    status,
-                    ended_at.isoformat() if ended_at else None,
-                    call_uuid
-                ))
-                conn.commit()
-                return cursor.rowcount > 0
+                if _SUPPORTS_RETURNING:
+                    rows = conn.execute(_UPDATE_CALL_LOG_STATUS_RETURNING_SQL, params).fetchall()
+                    updated = bool(rows)
+                else:
+                    cursor = conn.execute(_UPDATE_CALL_LOG_STATUS_SQL, params)
+                    updated = cursor.rowcount > 0
+                self._commit(conn)
         except sqlite3.Error as e:
             raise StorageError(f"Failed to update call log status: {e}") from e
+        
+        # 同じ通話UUIDの行が複数ある場合やバッチ中（未コミット）はキャッシュを破棄する
+        if len(rows) == 1 and self._batch_connection() is None:
+            self._call_log_cache.replace(call_uuid, self._row_to_call_log(rows[0]), generation)
+        else:
+            self._call_log_cache.invalidate(call_uuid)
+        return updated
@@ -2,208 +2,492 @@
 音楽生成機能のテストスクリプト
 
 使用方法:
-    python test_music_generator.py [音声ファイルパス]
+    python test_music_generator.py [オプション] [音声ファイルパス ...]
     
 例:
     python test_music_generator.py recordings/test.mp3
+    python test_music_generator.py "recordings/*.mp3" --phone 818012345678
+    python test_music_generator.py recordings/
+    python test_music_generator.py --transcribe-only "recordings/*.mp3"
+
+各テストは asyncio のコルーチンとして実行され、複数ファイルを指定した場合は並行して処理します。
 """
 
+import argparse
+import asyncio
+import functools
+import glob
+import hashlib
+import json
+import logging
 import os
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
+from src.music_generator import MusicGenerator, MusicGeneratorError
+
 # .envファイルを読み込み
 load_dotenv()
 
-def test_transcription_only(audio_file: str):
-    """音声認識のみテスト"""
-    from src.music_generator import MusicGenerator
-    
-    print("=" * 50)
-    print("音声認識テスト")
-    print("=" * 50)
-    
-    mg = MusicGenerator(
-        openai_api_key=os.getenv('OPENAI_API_KEY'),
-        udio_api_key=os.getenv('UDIO_API_KEY'),
-        vonage_api_key=os.getenv('VONAGE_API_KEY'),
-        vonage_api_secret=os.getenv('VONAGE_API_SECRET'),
-        vonage_from_number=os.getenv('VONAGE_SMS_FROM', '')
+DEFAULT_MUSIC_STYLE = 'rap, hip-hop, japanese, emotional, rhythmic'
+
+# ディレクトリ指定時に処理対象とする音声ファイルの拡張子
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.m4a')
+
+# 各テストの見出し（'asr_batch' はファイル数を引数に取る書式文字列）
+BAR = '=' * 50
+_BANNERS = {
+    'asr': f'{BAR}\n音声認識テスト\n{BAR}',
+    'asr_batch': f'{BAR}\n音声認識テスト（%dファイル）\n{BAR}',
+    'gen': f'\n{BAR}\n音楽生成テスト (Udio API)\n{BAR}',
+    'full': f'\n{BAR}\nフルパイプラインテスト\n{BAR}',
+    'env': f'{BAR}\n環境変数チェック\n{BAR}',
+}
+
+# 音声認識・音楽生成結果のキャッシュ（再実行時にAPI呼び出しを省略する）
+CACHE_DIR = Path('.cache')
+
+
+def _env(name: str, required: bool = False):
+    """環境変数名と必須フラグをメタデータに持つフィールドを定義"""
+    return field(default=None, metadata={'env': name, 'required': required})
+
+
+@dataclass(frozen=True)
+class ScriptConfig:
+    """スクリプトが参照する環境変数（起動時に一度だけ読み込む）"""
+    openai_api_key: Optional[str] = _env('OPENAI_API_KEY', required=True)
+    udio_api_key: Optional[str] = _env('UDIO_API_KEY', required=True)
+    vonage_api_key: Optional[str] = _env('VONAGE_API_KEY', required=True)
+    vonage_api_secret: Optional[str] = _env('VONAGE_API_SECRET', required=True)
+    vonage_sms_from: Optional[str] = _env('VONAGE_SMS_FROM')
+    music_style: Optional[str] = _env('MUSIC_STYLE')
+    enable_music_generation: Optional[str] = _env('ENABLE_MUSIC_GENERATION')
+    test_phone_number: Optional[str] = _env('TEST_PHONE_NUMBER')
+    log_level: Optional[str] = _env('LOG_LEVEL')
+
+    @classmethod
+    def from_env(cls) -> 'ScriptConfig':
+        """環境変数から設定を読み込む"""
+        return cls(**{f.name: os.getenv(f.metadata['env']) for f in fields(cls)})
+
+
+CFG = ScriptConfig.from_env()
+
+# テスト結果の出力先（CIでは LOG_LEVEL=WARNING で情報出力を抑制できる）
+log = logging.getLogger('music_test')
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter('%(message)s'))
+log.addHandler(_log_handler)
+log.setLevel((CFG.log_level or 'INFO').upper())
+log.propagate = False
+
+# 必須環境変数に対応する ScriptConfig のフィールド名
+REQUIRED_FIELDS = tuple(f.name for f in fields(ScriptConfig) if f.metadata['required'])
+
+
+@functools.lru_cache(maxsize=1)
+def get_mg():
+    """テストで共有するMusicGeneratorを取得（初回呼び出し時に作成）"""
+    return MusicGenerator(
+        openai_api_key=CFG.openai_api_key,
+        udio_api_key=CFG.udio_api_key,
+        vonage_api_key=CFG.vonage_api_key,
+        vonage_api_secret=CFG.vonage_api_secret,
+        vonage_from_number=CFG.vonage_sms_from or ''
     )
-    
+
+
+def _file_sha256(path: str) -> str:
+    """ファイル内容のSHA-256（1MiBずつ読み込む）"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _text_sha256(*parts: str) -> str:
+    """文字列の組に対するSHA-256"""
+    return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+def cache_get(key: str) -> dict:
+    """キャッシュを読み込む（存在しない・壊れている場合は空のdict）"""
     try:
+        return json.loads((CACHE_DIR / f"{key}.json").read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def cache_put(key: str, **values) -> None:
+    """既存のキャッシュに値を追加して保存"""
+    CACHE_DIR.mkdir(exist_ok=True)
+    entry = {**cache_get(key), **values}
+    (CACHE_DIR / f"{key}.json").write_text(json.dumps(entry, ensure_ascii=False), encoding='utf-8')
+
+
+def cached_transcribe(mg: MusicGenerator, audio_file: str) -> str:
+    """音声ファイルのハッシュでキャッシュを確認し、なければWhisperで音声認識"""
+    # サイズと形式を先に確認し、無効なファイルはハッシュ計算もアップロードもしない
+    mg._validate_audio(audio_file)
+    key = _file_sha256(audio_file)
+    text = cache_get(key).get('text')
+    if text is None:
         text = mg.transcribe_audio(audio_file)
-        print(f"✅ 音声認識成功!")
-        print(f"認識結果: {text}")
-        print(f"文字数: {len(text)}")
+        cache_put(key, text=text)
+    return text
+
+
+async def test_transcription_only(audio_file: str):
+    """音声認識のみテスト"""
+    log.info(_BANNERS['asr'])
+    
+    mg = get_mg()
+    
+    try:
+        text = await asyncio.to_thread(cached_transcribe, mg, audio_file)
+        log.info("✅ 音声認識成功!\n認識結果: %s\n文字数: %d", text, len(text))
         return text
     except Exception as e:
-        print(f"❌ 音声認識失敗: {e}")
+        log.error("❌ 音声認識失敗: %s", e)
         return None
 
 
-def test_music_generation(lyrics: str):
+async def test_transcription_batch(audio_files: list, max_workers: int = 4):
+    """複数ファイルの音声認識をまとめてテスト"""
+    log.info(_BANNERS['asr_batch'], len(audio_files))
+    
+    mg = get_mg()
+    
+    # キャッシュにないファイルだけをまとめて音声認識する
+    keys = await asyncio.to_thread(lambda: [_file_sha256(f) for f in audio_files])
+    texts = [cache_get(key).get('text') for key in keys]
+    misses = [i for i, text in enumerate(texts) if text is None]
+    if misses:
+        results = await asyncio.to_thread(
+            mg.transcribe_audio_batch, [audio_files[i] for i in misses], max_workers
+        )
+        for i, text in zip(misses, results):
+            texts[i] = text
+            if text is not None:
+                cache_put(keys[i], text=text)
+    
+    for audio_file, text in zip(audio_files, texts):
+        if text is not None:
+            log.info("✅ %s: %s", audio_file, text)
+        else:
+            log.error("❌ %s: 音声認識失敗", audio_file)
+    
+    return texts
+
+
+async def test_music_generation(lyrics: str):
     """音楽生成のみテスト"""
-    from src.music_generator import MusicGenerator
-    
-    print("\n" + "=" * 50)
-    print("音楽生成テスト (Udio API)")
-    print("=" * 50)
-    
-    mg = MusicGenerator(
-        openai_api_key=os.getenv('OPENAI_API_KEY'),
-        udio_api_key=os.getenv('UDIO_API_KEY'),
-        vonage_api_key=os.getenv('VONAGE_API_KEY'),
-        vonage_api_secret=os.getenv('VONAGE_API_SECRET'),
-        vonage_from_number=os.getenv('VONAGE_SMS_FROM', '')
-    )
+    log.info(_BANNERS['gen'])
+    
+    mg = get_mg()
     
     # 歌詞をフォーマット
     formatted = mg._format_lyrics(lyrics)
-    print(f"フォーマット済み歌詞:\n{formatted}")
+    log.info("フォーマット済み歌詞:\n%s", formatted)
+    
+    music_style = CFG.music_style or DEFAULT_MUSIC_STYLE
+    log.info("\n音楽スタイル: %s", music_style)
     
-    music_style = os.getenv('MUSIC_STYLE', 'rap, hip-hop, japanese, emotional, rhythmic')
-    print(f"\n音楽スタイル: {music_style}")
+    cache_key = _text_sha256(lyrics, music_style)
+    cached = cache_get(cache_key)
+    if cached.get('music_url'):
+        log.info("✅ キャッシュ済みの音楽を使用 (workId: %s)\nURL: %s", cached.get('work_id'), cached['music_url'])
+        return cached['music_url']
     
     try:
-        print("\nUdio APIにリクエスト送信中...")
-        work_id = mg.generate_music(lyrics, style=music_style)
-        print(f"✅ タスク作成成功! workId: {work_id}")
-        
-        print("\n音楽生成完了を待機中...")
-        music_url = mg.wait_for_music(work_id, timeout=300, poll_interval=10)
+        # 同じ歌詞・スタイルの生成が並行して進行中なら、その結果を共有する
+        log.info("\nUdio APIで音楽を生成中...")
+        work_id, music_url = await mg.generate_music_async(
+            lyrics,
+            style=music_style,
+            timeout=300,
+            poll_schedule=mg.ADAPTIVE_POLL_SCHEDULE
+        )
+        log.info("workId: %s", work_id)
         
         if music_url:
-            print(f"✅ 音楽生成完了!")
-            print(f"URL: {music_url}")
+            log.info("✅ 音楽生成完了!\nURL: %s", music_url)
+            cache_put(cache_key, work_id=work_id, music_url=music_url)
+            
+            # 最初のチャンクから保存を始め、到着までの時間を完了時間と分けて表示
+            out_path = os.path.join(mg.music_dir, f"{work_id}.mp3")
+            os.makedirs(mg.music_dir, exist_ok=True)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            first_chunk_latency = None
+            total_bytes = 0
+            with open(out_path, 'wb') as out_file:
+                async for chunk in mg.stream_music(music_url):
+                    if first_chunk_latency is None:
+                        first_chunk_latency = loop.time() - start
+                        log.info("最初のチャンク受信: %.2f秒", first_chunk_latency)
+                    out_file.write(chunk)
+                    total_bytes += len(chunk)
+            log.info("保存完了: %s (%d bytes, %.2f秒)", out_path, total_bytes, loop.time() - start)
             return music_url
         else:
-            print("❌ 音楽生成失敗またはタイムアウト")
+            log.error("❌ 音楽生成失敗またはタイムアウト")
             return None
             
     except Exception as e:
-        print(f"❌ 音楽生成エラー: {e}")
+        log.error("❌ 音楽生成エラー: %s", e)
         return None
 
 
-def test_full_pipeline(audio_file: str, phone_number: str = None):
+async def test_full_pipeline(audio_file: str, phone_number: str = None):
     """フルパイプラインテスト"""
-    from src.music_generator import MusicGenerator
-    
-    print("\n" + "=" * 50)
-    print("フルパイプラインテスト")
-    print("=" * 50)
-    
-    mg = MusicGenerator(
-        openai_api_key=os.getenv('OPENAI_API_KEY'),
-        udio_api_key=os.getenv('UDIO_API_KEY'),
-        vonage_api_key=os.getenv('VONAGE_API_KEY'),
-        vonage_api_secret=os.getenv('VONAGE_API_SECRET'),
-        vonage_from_number=os.getenv('VONAGE_SMS_FROM', '')
-    )
+    log.info(_BANNERS['full'])
+    
+    mg = get_mg()
     
-    music_style = os.getenv('MUSIC_STYLE', 'rap, hip-hop, japanese, emotional, rhythmic')
+    music_style = CFG.music_style or DEFAULT_MUSIC_STYLE
     
     if not phone_number:
-        phone_number = os.getenv('TEST_PHONE_NUMBER', '')
+        phone_number = CFG.test_phone_number or ''
     
     if not phone_number:
-        print("⚠️ SMS送信先電話番号が設定されていません")
-        print("TEST_PHONE_NUMBER環境変数を設定するか、引数で指定してください")
+        log.warning(
+            "⚠️ SMS送信先電話番号が設定されていません\n"
+            "TEST_PHONE_NUMBER環境変数を設定するか、引数で指定してください"
+        )
     
-    result = mg.process_voicemail(
+    # アップロード前にサイズと形式を確認し、失敗が確定している処理を始めない
+    try:
+        await asyncio.to_thread(mg._validate_audio, audio_file)
+    except (MusicGeneratorError, OSError) as e:
+        log.error("❌ 音声ファイルが無効です: %s", e)
+        return None
+    
+    result = await asyncio.to_thread(
+        mg.process_voicemail,
         audio_file_path=audio_file,
         caller_number=phone_number,
         music_style=music_style
     )
     
     if result:
-        print(f"\n✅ 処理完了! 音楽URL: {result}")
+        log.info("\n✅ 処理完了! 音楽URL: %s", result)
     else:
-        print("\n❌ 処理失敗")
+        log.error("\n❌ 処理失敗")
     
     return result
 
 
-def check_env():
-    """環境変数の確認"""
-    print("=" * 50)
-    print("環境変数チェック")
-    print("=" * 50)
+async def pipeline(audio_file: str, phone_number: str = None):
+    """
+    音声認識 → 音楽生成 → SMS通知を順に実行
+    
+    複数ファイルのパイプラインを並行して実行すると、あるファイルの音声認識と
+    別のファイルの音楽生成待ちが重なり、全体の待ち時間が短くなります。
+    """
+    text = await test_transcription_only(audio_file)
+    if not text:
+        return None
+    
+    music_url = await test_music_generation(text)
+    
+    if music_url and phone_number:
+        message = f"あなたの留守録が音楽になりました！🎵\n{music_url}"
+        sent = await asyncio.to_thread(get_mg().send_sms, phone_number, message)
+        if sent:
+            log.info("✅ SMS送信: %s", phone_number)
+        else:
+            log.error("❌ SMS送信: %s", phone_number)
+    
+    return music_url
+
+
+def _mask(value: str) -> str:
+    """APIキーなどの値を先頭と末尾4文字だけ残して伏せる"""
+    return value[:4] + '...' + value[-4:] if len(value) > 8 else '***'
+
+
+def validate_env() -> bool:
+    """必須の環境変数がすべて設定されているか確認（表示は行わない）"""
+    return all(getattr(CFG, name) for name in REQUIRED_FIELDS)
+
+
+def describe_env():
+    """環境変数の設定状況を表示（端末以外への出力では値を含まない key=set/unset 形式）"""
+    required = {}
+    optional = {}
+    for f in fields(CFG):
+        target = required if f.metadata['required'] else optional
+        target[f.metadata['env']] = getattr(CFG, f.name)
     
-    required = {
-        'OPENAI_API_KEY': os.getenv('OPENAI_API_KEY'),
-        'UDIO_API_KEY': os.getenv('UDIO_API_KEY'),
-        'VONAGE_API_KEY': os.getenv('VONAGE_API_KEY'),
-        'VONAGE_API_SECRET': os.getenv('VONAGE_API_SECRET'),
-    }
+    if not sys.stdout.isatty():
+        for key, value in {**required, **optional}.items():
+            log.info("%s=%s", key, 'set' if value else 'unset')
+        return
     
-    optional = {
-        'VONAGE_SMS_FROM': os.getenv('VONAGE_SMS_FROM'),
-        'MUSIC_STYLE': os.getenv('MUSIC_STYLE'),
-        'ENABLE_MUSIC_GENERATION': os.getenv('ENABLE_MUSIC_GENERATION'),
-    }
+    log.info(_BANNERS['env'])
     
-    all_ok = True
     for key, value in required.items():
         if value:
-            masked = value[:4] + '...' + value[-4:] if len(value) > 8 else '***'
-            print(f"✅ {key}: {masked}")
+            log.info("✅ %s: %s", key, _mask(value))
         else:
-            print(f"❌ {key}: 未設定")
-            all_ok = False
+            log.info("❌ %s: 未設定", key)
     
-    print("\nオプション設定:")
+    log.info("\nオプション設定:")
     for key, value in optional.items():
         if value:
-            print(f"  {key}: {value}")
+            log.info("  %s: %s", key, value)
+        else:
+            log.info("  %s: 未設定", key)
+
+
+async def run_generate_only(args):
+    """音楽生成のみテスト（テスト歌詞使用）"""
+    test_lyrics = "今日は天気がいいですね。散歩に行きたいです。"
+    await test_music_generation(test_lyrics)
+
+
+async def run_transcribe_only(args):
+    """音声認識のみテスト（globパターンを展開し、複数ファイルはまとめて処理）"""
+    audio_files = [
+        path
+        for pattern in args.audio
+        for path in (sorted(glob.glob(pattern)) or [pattern])
+    ]
+    if len(audio_files) > 1:
+        await test_transcription_batch(audio_files, args.batch_size)
+    else:
+        await test_transcription_only(audio_files[0])
+
+
+def expand_audio_paths(patterns: list) -> list:
+    """ディレクトリは直下の音声ファイルに、それ以外はglobパターンとして展開"""
+    paths = []
+    for pattern in patterns:
+        # 存在確認とディレクトリ判定を1回のstatで行う（存在しなければglobパターン扱い）
+        try:
+            is_dir = stat.S_ISDIR(os.stat(pattern).st_mode)
+        except OSError:
+            is_dir = False
+        
+        if is_dir:
+            with os.scandir(pattern) as entries:
+                paths.extend(sorted(
+                    entry.path
+                    for entry in entries
+                    if entry.name.lower().endswith(AUDIO_EXTENSIONS)
+                ))
         else:
-            print(f"  {key}: 未設定")
+            paths.extend(sorted(glob.glob(pattern)))
+    return paths
+
+
+async def run_all(audio_files: list, phone_number: str = None, concurrency: int = 5):
+    """各ファイルのパイプラインを最大 concurrency 件ずつ並行実行"""
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run_one(audio_file: str):
+        async with semaphore:
+            return await pipeline(audio_file, phone_number)
+    
+    return await asyncio.gather(*(run_one(f) for f in audio_files))
+
+
+async def run_full(args):
+    """フルテスト（指定されたディレクトリ・パターンの各ファイルを並行処理）"""
+    audio_files = expand_audio_paths(args.audio)
+    if not audio_files:
+        log.error("\n❌ ファイルが見つかりません: %s", ' '.join(args.audio))
+        sys.exit(1)
+    
+    await run_all(audio_files, args.phone, args.concurrency)
+
+
+# テストモードごとの実行関数
+MODES = {
+    'generate': run_generate_only,
+    'transcribe': run_transcribe_only,
+    'full': run_full,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """コマンドライン引数のパーサーを作成"""
+    parser = argparse.ArgumentParser(
+        description="音楽生成テストスクリプト (Udio API)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            "例:\n"
+            "  python test_music_generator.py recordings/test.mp3\n"
+            "  python test_music_generator.py recordings/test.mp3 --phone 818012345678\n"
+            '  python test_music_generator.py "recordings/*.mp3" --phone 818012345678\n'
+            "  python test_music_generator.py recordings/ --concurrency 3\n"
+            '  python test_music_generator.py --transcribe-only "recordings/*.mp3"\n'
+            "  python test_music_generator.py --generate-only"
+        )
+    )
+    parser.add_argument('audio', nargs='*', help="音声ファイルパス、ディレクトリまたはglobパターン")
+    
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        '--transcribe-only', dest='mode', action='store_const', const='transcribe',
+        help="音声認識のみ（複数ファイルは並行処理）"
+    )
+    mode.add_argument(
+        '--generate-only', dest='mode', action='store_const', const='generate',
+        help="音楽生成のみ（テスト歌詞使用）"
+    )
+    parser.set_defaults(mode='full')
+    
+    parser.add_argument('--phone', help="SMS送信先電話番号")
+    parser.add_argument('--batch-size', type=int, default=4, help="音声認識の同時実行数（デフォルト: 4）")
+    parser.add_argument('--concurrency', type=int, default=5, help="フルテストで同時に処理するファイル数（デフォルト: 5）")
+    parser.add_argument('--workers', type=int, default=8, help="API呼び出しに使うスレッド数（デフォルト: 8）")
+    parser.add_argument('--verbose', action='store_true', help="環境変数の設定状況を常に表示")
+    return parser
+
+
+async def main(args):
+    """
+    コマンドライン引数に応じてテストを実行
     
-    return all_ok
+    API呼び出しは asyncio.to_thread でスレッドに渡すため、既定のスレッドプールを
+    --workers 件に広げ、複数ファイルの音声認識・音楽生成が CPU 数で頭打ちに
+    ならないようにします（待ち時間はネットワークI/OのためGILを解放）。
+    """
+    with ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix="music-test") as executor:
+        asyncio.get_running_loop().set_default_executor(executor)
+        await MODES[args.mode](args)
 
 
 if __name__ == "__main__":
-    print("\n🎵 音楽生成テストスクリプト (Udio API) 🎵\n")
+    parser = build_parser()
+    args = parser.parse_args()
+    
+    log.info("\n🎵 音楽生成テストスクリプト (Udio API) 🎵\n")
     
     # 環境変数チェック
-    if not check_env():
-        print("\n❌ 必須の環境変数が設定されていません")
-        print("\n.envファイルにUDIO_API_KEYを設定してください:")
-        print("  UDIO_API_KEY=your_udio_api_key_here")
+    if not validate_env():
+        describe_env()
+        log.error(
+            "\n❌ 必須の環境変数が設定されていません\n"
+            "\n.envファイルにUDIO_API_KEYを設定してください:\n"
+            "  UDIO_API_KEY=your_udio_api_key_here"
+        )
         sys.exit(1)
+    if args.verbose:
+        describe_env()
     
     # 引数チェック
-    if len(sys.argv) < 2:
-        print("\n使用方法:")
-        print("  python test_music_generator.py <音声ファイルパス> [電話番号]")
-        print("\n例:")
-        print("  python test_music_generator.py recordings/test.mp3")
-        print("  python test_music_generator.py recordings/test.mp3 818012345678")
-        print("\nテストモード:")
-        print("  --transcribe-only <ファイル>: 音声認識のみ")
-        print("  --generate-only: 音楽生成のみ（テスト歌詞使用）")
+    if args.mode != 'generate' and not args.audio:
+        parser.print_help()
         sys.exit(0)
     
-    audio_file = sys.argv[1]
-    
-    if audio_file == "--generate-only":
-        # 音楽生成のみテスト（テスト歌詞使用）
-        test_lyrics = "今日は天気がいいですね。散歩に行きたいです。"
-        test_music_generation(test_lyrics)
-    elif audio_file == "--transcribe-only" and len(sys.argv) > 2:
-        # 音声認識のみテスト
-        test_transcription_only(sys.argv[2])
-    elif not os.path.exists(audio_file):
-        print(f"\n❌ ファイルが見つかりません: {audio_file}")
-        sys.exit(1)
-    else:
-        # フルテスト
-        phone = sys.argv[2] if len(sys.argv) > 2 else None
-        
-        # まず音声認識
-        text = test_transcription_only(audio_file)
-        
-        if text:
-            # 音楽生成
-            url = test_music_generation(text)
+    asyncio.run(main(args))
@@ -138,6 +138,27 @@ class TestConfigFromEnv:
             assert config.answer_url == "https://custom.com/answer"
             assert config.event_url == "https://custom.com/event"
             assert config.recording_url == "https://custom.com/recording"
+    
+    def test_from_env_reuses_config_until_env_changes(self, valid_env_vars):
+        """
+        正常系: 環境変数が同じ間は同じ設定を返し、変更後は読み込み直す
+        """
+        with mock.patch.dict(os.environ, valid_env_vars, clear=True):
+            config = Config.from_env()
+            assert Config.from_env() is config
+        
+        with mock.patch.dict(os.environ, {**valid_env_vars, "LOG_LEVEL": "DEBUG"}, clear=True):
+            assert Config.from_env().log_level == "DEBUG"
+    
+    def test_config_is_immutable(self, valid_env_vars):
+        """
+        正常系: 共有される設定は変更できない
+        """
+        with mock.patch.dict(os.environ, valid_env_vars, clear=True):
+            config = Config.from_env()
+        
+        with pytest.raises(AttributeError):
+            config.log_level = "DEBUG"
 
 
 class TestConfigValidation:
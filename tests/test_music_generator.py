@@ -0,0 +1,651 @@
+"""
+MusicGenerator クラスのユニットテスト
+
+Udio / Vonage / 音楽ファイル取得のHTTP通信はスタブのセッションに置き換え、
+外部APIに接続せずに振る舞いを検証します。
+"""
+
+import asyncio
+import os
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+import pytest
+import requests
+
+from src.music_generator import MusicGenerator, MusicGeneratorError, _write_buffers
+
+
+class _StubResponse:
+    """requests.Response のうち MusicGenerator が使う部分を模したレスポンス"""
+    
+    def __init__(
+        self,
+        status_code: int = 200,
+        json_data: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        body: bytes = b""
+    ):
+        self.status_code = status_code
+        self._json_data = json_data
+        self.headers = headers or {}
+        self.body = body
+        self.closed = False
+    
+    @property
+    def text(self) -> str:
+        return str(self._json_data)
+    
+    def json(self) -> dict:
+        return self._json_data
+    
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+    
+    def iter_content(self, chunk_size: int = 1):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+    
+    def close(self) -> None:
+        self.closed = True
+    
+    def __enter__(self) -> "_StubResponse":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+_Handler = Callable[..., _StubResponse]
+
+
+class _StubSession:
+    """HTTPメソッドごとの処理関数でレスポンスを返す requests.Session の代替"""
+    
+    def __init__(
+        self,
+        head: Optional[_Handler] = None,
+        get: Optional[_Handler] = None,
+        post: Optional[_Handler] = None
+    ):
+        self._handlers = {"HEAD": head, "GET": get, "POST": post}
+        self.calls: List[Tuple[str, str]] = []
+    
+    def _request(self, method: str, url: str, **kwargs) -> _StubResponse:
+        self.calls.append((method, url))
+        return self._handlers[method](url, **kwargs)
+    
+    def head(self, url: str, **kwargs) -> _StubResponse:
+        return self._request("HEAD", url, **kwargs)
+    
+    def get(self, url: str, **kwargs) -> _StubResponse:
+        return self._request("GET", url, **kwargs)
+    
+    def post(self, url: str, **kwargs) -> _StubResponse:
+        return self._request("POST", url, **kwargs)
+    
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """一時ディレクトリに音楽を保存するMusicGenerator（HTTPセッションは各テストで差し替える）"""
+    generator = MusicGenerator(
+        openai_api_key="test-openai-key",
+        udio_api_key="test-udio-key",
+        vonage_api_key="test-vonage-key",
+        vonage_api_secret="test-vonage-secret",
+        vonage_from_number="+81300000000",
+        music_dir=str(tmp_path / "music")
+    )
+    yield generator
+    generator.close()
+
+
+AUDIO_URL = "https://cdn.example.com/music/song-1.mp3"
+
+# チャンクを複数回に分けて受け取る大きさの音楽データ
+AUDIO_BODY = bytes(range(256)) * 1024
+
+
+@pytest.fixture
+def callback_generator(tmp_path):
+    """完了通知Webhook（callback_url）を設定したMusicGenerator"""
+    generator = MusicGenerator(
+        openai_api_key="test-openai-key",
+        udio_api_key="test-udio-key",
+        vonage_api_key="test-vonage-key",
+        vonage_api_secret="test-vonage-secret",
+        vonage_from_number="+81300000000",
+        music_dir=str(tmp_path / "music"),
+        callback_url="https://example.com/webhooks/udio"
+    )
+    yield generator
+    generator.close()
+
+
+def _success_status(audio_url: str = AUDIO_URL) -> dict:
+    """check_music_status が返す生成成功の結果を作成"""
+    return {"type": "SUCCESS", "response_data": [{"audio_url": audio_url}]}
+
+
+def _sms_response(status: str) -> _StubResponse:
+    """Vonage SMS APIのレスポンスを作成（status "0" が送信成功）"""
+    return _StubResponse(json_data={"messages": [{"status": status, "message-id": "msg-1"}]})
+
+
+class TestSendSmsBulk:
+    """MusicGenerator.send_sms_bulk() のテスト"""
+    
+    def test_returns_results_in_input_order(self, generator):
+        """
+        正常系: 送信結果が入力と同じ順序で返され、失敗した送信はFalseになる
+        """
+        def post(url, data, **kwargs):
+            if data["to"] == "+81900000003":
+                raise requests.ConnectionError("connection refused")
+            return _sms_response("2" if data["to"] == "+81900000002" else "0")
+        
+        generator._session = _StubSession(post=post)
+        messages = [(f"+8190000000{i}", f"メッセージ{i}") for i in range(1, 6)]
+        
+        results = generator.send_sms_bulk(messages, max_workers=3)
+        
+        assert results == [True, False, False, True, True]
+        assert len(generator._session.calls) == 5
+    
+    def test_sends_each_message_with_its_own_number(self, generator):
+        """
+        正常系: 各メッセージが対応する送信先へ送られる
+        """
+        sent = []
+        
+        def post(url, data, **kwargs):
+            sent.append((data["to"], data["text"], data["from"]))
+            return _sms_response("0")
+        
+        generator._session = _StubSession(post=post)
+        messages = [("+81900000001", "一通目"), ("+81900000002", "二通目")]
+        
+        generator.send_sms_bulk(messages)
+        
+        assert sorted(sent) == [
+            ("+81900000001", "一通目", "+81300000000"),
+            ("+81900000002", "二通目", "+81300000000"),
+        ]
+    
+    def test_empty_list_sends_nothing(self, generator):
+        """
+        エッジケース: 空のリストの場合は送信せず空のリストを返す
+        """
+        generator._session = _StubSession()
+        
+        assert generator.send_sms_bulk([]) == []
+        assert generator._session.calls == []
+
+
+class TestDownloadMusic:
+    """MusicGenerator.download_music() のテスト"""
+    
+    def _session(self, etag: Optional[str] = "\"v1\"", cache_control: str = "") -> _StubSession:
+        """指定したETagとCache-Controlを返すHEADと、本文を返すGETのセッション"""
+        headers = {"Content-Length": str(len(AUDIO_BODY))}
+        if etag:
+            headers["ETag"] = etag
+        if cache_control:
+            headers["Cache-Control"] = cache_control
+        return _StubSession(
+            head=lambda url, **kwargs: _StubResponse(headers=headers),
+            get=lambda url, **kwargs: _StubResponse(body=AUDIO_BODY)
+        )
+    
+    def test_downloads_file_into_music_dir(self, generator, tmp_path):
+        """
+        正常系: URLのファイル名で音楽ディレクトリに本文全体が保存される
+        """
+        generator._session = self._session()
+        
+        file_path = generator.download_music(AUDIO_URL)
+        
+        assert file_path == str(tmp_path / "music" / "song-1.mp3")
+        with open(file_path, "rb") as f:
+            assert f.read() == AUDIO_BODY
+        assert generator._session.calls == [("HEAD", AUDIO_URL), ("GET", AUDIO_URL)]
+    
+    def test_same_etag_is_served_from_cache(self, generator):
+        """
+        正常系: 同じETagのファイルを取得済みの場合は本文を取得せずにパスを返す
+        """
+        generator._session = self._session()
+        first = generator.download_music(AUDIO_URL)
+        
+        second = generator.download_music(AUDIO_URL)
+        
+        assert second == first
+        assert generator._session.calls == [
+            ("HEAD", AUDIO_URL), ("GET", AUDIO_URL), ("HEAD", AUDIO_URL)
+        ]
+    
+    @pytest.mark.parametrize("etag, cache_control", [
+        pytest.param(None, "", id="no_etag"),
+        pytest.param("\"v1\"", "no-store", id="no_store"),
+    ])
+    def test_uncacheable_response_is_downloaded_every_time(self, generator, etag, cache_control):
+        """
+        正常系: ETagがない、または no-store の場合はキャッシュせず毎回取得する
+        """
+        generator._session = self._session(etag=etag, cache_control=cache_control)
+        
+        generator.download_music(AUDIO_URL)
+        generator.download_music(AUDIO_URL)
+        
+        assert [method for method, _ in generator._session.calls] == ["HEAD", "GET", "HEAD", "GET"]
+        assert generator.audio_cache == {}
+    
+    def test_deleted_cached_file_is_downloaded_again(self, generator):
+        """
+        エッジケース: キャッシュ済みのファイルが削除されていた場合は再取得する
+        """
+        generator._session = self._session()
+        file_path = generator.download_music(AUDIO_URL)
+        os.remove(file_path)
+        
+        assert generator.download_music(AUDIO_URL) == file_path
+        assert [method for method, _ in generator._session.calls] == ["HEAD", "GET", "HEAD", "GET"]
+        assert os.path.exists(file_path)
+    
+    def test_http_error_raises_music_generator_error(self, generator):
+        """
+        異常系: 音楽ファイルの取得に失敗した場合は MusicGeneratorError を送出する
+        """
+        generator._session = _StubSession(
+            head=lambda url, **kwargs: _StubResponse(status_code=404)
+        )
+        
+        with pytest.raises(MusicGeneratorError):
+            generator.download_music(AUDIO_URL)
+
+
+class TestMusicCompletionNotification:
+    """MusicGenerator.notify_music_complete() と wait_for_music() のテスト"""
+    
+    def test_notification_wakes_waiting_wait_for_music(self, callback_generator):
+        """
+        正常系: 完了通知を受けると、フォールバックのポーリング間隔を待たずにステータスを再確認する
+        """
+        polled = threading.Event()
+        statuses = iter([{"type": "PENDING"}, _success_status()])
+        
+        def check_music_status(work_id):
+            polled.set()
+            return next(statuses)
+        
+        callback_generator.check_music_status = check_music_status
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            start = time.monotonic()
+            future = executor.submit(callback_generator.wait_for_music, "work-1", timeout=60)
+            assert polled.wait(timeout=5)
+            
+            assert callback_generator.notify_music_complete("work-1") is True
+            
+            assert future.result(timeout=5) == AUDIO_URL
+        
+        # フォールバックのポーリング（20秒間隔）ではなく通知で起こされたことを確認
+        assert time.monotonic() - start < MusicGenerator.CALLBACK_FALLBACK_POLL_INTERVAL
+        assert callback_generator._completion_events == {}
+    
+    def test_notification_for_unknown_work_id_returns_false(self, callback_generator):
+        """
+        エッジケース: 待機中でない workId の通知は False を返す
+        """
+        assert callback_generator.notify_music_complete("unknown-work") is False
+    
+    def test_generate_music_does_not_register_completion_event(self, callback_generator):
+        """
+        正常系: 生成依頼では callback_url を送信し、完了通知イベントは待機するまで登録しない
+        """
+        sent = []
+        
+        def post(url, json, **kwargs):
+            sent.append(json)
+            return _StubResponse(json_data={"code": 200, "workId": "work-1"})
+        
+        callback_generator._session = _StubSession(post=post)
+        
+        assert callback_generator.generate_music("歌詞") == "work-1"
+        assert sent[0]["callback_url"] == "https://example.com/webhooks/udio"
+        assert callback_generator._completion_events == {}
+    
+    def test_async_wait_leaves_no_completion_event(self, callback_generator):
+        """
+        正常系: asyncio版の待機は完了通知イベントを残さない
+        """
+        callback_generator.check_music_status = lambda work_id: _success_status()
+        
+        audio_url = asyncio.run(callback_generator.wait_for_music_async("work-1"))
+        
+        assert audio_url == AUDIO_URL
+        assert callback_generator._completion_events == {}
+    
+    def test_timed_out_wait_removes_completion_event(self, callback_generator):
+        """
+        異常系: タイムアウトした待機も完了通知イベントを削除する
+        """
+        callback_generator.check_music_status = lambda work_id: {"type": "PENDING"}
+        
+        assert callback_generator.wait_for_music("work-1", timeout=0) is None
+        assert callback_generator._completion_events == {}
+
+
+def _write_wav(path, seconds: float, framerate: int = 8000) -> None:
+    """指定した長さの無音のPCM WAVファイルを作成"""
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(framerate)
+        wav.writeframes(b"\x00\x00" * int(seconds * framerate))
+
+
+class TestValidateAudio:
+    """MusicGenerator._validate_audio() のテスト"""
+    
+    @pytest.mark.parametrize("header", [
+        pytest.param(b"ID3\x04\x00\x00\x00\x00\x00\x00", id="mp3_id3"),
+        pytest.param(b"\xff\xfb\x90\x64\x00\x00\x00\x00", id="mp3_frame_sync"),
+        pytest.param(b"\x00\x00\x00\x18ftypM4A \x00\x00", id="m4a"),
+        pytest.param(b"OggS\x00\x02\x00\x00\x00\x00", id="ogg"),
+        pytest.param(b"fLaC\x00\x00\x00\x22\x10\x00", id="flac"),
+        pytest.param(b"\x1a\x45\xdf\xa3\x9f\x42\x86\x81", id="webm"),
+    ])
+    def test_supported_container_returns_file_size(self, generator, tmp_path, header):
+        """
+        正常系: 対応する音声コンテナはファイルサイズを返す
+        """
+        audio_path = tmp_path / "audio.bin"
+        audio_path.write_bytes(header + b"\x00" * 100)
+        
+        assert generator._validate_audio(str(audio_path)) == len(header) + 100
+    
+    def test_wav_long_enough_is_accepted(self, generator, tmp_path):
+        """
+        正常系: 最短録音時間以上のWAVは受け入れる
+        """
+        audio_path = tmp_path / "audio.wav"
+        _write_wav(audio_path, seconds=1.0)
+        
+        assert generator._validate_audio(str(audio_path)) == os.path.getsize(audio_path)
+    
+    def test_short_wav_is_rejected(self, generator, tmp_path):
+        """
+        異常系: 最短録音時間に満たないWAVは拒否する
+        """
+        audio_path = tmp_path / "audio.wav"
+        _write_wav(audio_path, seconds=0.1)
+        
+        with pytest.raises(MusicGeneratorError, match="audio_too_short"):
+            generator._validate_audio(str(audio_path))
+    
+    @pytest.mark.parametrize("content, reason", [
+        pytest.param(b"", "empty_file", id="empty"),
+        pytest.param(b"<!DOCTYPE html><html></html>", "unsupported_format", id="html"),
+        pytest.param(b"PK\x03\x04\x14\x00\x00\x00\x08\x00", "unsupported_format", id="zip"),
+    ])
+    def test_invalid_file_is_rejected(self, generator, tmp_path, content, reason):
+        """
+        異常系: 空のファイルや音声でないファイルは理由付きで拒否する
+        """
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(content)
+        
+        with pytest.raises(MusicGeneratorError, match=reason):
+            generator._validate_audio(str(audio_path))
+    
+    def test_file_over_whisper_limit_is_rejected(self, generator, tmp_path, monkeypatch):
+        """
+        異常系: Whisperのアップロード上限を超えるファイルは拒否する
+        """
+        monkeypatch.setattr(generator, "WHISPER_MAX_FILE_SIZE", 16)
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"ID3" + b"\x00" * 16)
+        
+        with pytest.raises(MusicGeneratorError, match="file_too_large"):
+            generator._validate_audio(str(audio_path))
+    
+    def test_transcribe_audio_rejects_invalid_file_before_upload(self, generator, tmp_path, monkeypatch):
+        """
+        異常系: 無効なファイルは Whisper API に送信しない
+        """
+        def fail_if_called():
+            raise AssertionError("Whisper API must not be called")
+        
+        monkeypatch.setattr(generator, "_get_openai_client", fail_if_called)
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"not audio at all")
+        
+        with pytest.raises(MusicGeneratorError, match="unsupported_format"):
+            generator.transcribe_audio(str(audio_path))
+
+
+@pytest.mark.skipif(not hasattr(os, "writev"), reason="os.writev が使えない環境")
+class TestDownloadMusicWriteBatching:
+    """download_music() のチャンクをまとめた書き込みのテスト"""
+    
+    @pytest.fixture
+    def writev_calls(self, monkeypatch):
+        """os.writev の呼び出しごとのバッファ数を記録するリスト"""
+        calls = []
+        writev = os.writev
+        
+        def spy(fd, buffers):
+            calls.append(len(buffers))
+            return writev(fd, buffers)
+        
+        monkeypatch.setattr(os, "writev", spy)
+        return calls
+    
+    def test_chunks_are_written_in_batches(self, generator, monkeypatch, writev_calls):
+        """
+        正常系: 受信したチャンクはバッチサイズごとに1回のwritevで書き込まれる
+        """
+        monkeypatch.setattr(generator, "DOWNLOAD_CHUNK_SIZE", 64 * 1024)
+        monkeypatch.setattr(generator, "DOWNLOAD_WRITE_BATCH_SIZE", 128 * 1024)
+        generator._session = _StubSession(
+            head=lambda url, **kwargs: _StubResponse(),
+            get=lambda url, **kwargs: _StubResponse(body=AUDIO_BODY)
+        )
+        
+        file_path = generator.download_music(AUDIO_URL)
+        
+        # 256 KiB の本文 = 64 KiB のチャンク4個を、128 KiB ずつ2回に分けて書き込む
+        assert writev_calls == [2, 2]
+        with open(file_path, "rb") as f:
+            assert f.read() == AUDIO_BODY
+
+
+class TestWriteBuffers:
+    """_write_buffers() のテスト"""
+    
+    @pytest.mark.skipif(not hasattr(os, "writev"), reason="os.writev が使えない環境")
+    def test_partial_writev_writes_remaining_bytes(self, tmp_path, monkeypatch):
+        """
+        エッジケース: writevが一部だけ書き込んだ場合、残りのバイトも書き込まれる
+        """
+        writev = os.writev
+        monkeypatch.setattr(os, "writev", lambda fd, buffers: writev(fd, buffers[:1]))
+        buffers = [b"a" * 10, b"b" * 20, b"c" * 30]
+        file_path = tmp_path / "out.bin"
+        
+        with open(file_path, "wb", buffering=0) as f:
+            _write_buffers(f, buffers)
+        
+        assert file_path.read_bytes() == b"".join(buffers)
+    
+    def test_without_writev_writes_joined_buffers(self, tmp_path, monkeypatch):
+        """
+        正常系: os.writev がない環境では連結して1回で書き込む
+        """
+        monkeypatch.delattr(os, "writev", raising=False)
+        buffers = [b"a" * 10, b"b" * 20]
+        file_path = tmp_path / "out.bin"
+        
+        with open(file_path, "wb", buffering=0) as f:
+            _write_buffers(f, buffers)
+        
+        assert file_path.read_bytes() == b"".join(buffers)
+
+
+class TestStreamMusic:
+    """MusicGenerator.stream_music() のテスト"""
+    
+    @staticmethod
+    async def _collect(stream) -> List[bytes]:
+        """非同期イテレータのチャンクをすべて受け取る"""
+        return [chunk async for chunk in stream]
+    
+    def test_yields_body_in_chunks_and_closes_response(self, generator):
+        """
+        正常系: 本文を指定サイズのチャンクで順に返し、最後にレスポンスを閉じる
+        """
+        response = _StubResponse(body=AUDIO_BODY)
+        generator._session = _StubSession(get=lambda url, **kwargs: response)
+        
+        chunks = asyncio.run(self._collect(generator.stream_music(AUDIO_URL, chunk_size=100_000)))
+        
+        assert [len(chunk) for chunk in chunks] == [100_000, 100_000, len(AUDIO_BODY) - 200_000]
+        assert b"".join(chunks) == AUDIO_BODY
+        assert response.closed
+    
+    def test_stopping_early_closes_response(self, generator):
+        """
+        正常系: 呼び出し側が途中で読み込みをやめてもレスポンスを閉じる
+        """
+        response = _StubResponse(body=AUDIO_BODY)
+        generator._session = _StubSession(get=lambda url, **kwargs: response)
+        
+        async def read_first_chunk():
+            stream = generator.stream_music(AUDIO_URL, chunk_size=1024)
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first
+        
+        assert asyncio.run(read_first_chunk()) == AUDIO_BODY[:1024]
+        assert response.closed
+    
+    def test_http_error_raises_and_closes_response(self, generator):
+        """
+        異常系: エラーステータスの場合は MusicGeneratorError を送出し、レスポンスを閉じる
+        """
+        response = _StubResponse(status_code=500)
+        generator._session = _StubSession(get=lambda url, **kwargs: response)
+        
+        with pytest.raises(MusicGeneratorError):
+            asyncio.run(self._collect(generator.stream_music(AUDIO_URL)))
+        assert response.closed
+    
+    def test_connection_error_raises_music_generator_error(self, generator):
+        """
+        異常系: 接続に失敗した場合は MusicGeneratorError を送出する
+        """
+        def get(url, **kwargs):
+            raise requests.ConnectionError("connection refused")
+        
+        generator._session = _StubSession(get=get)
+        
+        with pytest.raises(MusicGeneratorError):
+            asyncio.run(self._collect(generator.stream_music(AUDIO_URL)))
+
+
+class TestGenerateMusicAsyncDedup:
+    """MusicGenerator.generate_music_async() の重複生成抑止のテスト"""
+    
+    @pytest.fixture
+    def generate_calls(self, generator, monkeypatch) -> List[Tuple[str, str]]:
+        """generate_music / wait_for_music_async を差し替え、生成要求を記録する"""
+        calls: List[Tuple[str, str]] = []
+        
+        def generate_music(lyrics, style="pop"):
+            calls.append((lyrics, style))
+            return f"work-{len(calls)}"
+        
+        async def wait_for_music_async(work_id, timeout=300, poll_schedule=None):
+            await asyncio.sleep(0.05)
+            return f"https://cdn.example.com/music/{work_id}.mp3"
+        
+        monkeypatch.setattr(generator, "generate_music", generate_music)
+        monkeypatch.setattr(generator, "wait_for_music_async", wait_for_music_async)
+        return calls
+    
+    def test_concurrent_identical_requests_share_one_generation(self, generator, generate_calls):
+        """
+        正常系: 同じ歌詞・スタイルの同時要求は1回だけ生成し、結果を共有する
+        """
+        async def run():
+            return await asyncio.gather(
+                generator.generate_music_async("歌詞", style="rap"),
+                generator.generate_music_async("歌詞", style="rap"),
+                generator.generate_music_async("歌詞", style="rap")
+            )
+        
+        results = asyncio.run(run())
+        
+        assert generate_calls == [("歌詞", "rap")]
+        assert results == [("work-1", "https://cdn.example.com/music/work-1.mp3")] * 3
+        assert generator._inflight_music == {}
+    
+    def test_different_style_generates_separately(self, generator, generate_calls):
+        """
+        正常系: スタイルが異なる要求はそれぞれ生成する
+        """
+        async def run():
+            return await asyncio.gather(
+                generator.generate_music_async("歌詞", style="rap"),
+                generator.generate_music_async("歌詞", style="jazz")
+            )
+        
+        results = asyncio.run(run())
+        
+        assert sorted(generate_calls) == [("歌詞", "jazz"), ("歌詞", "rap")]
+        assert {work_id for work_id, _ in results} == {"work-1", "work-2"}
+    
+    def test_completed_request_is_not_reused(self, generator, generate_calls):
+        """
+        正常系: 完了した生成の結果は再利用せず、後続の要求で再び生成する
+        """
+        first = asyncio.run(generator.generate_music_async("歌詞", style="rap"))
+        second = asyncio.run(generator.generate_music_async("歌詞", style="rap"))
+        
+        assert len(generate_calls) == 2
+        assert first[0] == "work-1"
+        assert second[0] == "work-2"
+    
+    def test_error_propagates_to_all_waiters(self, generator, monkeypatch):
+        """
+        異常系: 生成に失敗した場合は待機中の全要求に例外を伝え、進行中の登録を解除する
+        """
+        calls: List[str] = []
+        
+        def generate_music(lyrics, style="pop"):
+            calls.append(lyrics)
+            time.sleep(0.05)
+            raise MusicGeneratorError("API error")
+        
+        monkeypatch.setattr(generator, "generate_music", generate_music)
+        
+        async def run():
+            return await asyncio.gather(
+                generator.generate_music_async("歌詞", style="rap"),
+                generator.generate_music_async("歌詞", style="rap"),
+                return_exceptions=True
+            )
+        
+        results = asyncio.run(run())
+        
+        assert len(calls) == 1
+        assert all(isinstance(result, MusicGeneratorError) for result in results)
+        assert generator._inflight_music == {}
@@ -4,10 +4,50 @@ NCCO Builder テストモジュール (NCCO Builder Test Module)
 TalkAction と RecordAction dataclass のユニットテストです。
 """
 
+import orjson
 import pytest
 from src.ncco_builder import TalkAction, RecordAction
 
 
+EVENT_URL = ["https://example.com/webhooks/recording"]
+
+EXPECTED_TALK_DICT = {
+    "action": "talk",
+    "text": "お電話ありがとうございます。",
+    "language": "ja-JP",
+    "style": 1,
+    "bargeIn": False
+}
+
+EXPECTED_TALK_DEFAULT_DICT = {
+    "action": "talk",
+    "text": "テストメッセージ",
+    "language": "ja-JP",
+    "style": 0,
+    "bargeIn": False
+}
+
+EXPECTED_RECORD_DICT = {
+    "action": "record",
+    "eventUrl": EVENT_URL,
+    "endOnSilence": 4,
+    "endOnKey": "#",
+    "beepStart": True,
+    "timeOut": 90,
+    "format": "mp3"
+}
+
+EXPECTED_RECORD_DEFAULT_DICT = {
+    "action": "record",
+    "eventUrl": EVENT_URL,
+    "endOnSilence": 3,
+    "endOnKey": "#",
+    "beepStart": True,
+    "timeOut": 60,
+    "format": "mp3"
+}
+
+
 class TestTalkAction:
     """TalkAction dataclass のテスト"""
     
@@ -34,36 +74,17 @@ class TestTalkAction:
         assert action.style == 2
         assert action.bargeIn is True
     
-    def test_talk_action_to_dict(self):
+    @pytest.mark.parametrize("kwargs, expected", [
+        pytest.param(
+            {"text": "お電話ありがとうございます。", "language": "ja-JP", "style": 1, "bargeIn": False},
+            EXPECTED_TALK_DICT,
+            id="all_fields"
+        ),
+        pytest.param({"text": "テストメッセージ"}, EXPECTED_TALK_DEFAULT_DICT, id="default_values"),
+    ])
+    def test_talk_action_to_dict(self, kwargs, expected):
         """TalkActionのto_dict()メソッドが正しい辞書を返すことを検証"""
-        action = TalkAction(
-            text="お電話ありがとうございます。",
-            language="ja-JP",
-            style=1,
-            bargeIn=False
-        )
-        
-        result = action.to_dict()
-        
-        assert result == {
-            "action": "talk",
-            "text": "お電話ありがとうございます。",
-            "language": "ja-JP",
-            "style": 1,
-            "bargeIn": False
-        }
-    
-    def test_talk_action_to_dict_default_values(self):
-        """デフォルト値でのto_dict()が正しい辞書を返すことを検証"""
-        action = TalkAction(text="テストメッセージ")
-        
-        result = action.to_dict()
-        
-        assert result["action"] == "talk"
-        assert result["text"] == "テストメッセージ"
-        assert result["language"] == "ja-JP"
-        assert result["style"] == 0
-        assert result["bargeIn"] is False
+        assert TalkAction(**kwargs).to_dict() == expected
 
 
 class TestRecordAction:
@@ -100,44 +121,18 @@ class TestRecordAction:
         assert action.timeOut == 120
         assert action.format == "wav"
     
-    def test_record_action_to_dict(self):
+    @pytest.mark.parametrize("kwargs, expected", [
+        pytest.param(
+            {"eventUrl": EVENT_URL, "endOnSilence": 4, "endOnKey": "#",
+             "beepStart": True, "timeOut": 90, "format": "mp3"},
+            EXPECTED_RECORD_DICT,
+            id="all_fields"
+        ),
+        pytest.param({"eventUrl": EVENT_URL}, EXPECTED_RECORD_DEFAULT_DICT, id="default_values"),
+    ])
+    def test_record_action_to_dict(self, kwargs, expected):
         """RecordActionのto_dict()メソッドが正しい辞書を返すことを検証"""
-        event_url = ["https://example.com/webhooks/recording"]
-        action = RecordAction(
-            eventUrl=event_url,
-            endOnSilence=4,
-            endOnKey="#",
-            beepStart=True,
-            timeOut=90,
-            format="mp3"
-        )
-        
-        result = action.to_dict()
-        
-        assert result == {
-            "action": "record",
-            "eventUrl": event_url,
-            "endOnSilence": 4,
-            "endOnKey": "#",
-            "beepStart": True,
-            "timeOut": 90,
-            "format": "mp3"
-        }
-    
-    def test_record_action_to_dict_default_values(self):
-        """デフォルト値でのto_dict()が正しい辞書を返すことを検証"""
-        event_url = ["https://example.com/recording"]
-        action = RecordAction(eventUrl=event_url)
-        
-        result = action.to_dict()
-        
-        assert result["action"] == "record"
-        assert result["eventUrl"] == event_url
-        assert result["endOnSilence"] == 3
-        assert result["endOnKey"] == "#"
-        assert result["beepStart"] is True
-        assert result["timeOut"] == 60
-        assert result["format"] == "mp3"
+        assert RecordAction(**kwargs).to_dict() == expected
     
     def test_record_action_multiple_event_urls(self):
         """複数のeventUrlを持つRecordActionが正しく動作することを検証"""
@@ -153,9 +148,9 @@ class TestRecordAction:
         assert len(result["eventUrl"]) == 2
 
 
+from types import SimpleNamespace
+
 from src.ncco_builder import NCCOBuilder
-from src.config import Config
-from unittest.mock import MagicMock
 
 
 class TestNCCOBuilder:
@@ -170,174 +165,115 @@ class TestNCCOBuilder:
         recording_format: str = "mp3",
         end_on_silence: int = 3,
         recording_url: str = "https://example.com/webhooks/recording"
-    ) -> MagicMock:
-        """テスト用のモック設定を作成"""
-        config = MagicMock(spec=Config)
-        config.greeting_message = greeting_message
-        config.greeting_language = greeting_language
-        config.greeting_style = greeting_style
-        config.max_recording_duration = max_recording_duration
-        config.recording_format = recording_format
-        config.end_on_silence = end_on_silence
-        config.recording_url = recording_url
-        return config
+    ) -> SimpleNamespace:
+        """テスト用の設定を作成（NCCOBuilder が読む属性だけを持つ）"""
+        return SimpleNamespace(
+            greeting_message=greeting_message,
+            greeting_language=greeting_language,
+            greeting_style=greeting_style,
+            max_recording_duration=max_recording_duration,
+            recording_format=recording_format,
+            end_on_silence=end_on_silence,
+            recording_url=recording_url
+        )
+    
+    @pytest.fixture(scope="class")
+    def default_builder(self):
+        """既定値の設定で1回だけ作成し、クラス内で共有する NCCOBuilder"""
+        return NCCOBuilder(self._create_mock_config())
     
-    def test_build_voicemail_ncco_returns_list(self):
+    def test_build_voicemail_ncco_returns_list(self, default_builder):
         """build_voicemail_ncco()がリストを返すことを検証"""
-        config = self._create_mock_config()
-        builder = NCCOBuilder(config)
-        
-        result = builder.build_voicemail_ncco("test-uuid-123")
+        result = default_builder.build_voicemail_ncco("test-uuid-123")
         
         assert isinstance(result, list)
     
-    def test_build_voicemail_ncco_contains_two_actions(self):
+    def test_build_voicemail_ncco_contains_two_actions(self, default_builder):
         """build_voicemail_ncco()が2つのアクションを含むことを検証
         
         Requirements: 2.1, 2.2, 3.1, 3.2
         """
-        config = self._create_mock_config()
-        builder = NCCOBuilder(config)
-        
-        result = builder.build_voicemail_ncco("test-uuid-123")
+        result = default_builder.build_voicemail_ncco("test-uuid-123")
         
         assert len(result) == 2
     
-    def test_build_voicemail_ncco_first_action_is_talk(self):
+    def test_build_voicemail_ncco_first_action_is_talk(self, default_builder):
         """build_voicemail_ncco()の最初のアクションがtalkであることを検証
         
         Requirements: 2.1, 2.2
         """
-        config = self._create_mock_config()
-        builder = NCCOBuilder(config)
-        
-        result = builder.build_voicemail_ncco("test-uuid-123")
+        result = default_builder.build_voicemail_ncco("test-uuid-123")
         
         assert result[0]["action"] == "talk"
     
-    def test_build_voicemail_ncco_second_action_is_record(self):
+    def test_build_voicemail_ncco_second_action_is_record(self, default_builder):
         """build_voicemail_ncco()の2番目のアクションがrecordであることを検証
         
         Requirements: 3.1, 3.2
         """
-        config = self._create_mock_config()
-        builder = NCCOBuilder(config)
-        
-        result = builder.build_voicemail_ncco("test-uuid-123")
+        result = default_builder.build_voicemail_ncco("test-uuid-123")
         
         assert result[1]["action"] == "record"
     
-    def test_build_voicemail_ncco_talk_action_uses_config_message(self):
-        """talkアクションが設定のメッセージを使用することを検証
-        
-        Requirements: 2.3
-        """
-        custom_message = "カスタムメッセージです。"
-        config = self._create_mock_config(greeting_message=custom_message)
-        builder = NCCOBuilder(config)
-        
-        result = builder.build_voicemail_ncco("test-uuid-123")
-        
-        assert result[0]["text"] == custom_message
-    
-    def test_build_voicemail_ncco_talk_action_uses_config_language(self):
-        """talkアクションが設定の言語を使用することを検証
-        
-        Requirements: 2.4
-        """
-        config = self._create_mock_config(greeting_language="en-US")
-        builder = NCCOBuilder(config)
-        
-        result = builder.build_voicemail_ncco("test-uuid-123")
-        
-        assert result[0]["language"] == "en-US"
-    
-    def test_build_voicemail_ncco_talk_action_uses_config_style(self):
-        """talkアクションが設定のスタイルを使用することを検証
-        
-        Requirements: 2.4
-        """
-        config = self._create_mock_config(greeting_style=2)
-        builder = NCCOBuilder(config)
-        
-        result = builder.build_voicemail_ncco("test-uuid-123")
-        
-        assert result[0]["style"] == 2
-    
-    def test_build_voicemail_ncco_record_action_uses_config_timeout(self):
-        """recordアクションが設定の最大録音時間を使用することを検証
-        
-        Requirements: 3.5
+    @pytest.mark.parametrize("field, value, action_index, key, expected", [
+        pytest.param("greeting_message", "カスタムメッセージです。", 0, "text", "カスタムメッセージです。", id="message"),
+        pytest.param("greeting_language", "en-US", 0, "language", "en-US", id="language"),
+        pytest.param("greeting_style", 2, 0, "style", 2, id="style"),
+        pytest.param("max_recording_duration", 120, 1, "timeOut", 120, id="timeout"),
+        pytest.param("recording_format", "wav", 1, "format", "wav", id="format"),
+        pytest.param("end_on_silence", 5, 1, "endOnSilence", 5, id="end_on_silence"),
+        pytest.param(
+            "recording_url", "https://custom.example.com/recording", 1, "eventUrl",
+            ["https://custom.example.com/recording"], id="recording_url"
+        ),
+    ])
+    def test_build_voicemail_ncco_uses_config(self, field, value, action_index, key, expected):
+        """talk / record アクションが設定値を使用することを検証
+        
+        Requirements: 2.3, 2.4, 3.5
         """
-        config = self._create_mock_config(max_recording_duration=120)
-        builder = NCCOBuilder(config)
-        
-        result = builder.build_voicemail_ncco("test-uuid-123")
-        
-        assert result[1]["timeOut"] == 120
-    
-    def test_build_voicemail_ncco_record_action_uses_config_format(self):
-        """recordアクションが設定の録音フォーマットを使用することを検証"""
-        config = self._create_mock_config(recording_format="wav")
-        builder = NCCOBuilder(config)
+        builder = NCCOBuilder(self._create_mock_config(**{field: value}))
         
         result = builder.build_voicemail_ncco("test-uuid-123")
         
-        assert result[1]["format"] == "wav"
+        assert result[action_index][key] == expected
     
-    def test_build_voicemail_ncco_record_action_uses_config_end_on_silence(self):
-        """recordアクションが設定の無音終了時間を使用することを検証"""
-        config = self._create_mock_config(end_on_silence=5)
-        builder = NCCOBuilder(config)
-        
-        result = builder.build_voicemail_ncco("test-uuid-123")
-        
-        assert result[1]["endOnSilence"] == 5
-    
-    def test_build_voicemail_ncco_record_action_uses_config_recording_url(self):
-        """recordアクションが設定の録音URLを使用することを検証"""
-        recording_url = "https://custom.example.com/recording"
-        config = self._create_mock_config(recording_url=recording_url)
-        builder = NCCOBuilder(config)
-        
-        result = builder.build_voicemail_ncco("test-uuid-123")
-        
-        assert result[1]["eventUrl"] == [recording_url]
-    
-    def test_build_voicemail_ncco_record_action_has_beep_start(self):
+    def test_build_voicemail_ncco_record_action_has_beep_start(self, default_builder):
         """recordアクションがbeepStart=Trueを持つことを検証"""
-        config = self._create_mock_config()
-        builder = NCCOBuilder(config)
-        
-        result = builder.build_voicemail_ncco("test-uuid-123")
+        result = default_builder.build_voicemail_ncco("test-uuid-123")
         
         assert result[1]["beepStart"] is True
     
-    def test_build_voicemail_ncco_talk_action_barge_in_disabled(self):
+    def test_build_voicemail_ncco_talk_action_barge_in_disabled(self, default_builder):
         """talkアクションがbargeIn=Falseを持つことを検証"""
-        config = self._create_mock_config()
-        builder = NCCOBuilder(config)
-        
-        result = builder.build_voicemail_ncco("test-uuid-123")
+        result = default_builder.build_voicemail_ncco("test-uuid-123")
         
         assert result[0]["bargeIn"] is False
     
-    def test_build_talk_action_returns_dict(self):
-        """_build_talk_action()が辞書を返すことを検証"""
-        config = self._create_mock_config()
-        builder = NCCOBuilder(config)
+    def test_build_voicemail_ncco_json_matches_ncco(self, default_builder):
+        """build_voicemail_ncco_json()がNCCOと同じ内容のUTF-8 JSONを返すことを検証"""
+        result = default_builder.build_voicemail_ncco_json("test-uuid-123")
         
-        result = builder._build_talk_action()
+        assert isinstance(result, bytes)
+        assert orjson.loads(result) == default_builder.build_voicemail_ncco("test-uuid-123")
+        assert "お電話ありがとうございます。".encode("utf-8") in result
+    
+    def test_build_voicemail_ncco_json_is_cached(self, default_builder):
+        """build_voicemail_ncco_json()が2回目以降同じバイト列を返すことを検証"""
+        first = default_builder.build_voicemail_ncco_json("test-uuid-1")
+        
+        assert default_builder.build_voicemail_ncco_json("test-uuid-2") is first
+    
+    def test_build_talk_action_returns_dict(self, default_builder):
+        """_build_talk_action()が辞書を返すことを検証"""
+        result = default_builder._build_talk_action()
         
         assert isinstance(result, dict)
         assert result["action"] == "talk"
     
-    def test_build_record_action_returns_dict(self):
+    def test_build_record_action_returns_dict(self, default_builder):
         """_build_record_action()が辞書を返すことを検証"""
-        config = self._create_mock_config()
-        builder = NCCOBuilder(config)
-        
-        result = builder._build_record_action()
+        result = default_builder._build_record_action()
         
         assert isinstance(result, dict)
         assert result["action"] == "record"
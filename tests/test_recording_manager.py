@@ -0,0 +1,434 @@
+"""
+RecordingManager クラスのユニットテスト
+
+HTTP通信はスタブのセッションに置き換え、録音ファイルのダウンロードと
+保存の振る舞いを検証します。
+
+Requirements 3.4, 4.1 の検証
+"""
+
+import io
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+
+import pytest
+from urllib3.exceptions import ProtocolError
+
+from src.recording_manager import RecordingManager, RecordingMetadata
+from src.storage import SQLiteStorage
+
+
+# テストデータの基準日時（実行時刻に依存せず結果を再現できるよう固定）
+NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+RECORDING_URL = "https://api.nexmo.com/v1/files/abc123"
+
+# ダウンロードチャンクを複数回読む大きさの録音データ
+AUDIO_BODY = bytes(range(256)) * 1024
+
+
+class _StubRaw(io.BytesIO):
+    """
+    urllib3 のレスポンス本文を模したストリーム
+    
+    fail_after を指定すると、そのバイト数を返した後の読み込みで
+    接続切断 (ProtocolError) を発生させます。
+    on_read を指定すると、読み込みのたびに呼び出します。
+    """
+    
+    def __init__(
+        self,
+        body: bytes,
+        fail_after: Optional[int] = None,
+        on_read: Optional[Callable[[], None]] = None
+    ):
+        super().__init__(body)
+        self.decode_content = False
+        self._fail_after = fail_after
+        self._on_read = on_read
+    
+    def _check_broken(self) -> None:
+        if self._on_read is not None:
+            self._on_read()
+        if self._fail_after is not None and self.tell() >= self._fail_after:
+            raise ProtocolError("Connection broken: connection reset by peer")
+    
+    def read(self, size: Optional[int] = -1) -> bytes:
+        self._check_broken()
+        return super().read(size)
+    
+    def readinto(self, buffer) -> int:
+        self._check_broken()
+        return super().readinto(buffer)
+
+
+class _StubResponse:
+    """requests.Response のストリーミング利用部分を模したレスポンス"""
+    
+    def __init__(
+        self,
+        body: bytes,
+        headers: Optional[dict] = None,
+        fail_after: Optional[int] = None,
+        on_read: Optional[Callable[[], None]] = None
+    ):
+        self.raw = _StubRaw(body, fail_after, on_read)
+        self.headers = headers if headers is not None else {"Content-Length": str(len(body))}
+    
+    def __enter__(self) -> "_StubResponse":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.raw.close()
+    
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _StubSession:
+    """用意したレスポンスを順に返す requests.Session の代替"""
+    
+    def __init__(self, *responses: _StubResponse):
+        self.responses = list(responses)
+        self.requested_urls: List[str] = []
+    
+    def get(self, url: str, **kwargs) -> _StubResponse:
+        self.requested_urls.append(url)
+        return self.responses.pop(0)
+    
+    def close(self) -> None:
+        pass
+
+
+class _GatedSession:
+    """
+    ゲートが開くまでレスポンスを返さない requests.Session の代替
+    
+    同時に get() 内で待機しているリクエスト数の最大値を記録します。
+    """
+    
+    def __init__(self):
+        self.gate = threading.Event()
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+    
+    def get(self, url: str, **kwargs) -> _StubResponse:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            self.gate.wait(timeout=10)
+        finally:
+            with self._lock:
+                self.active -= 1
+        return _StubResponse(AUDIO_BODY)
+    
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def storage():
+    """テスト用のSQLiteStorageインスタンス（テストごとの共有キャッシュのインメモリDB）"""
+    storage = SQLiteStorage(f"file:{uuid.uuid4().hex}?mode=memory&cache=shared", uri=True)
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def manager(storage, tmp_path):
+    """一時ディレクトリに録音を保存するRecordingManager（HTTPセッションは各テストで差し替える）"""
+    manager = RecordingManager(storage, recordings_dir=str(tmp_path))
+    yield manager
+    manager.close()
+
+
+def _metadata(recording_id: str = "rec-123", recording_url: str = RECORDING_URL) -> RecordingMetadata:
+    """テスト用録音メタデータを作成"""
+    return RecordingMetadata(
+        id=recording_id,
+        call_uuid=f"call-{recording_id}",
+        caller_number="+81901234567",
+        recording_url=recording_url,
+        duration=30,
+        timestamp=NOW,
+        status="completed"
+    )
+
+
+class TestDownloadRecording:
+    """RecordingManager.download_recording() のテスト"""
+    
+    @pytest.fixture
+    def mmap_calls(self, manager, monkeypatch):
+        """_copy_to_mmap の呼び出しを記録するリスト"""
+        calls = []
+        copy_to_mmap = manager._copy_to_mmap
+        
+        def spy(raw, f, size):
+            calls.append(size)
+            copy_to_mmap(raw, f, size)
+        
+        monkeypatch.setattr(manager, "_copy_to_mmap", spy)
+        return calls
+    
+    def test_content_length_download_uses_mmap(self, manager, tmp_path, mmap_calls):
+        """
+        正常系: Content-Lengthがある場合はメモリマップ経由で全データが保存される
+        """
+        manager._session = _StubSession(_StubResponse(AUDIO_BODY))
+        
+        result = manager.download_recording(RECORDING_URL, "rec-123", format="wav")
+        
+        assert result == str(tmp_path / "rec-123.wav")
+        assert mmap_calls == [len(AUDIO_BODY)]
+        with open(result, "rb") as f:
+            assert f.read() == AUDIO_BODY
+        assert manager._session.requested_urls == [RECORDING_URL]
+    
+    @pytest.mark.parametrize("headers", [
+        pytest.param({}, id="no_content_length"),
+        pytest.param({"Content-Length": "10", "Content-Encoding": "gzip"}, id="compressed"),
+    ])
+    def test_unknown_size_download_is_copied_in_chunks(self, manager, tmp_path, mmap_calls, headers):
+        """
+        正常系: 展開後のサイズが分からない場合はストリームをそのままコピーし、
+        圧縮の展開を有効にする
+        """
+        response = _StubResponse(AUDIO_BODY, headers=headers)
+        manager._session = _StubSession(response)
+        
+        result = manager.download_recording(RECORDING_URL, "rec-123")
+        
+        assert result == str(tmp_path / "rec-123.mp3")
+        assert mmap_calls == []
+        assert response.raw.decode_content is True
+        with open(result, "rb") as f:
+            assert f.read() == AUDIO_BODY
+    
+    @pytest.mark.parametrize("headers", [
+        pytest.param(None, id="content_length"),
+        pytest.param({}, id="chunked"),
+    ])
+    def test_download_writes_temp_file_until_complete(self, manager, tmp_path, headers):
+        """
+        正常系: 受信中は一時ファイルにだけ書き込み、完了後に保存先へ置き換える
+        """
+        final_path = tmp_path / "rec-123.mp3"
+        seen = []
+        
+        def on_read():
+            seen.append((final_path.exists(), sorted(p.suffix for p in tmp_path.iterdir())))
+        
+        manager._session = _StubSession(_StubResponse(AUDIO_BODY, headers=headers, on_read=on_read))
+        
+        result = manager.download_recording(RECORDING_URL, "rec-123")
+        
+        assert seen and all(entry == (False, [".part"]) for entry in seen)
+        assert result == str(final_path)
+        assert os.listdir(tmp_path) == ["rec-123.mp3"]
+    
+    def test_failed_download_keeps_previous_file(self, manager, tmp_path):
+        """
+        異常系: 再ダウンロードが失敗しても、保存済みのファイルは書き換えられない
+        """
+        final_path = tmp_path / "rec-123.mp3"
+        final_path.write_bytes(b"previous")
+        manager._session = _StubSession(_StubResponse(AUDIO_BODY, fail_after=1000))
+        
+        result = manager.download_recording(RECORDING_URL, "rec-123")
+        
+        assert result is None
+        assert final_path.read_bytes() == b"previous"
+        assert os.listdir(tmp_path) == ["rec-123.mp3"]
+    
+    def test_empty_url_returns_none_without_request(self, manager):
+        """
+        エッジケース: URLが空の場合はリクエストせずNoneを返す
+        """
+        manager._session = _StubSession()
+        
+        assert manager.download_recording("", "rec-123") is None
+        assert manager._session.requested_urls == []
+
+
+class TestDownloadRecordingSkip:
+    """保存済みの録音ファイルのダウンロード省略のテスト"""
+    
+    def test_existing_file_with_expected_size_is_not_downloaded(self, manager, tmp_path):
+        """
+        正常系: 保存済みファイルのサイズが expected_size と一致する場合はリクエストしない
+        """
+        final_path = tmp_path / "rec-123.mp3"
+        final_path.write_bytes(AUDIO_BODY)
+        manager._session = _StubSession()
+        
+        result = manager.download_recording(RECORDING_URL, "rec-123", expected_size=len(AUDIO_BODY))
+        
+        assert result == str(final_path)
+        assert manager._session.requested_urls == []
+    
+    @pytest.mark.parametrize("existing, expected_size", [
+        pytest.param(None, len(AUDIO_BODY), id="no_file"),
+        pytest.param(b"partial", len(AUDIO_BODY), id="size_mismatch"),
+        pytest.param(AUDIO_BODY, None, id="size_unknown"),
+    ])
+    def test_downloads_unless_existing_file_matches(self, manager, tmp_path, existing, expected_size):
+        """
+        正常系: ファイルがない・サイズが異なる・expected_size がない場合はダウンロードする
+        """
+        final_path = tmp_path / "rec-123.mp3"
+        if existing is not None:
+            final_path.write_bytes(existing)
+        manager._session = _StubSession(_StubResponse(AUDIO_BODY))
+        
+        result = manager.download_recording(RECORDING_URL, "rec-123", expected_size=expected_size)
+        
+        assert result == str(final_path)
+        assert manager._session.requested_urls == [RECORDING_URL]
+        assert final_path.read_bytes() == AUDIO_BODY
+    
+    def test_retry_after_failed_download_fetches_again(self, manager, tmp_path):
+        """
+        異常系: 失敗したダウンロードの再試行では、残骸を使わずに再取得する
+        """
+        manager._session = _StubSession(
+            _StubResponse(AUDIO_BODY[:1000], headers={"Content-Length": str(len(AUDIO_BODY))}),
+            _StubResponse(AUDIO_BODY)
+        )
+        
+        assert manager.download_recording(RECORDING_URL, "rec-123", expected_size=len(AUDIO_BODY)) is None
+        result = manager.download_recording(RECORDING_URL, "rec-123", expected_size=len(AUDIO_BODY))
+        
+        assert manager._session.requested_urls == [RECORDING_URL, RECORDING_URL]
+        with open(result, "rb") as f:
+            assert f.read() == AUDIO_BODY
+
+
+class TestSaveRecordingBackgroundDownload:
+    """RecordingManager.save_recording() のバックグラウンドダウンロードのテスト"""
+    
+    def test_future_resolves_to_path_and_records_it(self, manager, storage, tmp_path):
+        """
+        正常系: ダウンロードのFutureは保存先のパスを返し、ストレージにパスが記録される
+        """
+        manager._session = _StubSession(_StubResponse(AUDIO_BODY))
+        
+        future = manager.save_recording(_metadata(), file_size=len(AUDIO_BODY))
+        
+        assert future.result(timeout=10) == str(tmp_path / "rec-123.mp3")
+        assert storage.get_recording("call-rec-123").local_file_path == future.result()
+    
+    def test_future_resolves_to_none_on_download_error(self, manager, storage, tmp_path):
+        """
+        異常系: ダウンロードに失敗した場合、FutureはNoneを返しメタデータはパスなしで残る
+        """
+        manager._session = _StubSession(_StubResponse(AUDIO_BODY, fail_after=1000))
+        
+        future = manager.save_recording(_metadata())
+        
+        assert future.result(timeout=10) is None
+        assert storage.get_recording("call-rec-123").local_file_path is None
+        assert os.listdir(tmp_path) == []
+    
+    @pytest.mark.parametrize("kwargs, recording_url", [
+        pytest.param({"download_file": False}, RECORDING_URL, id="download_disabled"),
+        pytest.param({}, "", id="no_recording_url"),
+    ])
+    def test_returns_none_without_download(self, manager, storage, kwargs, recording_url):
+        """
+        正常系: ダウンロードしない場合はNoneを返し、メタデータだけを保存する
+        """
+        manager._session = _StubSession()
+        
+        result = manager.save_recording(_metadata(recording_url=recording_url), **kwargs)
+        
+        assert result is None
+        assert manager._session.requested_urls == []
+        assert storage.get_recording("call-rec-123") is not None
+
+
+class TestDownloadConcurrencyLimit:
+    """同時ダウンロード数の上限のテスト"""
+    
+    class _LimitedRecordingManager(RecordingManager):
+        MAX_CONCURRENT_DOWNLOADS = 2
+    
+    def test_concurrent_downloads_are_capped(self, storage, tmp_path):
+        """
+        正常系: 呼び出し元のスレッド数によらず、同時ダウンロード数は上限を超えない
+        """
+        manager = self._LimitedRecordingManager(storage, recordings_dir=str(tmp_path))
+        session = _GatedSession()
+        manager._session = session
+        
+        with manager, ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [
+                executor.submit(manager.download_recording, RECORDING_URL, f"rec-{i}")
+                for i in range(5)
+            ]
+            
+            # 上限まで埋まった後も、それ以上のリクエストが始まらないことを確認してから解放する
+            deadline = time.monotonic() + 5
+            while session.active < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.1)
+            assert session.active == 2
+            session.gate.set()
+            
+            results = [future.result(timeout=10) for future in futures]
+        
+        assert session.max_active == 2
+        assert sorted(results) == [str(tmp_path / f"rec-{i}.mp3") for i in range(5)]
+
+
+class TestDownloadRecordingFailures:
+    """ダウンロードが途中で失敗した場合のテスト"""
+    
+    @pytest.mark.parametrize("headers", [
+        pytest.param(None, id="content_length"),
+        pytest.param({}, id="chunked"),
+    ])
+    def test_connection_reset_returns_none_and_leaves_no_file(self, manager, tmp_path, headers):
+        """
+        異常系: 受信中に接続が切断された場合はNoneを返し、ファイルを残さない
+        """
+        manager._session = _StubSession(
+            _StubResponse(AUDIO_BODY, headers=headers, fail_after=len(AUDIO_BODY) // 3)
+        )
+        
+        result = manager.download_recording(RECORDING_URL, "rec-123")
+        
+        assert result is None
+        assert os.listdir(tmp_path) == []
+    
+    def test_truncated_body_returns_none_and_leaves_no_file(self, manager, tmp_path):
+        """
+        異常系: Content-Lengthより短い本文で終わった場合はNoneを返し、ファイルを残さない
+        """
+        manager._session = _StubSession(
+            _StubResponse(AUDIO_BODY[:1000], headers={"Content-Length": str(len(AUDIO_BODY))})
+        )
+        
+        result = manager.download_recording(RECORDING_URL, "rec-123")
+        
+        assert result is None
+        assert os.listdir(tmp_path) == []
+    
+    def test_bulk_save_keeps_metadata_when_a_download_fails(self, manager, storage):
+        """
+        異常系: 一括保存中にダウンロードが切断されても例外にならず、メタデータは保存される
+        """
+        manager._session = _StubSession(
+            _StubResponse(AUDIO_BODY, fail_after=1000)
+        )
+        
+        manager.save_recordings_bulk([_metadata("rec-1")])
+        
+        assert storage.get_recording("call-rec-1").local_file_path is None
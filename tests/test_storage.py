@@ -5,8 +5,12 @@ Requirements 4.1, 4.4, 4.5 の検証
 """
 
 import os
+import sqlite3
 import tempfile
-from datetime import datetime, timedelta
+import uuid
+from collections.abc import Iterator
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -14,6 +18,62 @@ from src.models import CallLog, Recording
 from src.storage import SQLiteStorage, StorageError
 
 
+# テストデータの基準日時（実行時刻に依存せず結果を再現できるよう固定）
+NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def shared_storage():
+    """モジュール内で共有するSQLiteStorageインスタンス（共有キャッシュのインメモリDB）"""
+    storage = SQLiteStorage(f"file:{uuid.uuid4().hex}?mode=memory&cache=shared", uri=True)
+    yield storage
+    storage.close()
+
+
+@pytest.fixture
+def storage(shared_storage):
+    """テスト用のSQLiteStorageインスタンス（共有インスタンスをテストごとに空にして使う）"""
+    shared_storage.reset()
+    return shared_storage
+
+
+@pytest.fixture(scope="module")
+def sample_recording():
+    """サンプル録音データ（イミュータブルなのでモジュール内で共有）"""
+    return Recording(
+        id="rec-123",
+        call_uuid="call-456",
+        conversation_uuid="conv-789",
+        caller_number="+81901234567",
+        called_number="+81312345678",
+        recording_url="https://api.nexmo.com/v1/files/abc123",
+        recording_uuid="recording-uuid-123",
+        duration=30,
+        file_size=50000,
+        format="mp3",
+        status="completed",
+        local_file_path=None,
+        created_at=NOW,
+        updated_at=NOW
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_call_log():
+    """サンプル通話ログデータ（イミュータブルなのでモジュール内で共有）"""
+    return CallLog(
+        id="log-123",
+        call_uuid="call-456",
+        caller_number="+81901234567",
+        called_number="+81312345678",
+        status="answered",
+        direction="inbound",
+        started_at=NOW,
+        ended_at=None,
+        created_at=NOW
+    )
+
+
 class TestSQLiteStorageInit:
     """SQLiteStorage 初期化のテスト"""
     
@@ -35,52 +95,93 @@ class TestSQLiteStorageInit:
             db_path = os.path.join(tmpdir, "test.db")
             storage = SQLiteStorage(db_path)
             
-            # テーブルが存在することを確認
-            import sqlite3
+            # recordings / call_logs テーブルが存在することを確認
             conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
+            names = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name IN (?, ?)",
+                    ("recordings", "call_logs")
+                )
+            }
+            conn.close()
+            
+            assert names == {"recordings", "call_logs"}
+    
+    def test_uri_memory_database_is_shared_between_connections(self):
+        """
+        正常系: uri=True の共有キャッシュのインメモリDBはプール内の別接続からも参照できる
+        """
+        storage = SQLiteStorage("file:test_uri_memory?mode=memory&cache=shared", uri=True)
+        try:
+            with storage._get_connection() as first, storage._get_connection() as second:
+                assert first is not second
+                first.execute(
+                    "INSERT INTO call_logs (id, call_uuid, caller_number, called_number,"
+                    " status, direction, started_at, created_at)"
+                    " VALUES ('id', 'uuid', 'a', 'b', 'answered', 'inbound', 0, 0)"
+                )
+                first.commit()
+                assert second.execute("SELECT COUNT(*) FROM call_logs").fetchone()[0] == 1
+        finally:
+            storage.close()
+    
+    def test_migrates_iso_timestamps_to_epoch_ms(self):
+        """
+        正常系: 旧スキーマのISO 8601文字列の日時がepochミリ秒に変換される
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "test.db")
+            created_at = datetime(2024, 1, 15, 10, 30, 0)
             
-            # recordings テーブルの確認
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='recordings'")
-            assert cursor.fetchone() is not None
+            conn = sqlite3.connect(db_path)
+            conn.execute("""
+                CREATE TABLE recordings (
+                    id VARCHAR(36) PRIMARY KEY,
+                    call_uuid VARCHAR(36) NOT NULL,
+                    conversation_uuid VARCHAR(36) NOT NULL,
+                    caller_number VARCHAR(20) NOT NULL,
+                    called_number VARCHAR(20) NOT NULL,
+                    recording_url TEXT NOT NULL,
+                    recording_uuid VARCHAR(36) NOT NULL,
+                    duration INTEGER NOT NULL,
+                    file_size INTEGER NOT NULL,
+                    format VARCHAR(10) NOT NULL,
+                    status VARCHAR(20) NOT NULL,
+                    created_at TIMESTAMP NOT NULL,
+                    updated_at TIMESTAMP NOT NULL
+                )
+            """)
+            conn.execute(
+                "INSERT INTO recordings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    "rec-legacy", "call-legacy", "conv-legacy", "+81901234567",
+                    "+81312345678", "https://example.com/rec", "rec-uuid", 60,
+                    1024, "mp3", "completed",
+                    created_at.isoformat(), created_at.isoformat()
+                )
+            )
+            conn.commit()
+            conn.close()
             
-            # call_logs テーブルの確認
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='call_logs'")
-            assert cursor.fetchone() is not None
+            storage = SQLiteStorage(db_path)
             
+            conn = sqlite3.connect(db_path)
+            stored = conn.execute(
+                "SELECT typeof(created_at) FROM recordings WHERE id = 'rec-legacy'"
+            ).fetchone()[0]
             conn.close()
+            assert stored == "integer"
+            
+            # タイムゾーン情報のない旧データはUTCとして扱われる
+            retrieved = storage.get_recording("call-legacy")
+            assert retrieved.created_at == created_at.replace(tzinfo=timezone.utc)
+            assert retrieved.updated_at == created_at.replace(tzinfo=timezone.utc)
+            assert retrieved.local_file_path is None
 
 
 class TestSQLiteStorageSaveRecording:
     """SQLiteStorage.save_recording() のテスト"""
     
-    @pytest.fixture
-    def storage(self):
-        """テスト用のSQLiteStorageインスタンス"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = os.path.join(tmpdir, "test.db")
-            yield SQLiteStorage(db_path)
-    
-    @pytest.fixture
-    def sample_recording(self):
-        """サンプル録音データ"""
-        now = datetime.now()
-        return Recording(
-            id="rec-123",
-            call_uuid="call-456",
-            conversation_uuid="conv-789",
-            caller_number="+81901234567",
-            called_number="+81312345678",
-            recording_url="https://api.nexmo.com/v1/files/abc123",
-            recording_uuid="recording-uuid-123",
-            duration=30,
-            file_size=50000,
-            format="mp3",
-            status="completed",
-            created_at=now,
-            updated_at=now
-        )
-    
     def test_save_recording_success(self, storage, sample_recording):
         """
         正常系: 録音メタデータが正常に保存される
@@ -101,21 +202,7 @@ class TestSQLiteStorageSaveRecording:
         storage.save_recording(sample_recording)
         
         # 更新
-        updated_recording = Recording(
-            id=sample_recording.id,
-            call_uuid=sample_recording.call_uuid,
-            conversation_uuid=sample_recording.conversation_uuid,
-            caller_number=sample_recording.caller_number,
-            called_number=sample_recording.called_number,
-            recording_url=sample_recording.recording_url,
-            recording_uuid=sample_recording.recording_uuid,
-            duration=60,  # 変更
-            file_size=100000,  # 変更
-            format=sample_recording.format,
-            status="completed",
-            created_at=sample_recording.created_at,
-            updated_at=datetime.now()
-        )
+        updated_recording = replace(sample_recording, duration=60, file_size=100000)
         storage.save_recording(updated_recording)
         
         # 更新されたことを確認
@@ -127,33 +214,6 @@ class TestSQLiteStorageSaveRecording:
 class TestSQLiteStorageGetRecording:
     """SQLiteStorage.get_recording() のテスト"""
     
-    @pytest.fixture
-    def storage(self):
-        """テスト用のSQLiteStorageインスタンス"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = os.path.join(tmpdir, "test.db")
-            yield SQLiteStorage(db_path)
-    
-    @pytest.fixture
-    def sample_recording(self):
-        """サンプル録音データ"""
-        now = datetime.now()
-        return Recording(
-            id="rec-123",
-            call_uuid="call-456",
-            conversation_uuid="conv-789",
-            caller_number="+81901234567",
-            called_number="+81312345678",
-            recording_url="https://api.nexmo.com/v1/files/abc123",
-            recording_uuid="recording-uuid-123",
-            duration=30,
-            file_size=50000,
-            format="mp3",
-            status="completed",
-            created_at=now,
-            updated_at=now
-        )
-    
     def test_get_recording_found(self, storage, sample_recording):
         """
         正常系: 存在する録音が取得できる
@@ -163,18 +223,9 @@ class TestSQLiteStorageGetRecording:
         
         retrieved = storage.get_recording(sample_recording.call_uuid)
         
-        assert retrieved is not None
-        assert retrieved.id == sample_recording.id
-        assert retrieved.call_uuid == sample_recording.call_uuid
-        assert retrieved.conversation_uuid == sample_recording.conversation_uuid
-        assert retrieved.caller_number == sample_recording.caller_number
-        assert retrieved.called_number == sample_recording.called_number
-        assert retrieved.recording_url == sample_recording.recording_url
-        assert retrieved.recording_uuid == sample_recording.recording_uuid
-        assert retrieved.duration == sample_recording.duration
-        assert retrieved.file_size == sample_recording.file_size
-        assert retrieved.format == sample_recording.format
-        assert retrieved.status == sample_recording.status
+        # 日時はepochミリ秒で保存されUTCとして復元される。NOW はミリ秒未満を持たない
+        # UTC日時のため、生成された __eq__ でdataclass全体をそのまま比較できる
+        assert retrieved == sample_recording
     
     def test_get_recording_not_found(self, storage):
         """
@@ -189,13 +240,6 @@ class TestSQLiteStorageGetRecording:
 class TestSQLiteStorageListRecordings:
     """SQLiteStorage.list_recordings() のテスト"""
     
-    @pytest.fixture
-    def storage(self):
-        """テスト用のSQLiteStorageインスタンス"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = os.path.join(tmpdir, "test.db")
-            yield SQLiteStorage(db_path)
-    
     def _create_recording(self, id: str, call_uuid: str, created_at: datetime) -> Recording:
         """テスト用録音データを作成"""
         return Recording(
@@ -210,6 +254,7 @@ class TestSQLiteStorageListRecordings:
             file_size=50000,
             format="mp3",
             status="completed",
+            local_file_path=None,
             created_at=created_at,
             updated_at=created_at
         )
@@ -223,119 +268,285 @@ class TestSQLiteStorageListRecordings:
         
         assert recordings == []
     
-    def test_list_recordings_all(self, storage):
+    @pytest.fixture(scope="class")
+    def seeded_storage(self):
+        """NOW の5日前・3日前・1日前・NOW の録音を1回だけ保存したストレージ"""
+        storage = SQLiteStorage(f"file:{uuid.uuid4().hex}?mode=memory&cache=shared", uri=True)
+        storage.save_recordings([
+            self._create_recording("rec-1", "call-1", NOW - timedelta(days=5)),
+            self._create_recording("rec-2", "call-2", NOW - timedelta(days=3)),
+            self._create_recording("rec-3", "call-3", NOW - timedelta(days=1)),
+            self._create_recording("rec-4", "call-4", NOW),
+        ])
+        yield storage
+        storage.close()
+    
+    @pytest.mark.parametrize("start_date, end_date, expected_ids", [
+        pytest.param(None, None, ["rec-4", "rec-3", "rec-2", "rec-1"], id="all"),
+        pytest.param(NOW - timedelta(days=2), None, ["rec-4", "rec-3"], id="start_date"),
+        pytest.param(None, NOW - timedelta(days=2), ["rec-2", "rec-1"], id="end_date"),
+        pytest.param(NOW - timedelta(days=4), NOW - timedelta(hours=12), ["rec-3", "rec-2"], id="date_range"),
+    ])
+    def test_list_recordings_filters_by_date(self, seeded_storage, start_date, end_date, expected_ids):
         """
-        正常系: フィルタなしで全ての録音が返される
+        正常系: 日付フィルタに一致する録音が新しい順に返される
         Requirements: 4.5
         """
-        now = datetime.now()
-        rec1 = self._create_recording("rec-1", "call-1", now - timedelta(days=2))
-        rec2 = self._create_recording("rec-2", "call-2", now - timedelta(days=1))
-        rec3 = self._create_recording("rec-3", "call-3", now)
-        
-        storage.save_recording(rec1)
-        storage.save_recording(rec2)
-        storage.save_recording(rec3)
-        
-        recordings = storage.list_recordings()
+        recordings = seeded_storage.list_recordings(start_date=start_date, end_date=end_date)
         
-        assert len(recordings) == 3
-        # 新しい順にソートされている
-        assert recordings[0].id == "rec-3"
-        assert recordings[1].id == "rec-2"
-        assert recordings[2].id == "rec-1"
+        assert [r.id for r in recordings] == expected_ids
+
+
+class TestSQLiteStorageIterRecordings:
+    """SQLiteStorage.iter_recordings() / count_recordings() のテスト"""
     
-    def test_list_recordings_with_start_date(self, storage):
+    @pytest.fixture
+    def storage(self, storage):
+        """テスト用のSQLiteStorageインスタンス（5件の録音を保存済み）"""
+        for i in range(5):
+            created_at = NOW - timedelta(days=i)
+            storage.save_recording(Recording(
+                id=f"rec-{i}",
+                call_uuid=f"call-{i}",
+                conversation_uuid=f"conv-{i}",
+                caller_number="+81901234567",
+                called_number="+81312345678",
+                recording_url=f"https://api.nexmo.com/v1/files/{i}",
+                recording_uuid=f"rec-uuid-{i}",
+                duration=30,
+                file_size=50000,
+                format="mp3",
+                status="completed",
+                local_file_path=None,
+                created_at=created_at,
+                updated_at=created_at
+            ))
+        yield storage
+    
+    def test_iter_recordings_yields_newest_first(self, storage):
         """
-        正常系: start_dateフィルタで指定日時以降の録音が返される
-        Requirements: 4.5
+        正常系: list_recordingsと同じ順序で録音が生成される
         """
-        now = datetime.now()
-        rec1 = self._create_recording("rec-1", "call-1", now - timedelta(days=3))
-        rec2 = self._create_recording("rec-2", "call-2", now - timedelta(days=1))
-        rec3 = self._create_recording("rec-3", "call-3", now)
+        ids = [r.id for r in storage.iter_recordings()]
         
-        storage.save_recording(rec1)
-        storage.save_recording(rec2)
-        storage.save_recording(rec3)
+        assert ids == ["rec-0", "rec-1", "rec-2", "rec-3", "rec-4"]
+    
+    def test_iter_recordings_with_limit_and_offset(self, storage):
+        """
+        正常系: limitとoffsetがSQL側で適用される
+        """
+        ids = [r.id for r in storage.iter_recordings(limit=2, offset=1)]
         
-        recordings = storage.list_recordings(start_date=now - timedelta(days=2))
+        assert ids == ["rec-1", "rec-2"]
+    
+    def test_iter_recordings_with_offset_only(self, storage):
+        """
+        正常系: offsetのみ指定した場合は残り全件が返される
+        """
+        ids = [r.id for r in storage.iter_recordings(offset=3)]
         
-        assert len(recordings) == 2
-        assert recordings[0].id == "rec-3"
-        assert recordings[1].id == "rec-2"
+        assert ids == ["rec-3", "rec-4"]
     
-    def test_list_recordings_with_end_date(self, storage):
+    def test_list_recordings_keyset_pagination(self, storage):
         """
-        正常系: end_dateフィルタで指定日時以前の録音が返される
-        Requirements: 4.5
+        正常系: 前ページ最後の録音を起点に次のページが取得される
         """
-        now = datetime.now()
-        rec1 = self._create_recording("rec-1", "call-1", now - timedelta(days=3))
-        rec2 = self._create_recording("rec-2", "call-2", now - timedelta(days=1))
-        rec3 = self._create_recording("rec-3", "call-3", now)
+        first_page = storage.list_recordings(limit=2)
+        last = first_page[-1]
+        second_page = storage.list_recordings(limit=2, before=(last.created_at, last.id))
         
-        storage.save_recording(rec1)
-        storage.save_recording(rec2)
-        storage.save_recording(rec3)
+        assert [r.id for r in first_page] == ["rec-0", "rec-1"]
+        assert [r.id for r in second_page] == ["rec-2", "rec-3"]
+    
+    def test_keyset_pagination_splits_same_timestamp_by_id(self, storage):
+        """
+        境界値: 作成日時が同じ録音もページ間で重複・欠落しない
+        """
+        tied = storage.get_recording("call-1")
+        for suffix in ("a", "b"):
+            storage.save_recording(Recording(
+                id=f"rec-1{suffix}",
+                call_uuid=f"call-1{suffix}",
+                conversation_uuid=tied.conversation_uuid,
+                caller_number=tied.caller_number,
+                called_number=tied.called_number,
+                recording_url=tied.recording_url,
+                recording_uuid=tied.recording_uuid,
+                duration=tied.duration,
+                file_size=tied.file_size,
+                format=tied.format,
+                status=tied.status,
+                local_file_path=None,
+                created_at=tied.created_at,
+                updated_at=tied.updated_at
+            ))
         
-        recordings = storage.list_recordings(end_date=now - timedelta(days=2))
+        ids = []
+        before = None
+        while True:
+            page = storage.list_recordings(limit=2, before=before)
+            if not page:
+                break
+            ids.extend(r.id for r in page)
+            before = (page[-1].created_at, page[-1].id)
         
-        assert len(recordings) == 1
-        assert recordings[0].id == "rec-1"
+        assert ids == ["rec-0", "rec-1b", "rec-1a", "rec-1", "rec-2", "rec-3", "rec-4"]
     
-    def test_list_recordings_with_date_range(self, storage):
+    def test_iter_recordings_is_lazy(self, storage):
         """
-        正常系: start_dateとend_dateの両方で日付範囲フィルタが適用される
-        Requirements: 4.5
+        正常系: 全件をリストに展開せずイテレータとして返される
         """
-        now = datetime.now()
-        rec1 = self._create_recording("rec-1", "call-1", now - timedelta(days=5))
-        rec2 = self._create_recording("rec-2", "call-2", now - timedelta(days=3))
-        rec3 = self._create_recording("rec-3", "call-3", now - timedelta(days=1))
-        rec4 = self._create_recording("rec-4", "call-4", now)
+        recordings = storage.iter_recordings()
         
-        storage.save_recording(rec1)
-        storage.save_recording(rec2)
-        storage.save_recording(rec3)
-        storage.save_recording(rec4)
+        assert isinstance(recordings, Iterator)
+        assert next(recordings).id == "rec-0"
         
-        recordings = storage.list_recordings(
-            start_date=now - timedelta(days=4),
-            end_date=now - timedelta(hours=12)
-        )
+        # 途中で打ち切っても接続が解放され、以降の操作が行える
+        recordings.close()
+        assert storage.count_recordings() == 5
+    
+    def test_iter_recording_summaries_matches_recordings(self, storage):
+        """
+        正常系: 概要のタプルがiter_recordingsと同じ順序・内容で返される
+        """
+        expected = [
+            (r.id, r.call_uuid, r.caller_number, r.recording_url, r.duration,
+             r.created_at, r.status)
+            for r in storage.iter_recordings(limit=3, offset=1)
+        ]
         
-        assert len(recordings) == 2
-        assert recordings[0].id == "rec-3"
-        assert recordings[1].id == "rec-2"
+        assert list(storage.iter_recording_summaries(limit=3, offset=1)) == expected
+    
+    def test_count_recordings(self, storage):
+        """
+        正常系: 日付範囲フィルタ付きで件数が返される
+        """
+        assert storage.count_recordings() == 5
+        assert storage.count_recordings(start_date=NOW - timedelta(days=2, hours=1)) == 3
+        assert storage.count_recordings(end_date=NOW - timedelta(days=10)) == 0
 
 
-class TestSQLiteStorageSaveCallLog:
-    """SQLiteStorage.save_call_log() のテスト"""
+class TestSQLiteStorageUpdateRecordingLocalFilePath:
+    """SQLiteStorage.update_recording_local_file_path() のテスト"""
     
     @pytest.fixture
-    def storage(self):
-        """テスト用のSQLiteStorageインスタンス"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = os.path.join(tmpdir, "test.db")
-            yield SQLiteStorage(db_path)
+    def storage(self, storage):
+        """テスト用のSQLiteStorageインスタンス（ファイルパス未設定の録音を保存済み）"""
+        storage.save_recording(Recording(
+            id="rec-1",
+            call_uuid="call-1",
+            conversation_uuid="conv-1",
+            caller_number="+81901234567",
+            called_number="+81312345678",
+            recording_url="https://api.nexmo.com/v1/files/1",
+            recording_uuid="rec-uuid-1",
+            duration=30,
+            file_size=50000,
+            format="mp3",
+            status="completed",
+            local_file_path=None,
+            created_at=NOW,
+            updated_at=NOW
+        ))
+        yield storage
     
-    @pytest.fixture
-    def sample_call_log(self):
-        """サンプル通話ログデータ"""
-        now = datetime.now()
+    def test_updates_local_file_path(self, storage):
+        """
+        正常系: ダウンロード後のファイルパスが保存される
+        """
+        result = storage.update_recording_local_file_path("rec-1", "recordings/rec-1.mp3")
+        
+        assert result is True
+        assert storage.get_recording("call-1").local_file_path == "recordings/rec-1.mp3"
+    
+    def test_returns_false_for_unknown_recording(self, storage):
+        """
+        異常系: 存在しない録音IDの場合はFalseが返される
+        """
+        result = storage.update_recording_local_file_path("unknown", "recordings/unknown.mp3")
+        
+        assert result is False
+
+
+class TestSQLiteStorageBatchWrites:
+    """SQLiteStorage.save_recordings() / batch() のテスト"""
+    
+    def _create_call_log(self, call_uuid: str) -> CallLog:
+        """テスト用通話ログを作成"""
         return CallLog(
-            id="log-123",
-            call_uuid="call-456",
+            id=f"log-{call_uuid}",
+            call_uuid=call_uuid,
             caller_number="+81901234567",
             called_number="+81312345678",
             status="answered",
             direction="inbound",
-            started_at=now,
+            started_at=NOW,
             ended_at=None,
-            created_at=now
+            created_at=NOW
         )
     
+    def test_save_recordings_saves_all(self, storage):
+        """
+        正常系: 複数の録音が一括で保存される
+        """
+        recordings = [
+            Recording(
+                id=f"rec-{i}",
+                call_uuid=f"call-{i}",
+                conversation_uuid=f"conv-{i}",
+                caller_number="+81901234567",
+                called_number="+81312345678",
+                recording_url=f"https://api.nexmo.com/v1/files/{i}",
+                recording_uuid=f"rec-uuid-{i}",
+                duration=30,
+                file_size=50000,
+                format="mp3",
+                status="completed",
+                local_file_path=None,
+                created_at=NOW,
+                updated_at=NOW
+            )
+            for i in range(3)
+        ]
+        
+        storage.save_recordings(recordings)
+        
+        assert storage.count_recordings() == 3
+        assert storage.get_recording("call-1").id == "rec-1"
+    
+    def test_save_recordings_empty_list(self, storage):
+        """
+        エッジケース: 空のリストでもエラーにならない
+        """
+        storage.save_recordings([])
+        
+        assert storage.count_recordings() == 0
+    
+    def test_batch_commits_on_exit(self, storage):
+        """
+        正常系: バッチ内の書き込みは終了時にまとめてコミットされる
+        """
+        with storage.batch():
+            storage.save_call_log(self._create_call_log("call-1"))
+            storage.update_call_log_status("call-1", "completed")
+        
+        assert storage.get_call_log("call-1").status == "completed"
+    
+    def test_batch_rolls_back_on_error(self, storage):
+        """
+        異常系: バッチ内で例外が発生した場合はロールバックされる
+        """
+        with pytest.raises(RuntimeError):
+            with storage.batch():
+                storage.save_call_log(self._create_call_log("call-1"))
+                raise RuntimeError("abort")
+        
+        assert storage.get_call_log("call-1") is None
+
+
+class TestSQLiteStorageSaveCallLog:
+    """SQLiteStorage.save_call_log() のテスト"""
+    
     def test_save_call_log_success(self, storage, sample_call_log):
         """
         正常系: 通話ログが正常に保存される
@@ -352,13 +563,31 @@ class TestSQLiteStorageSaveCallLog:
         """
         正常系: ended_atが設定された通話ログが保存される
         """
-        sample_call_log.ended_at = datetime.now()
-        storage.save_call_log(sample_call_log)
+        call_log = replace(sample_call_log, ended_at=NOW)
+        storage.save_call_log(call_log)
         
-        retrieved = storage.get_call_log(sample_call_log.call_uuid)
+        retrieved = storage.get_call_log(call_log.call_uuid)
         assert retrieved is not None
         assert retrieved.ended_at is not None
     
+    def test_save_call_log_round_trips_same_instant(self, storage, sample_call_log):
+        """
+        正常系: タイムゾーン付きの日時は同じ時点のUTCとして、
+        タイムゾーン情報のない日時はUTCとして復元される
+        """
+        jst = timezone(timedelta(hours=9))
+        call_log = replace(
+            sample_call_log,
+            started_at=datetime(2024, 3, 10, 9, 0, 0),
+            ended_at=datetime(2024, 3, 10, 18, 5, 0, tzinfo=jst)
+        )
+        storage.save_call_log(call_log)
+        
+        retrieved = storage.get_call_log(call_log.call_uuid)
+        assert retrieved.started_at == datetime(2024, 3, 10, 9, 0, 0, tzinfo=timezone.utc)
+        assert retrieved.ended_at == call_log.ended_at
+        assert retrieved.ended_at.tzinfo is timezone.utc
+    
     def test_save_call_log_updates_existing(self, storage, sample_call_log):
         """
         正常系: 同じIDの通話ログが存在する場合、更新される
@@ -366,17 +595,7 @@ class TestSQLiteStorageSaveCallLog:
         storage.save_call_log(sample_call_log)
         
         # 更新
-        updated_call_log = CallLog(
-            id=sample_call_log.id,
-            call_uuid=sample_call_log.call_uuid,
-            caller_number=sample_call_log.caller_number,
-            called_number=sample_call_log.called_number,
-            status="completed",  # 変更
-            direction=sample_call_log.direction,
-            started_at=sample_call_log.started_at,
-            ended_at=datetime.now(),  # 変更
-            created_at=sample_call_log.created_at
-        )
+        updated_call_log = replace(sample_call_log, status="completed", ended_at=NOW)
         storage.save_call_log(updated_call_log)
         
         # 更新されたことを確認
@@ -388,13 +607,6 @@ class TestSQLiteStorageSaveCallLog:
 class TestSQLiteStorageGetCallLog:
     """SQLiteStorage.get_call_log() のテスト"""
     
-    @pytest.fixture
-    def storage(self):
-        """テスト用のSQLiteStorageインスタンス"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = os.path.join(tmpdir, "test.db")
-            yield SQLiteStorage(db_path)
-    
     def test_get_call_log_not_found(self, storage):
         """
         エッジケース: 存在しない通話ログの場合、Noneが返される
@@ -402,3 +614,95 @@ class TestSQLiteStorageGetCallLog:
         retrieved = storage.get_call_log("non-existent-uuid")
         
         assert retrieved is None
+
+
+class TestSQLiteStorageLookupCache:
+    """SQLiteStorage の取得結果キャッシュのテスト"""
+    
+    @pytest.fixture
+    def db_path(self):
+        """テスト用のデータベースファイルパス"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield os.path.join(tmpdir, "test.db")
+    
+    def _create_call_log(self, status: str = "started") -> CallLog:
+        return CallLog(
+            id="log-1",
+            call_uuid="call-1",
+            caller_number="+81901234567",
+            called_number="+81312345678",
+            status=status,
+            direction="inbound",
+            started_at=NOW,
+            ended_at=None,
+            created_at=NOW
+        )
+    
+    def test_repeated_lookup_is_served_from_cache(self, db_path):
+        """
+        正常系: 同じ通話UUIDの2回目以降の取得はキャッシュから返される
+        """
+        storage = SQLiteStorage(db_path)
+        storage.save_call_log(self._create_call_log())
+        
+        assert storage.get_call_log("call-1") is storage.get_call_log("call-1")
+    
+    def test_update_invalidates_cache(self, db_path):
+        """
+        正常系: ステータス更新後は更新後の値が返される
+        """
+        storage = SQLiteStorage(db_path)
+        storage.save_call_log(self._create_call_log())
+        storage.get_call_log("call-1")
+        
+        storage.update_call_log_status("call-1", "completed", ended_at=NOW)
+        
+        retrieved = storage.get_call_log("call-1")
+        assert retrieved.status == "completed"
+        assert retrieved.ended_at is not None
+    
+    def test_update_refreshes_cache_with_returned_row(self, db_path):
+        """
+        正常系: ステータス更新後の取得は更新で返された行のキャッシュから返される
+        """
+        storage = SQLiteStorage(db_path)
+        storage.save_call_log(self._create_call_log())
+        
+        storage.update_call_log_status("call-1", "completed")
+        
+        retrieved = storage.get_call_log("call-1")
+        assert retrieved.status == "completed"
+        assert storage.get_call_log("call-1") is retrieved
+    
+    def test_save_invalidates_cache(self, db_path):
+        """
+        正常系: 上書き保存後は保存後の値が返される
+        """
+        storage = SQLiteStorage(db_path)
+        storage.save_call_log(self._create_call_log())
+        storage.get_call_log("call-1")
+        
+        storage.save_call_log(self._create_call_log(status="answered"))
+        
+        assert storage.get_call_log("call-1").status == "answered"
+    
+    def test_reset_removes_rows_and_cached_values(self, db_path):
+        """
+        正常系: reset 後はキャッシュ済みの通話ログも含めて取得できない
+        """
+        storage = SQLiteStorage(db_path)
+        storage.save_call_log(self._create_call_log())
+        storage.get_call_log("call-1")
+        
+        storage.reset()
+        
+        assert storage.get_call_log("call-1") is None
+    
+    def test_cache_can_be_disabled(self, db_path):
+        """
+        正常系: cache_size=0 の場合は毎回データベースから取得される
+        """
+        storage = SQLiteStorage(db_path, cache_size=0)
+        storage.save_call_log(self._create_call_log())
+        
+        assert storage.get_call_log("call-1") is not storage.get_call_log("call-1")
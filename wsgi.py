@@ -0,0 +1,17 @@
+"""
+Vonage Voice Recorder WSGI エントリーポイント
+
+本番環境で Flask 開発サーバーの代わりに WSGI サーバーから読み込むモジュールです。
+設定は環境変数から読み込みます（main.py と同じ）。
+
+録音メタデータのキャッシュと Udio 完了通知の待機はプロセス内で共有されるため、
+ワーカープロセスは 1 つにし、スレッド数で同時リクエスト数を調整してください。
+
+Usage:
+    gunicorn --workers 1 --threads 8 --bind 0.0.0.0:5000 wsgi:app
+"""
+
+from src.app import create_app
+
+
+app = create_app()